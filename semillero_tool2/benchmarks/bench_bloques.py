@@ -0,0 +1,139 @@
+"""
+Benchmark del modo por bloques (run_por_bloques) vs el pipeline en memoria
+(run con lector streaming), de punta a punta: lectura, etapas y escritura.
+
+Genera un libro sintético tipo intake (ID, PROGRAMA, FECHA, F..U con basura,
+columnas extra de texto). Cada modo corre en un subproceso limpio; se reporta
+tiempo y pico de RSS sobre el RSS previo a correr (Linux: pico reseteado vía
+/proc/self/clear_refs, tras calentar imports con un libro mínimo) y se
+verifica que los dos outputs tengan las mismas hojas y contenido.
+
+Uso:
+    python benchmarks/bench_bloques.py --rows 100000 --filas-por-bloque 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+
+
+def escribir_libro(path: Path, rows: int, extra_cols: int, seed: int = 0) -> None:
+    from openpyxl import Workbook
+
+    rnd = random.Random(seed)
+    programas = ["Ing. Sistemas", "psicologia ", "Derecho", "adm empresas", "xyz", None]
+    textos = [" texto ", "otro valor", None, "OBSERVACION larga ", "NA"]
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Hoja1"
+    ws.append(["ID", "Programa", "Fecha"] + list(FU_COLS) + [f"Extra {i}" for i in range(extra_cols)])
+    for r in range(rows):
+        fila = [float(rnd.randrange(10**9, 10**10)), rnd.choice(programas), f"2026-01-{r % 28 + 1:02d}"]
+        fila += [rnd.choice((None, "x")) if rnd.random() < 0.03 else rnd.randrange(100) for _ in FU_COLS]
+        fila += [rnd.choice(textos) for _ in range(extra_cols)]
+        ws.append(fila)
+    wb.save(path)
+
+
+def _status_kb(campo: str) -> int:
+    with open("/proc/self/status", encoding="ascii") as f:
+        for linea in f:
+            if linea.startswith(campo + ":"):
+                return int(linea.split()[1])
+    raise RuntimeError(f"{campo} no disponible")
+
+
+def _reset_pico() -> None:
+    with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+        f.write("5")
+
+
+def _hijo(modo: str, libro: Path, salida: Path, filas_por_bloque: int) -> None:
+    from semillero_tool.pipeline import RunConfig, run, run_por_bloques
+
+    cfg = RunConfig(
+        input_path=libro,
+        output_path=salida,
+        sheet=None,
+        strict_schema=True,
+        fu_validate=True,
+        fu_drop_mode="threshold",
+        min_non_missing_fu=15,
+        canonizar_programa=True,
+        reemplazar_programa=False,
+        drop_missing_mode="all",
+        critical_cols_csv=None,
+        usar_cache=False,  # sin checkpoints: mismas condiciones en los dos modos
+        lector_excel="streaming",
+    )
+    if modo == "bloques":
+        cfg = replace(cfg, filas_por_bloque=filas_por_bloque)
+        fn = run_por_bloques
+    else:
+        fn = run
+
+    # Calentamiento: imports perezosos (pyarrow, parsers, openpyxl writer).
+    fn(replace(cfg, input_path=libro.with_name("mini.xlsx"), output_path=salida.with_name(f"mini_{modo}.xlsx")))
+    _reset_pico()
+    antes = _status_kb("VmRSS")
+    t0 = time.perf_counter()
+    fn(cfg)
+    dt = time.perf_counter() - t0
+    pico = _status_kb("VmHWM")
+    print(json.dumps({"segundos": dt, "pico_mb": (pico - antes) / 1024}))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--extra-cols", type=int, default=20)
+    ap.add_argument("--filas-por-bloque", type=int, default=20_000)
+    ap.add_argument("--_hijo", nargs=3, default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args._hijo:
+        modo, libro, salida = args._hijo
+        _hijo(modo, Path(libro), Path(salida), args.filas_por_bloque)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        libro = tmp / "sintetico.xlsx"
+        escribir_libro(libro, args.rows, args.extra_cols)
+        escribir_libro(tmp / "mini.xlsx", 5, args.extra_cols)
+        print(f"libro: {args.rows} filas x {3 + len(FU_COLS) + args.extra_cols} columnas | "
+              f"{libro.stat().st_size / 2**20:.1f} MB en disco | bloques de {args.filas_por_bloque}")
+
+        # Caché de PROGRAMA aislada (no ensuciar la del usuario)
+        env = {**os.environ, "SEMILLERO_CACHE_DIR": str(tmp / "cache")}
+        for modo in ("memoria", "bloques"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--filas-por-bloque", str(args.filas_por_bloque),
+                 "--_hijo", modo, str(libro), str(tmp / f"{modo}.xlsx")],
+                check=True, capture_output=True, text=True, env=env,
+            )
+            r = json.loads(out.stdout)
+            print(f"{modo:8s}: {r['segundos']:7.2f} s | pico RSS +{r['pico_mb']:8.1f} MB")
+
+        a = pd.read_excel(tmp / "memoria.xlsx", sheet_name=None)
+        b = pd.read_excel(tmp / "bloques.xlsx", sheet_name=None)
+        assert list(a) == list(b)
+        for hoja in a:
+            pd.testing.assert_frame_equal(a[hoja], b[hoja])
+        print("Outputs idénticos")
+
+
+if __name__ == "__main__":
+    main()
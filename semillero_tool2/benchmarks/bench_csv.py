@@ -0,0 +1,96 @@
+"""
+Benchmark de lectura CSV (io_csv.LectorCsv) vs la carga genérica
+pd.read_csv(dtype=object) + cast_fu_numeric. Dos archivos sintéticos: uno con
+F..U limpias (camino float64 directo) y otro con ruido en F..U (cae a texto
+y lo convierte cast_fu_numeric). Reporta tiempo y memoria del DataFrame, y
+verifica que todas las variantes den los mismos valores.
+
+Uso:
+    python benchmarks/bench_csv.py --rows 500000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+import sintetico  # noqa: E402
+
+from semillero_tool.columns import normalizar_columnas_suffix  # noqa: E402
+from semillero_tool.config import FU_COLS  # noqa: E402
+from semillero_tool.fu import cast_fu_numeric  # noqa: E402
+from semillero_tool.io_csv import LectorCsv  # noqa: E402
+
+
+def escribir_csv(path: Path, rows: int, ruido: float) -> None:
+    cols = sintetico.columnas_intake(rows, columnas_extra=10, pct_ruido_fu=ruido)
+    pd.DataFrame({h: v for h, v in cols}).to_csv(path, index=False)
+
+
+def leer_original(path: Path) -> pd.DataFrame:
+    return pd.read_csv(path, dtype=object)
+
+
+def leer_lector(path: Path) -> pd.DataFrame:
+    with LectorCsv(path) as lector:
+        return lector.leer()
+
+
+def leer_bloques(path: Path) -> pd.DataFrame:
+    with LectorCsv(path, filas_por_bloque=50_000) as lector:
+        return pd.concat(list(lector.leer_bloques()))
+
+
+def _con_fu(df: pd.DataFrame) -> pd.DataFrame:
+    df, _ = normalizar_columnas_suffix(df, copiar=False)
+    df, _ = cast_fu_numeric(df, copiar=False)
+    return df
+
+
+def _texto(s: pd.Series) -> list:
+    s = s.astype(object)
+    return s.where(s.isna(), s.astype(str).str.strip()).where(s.notna(), None).tolist()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=500_000)
+    args = ap.parse_args()
+
+    variantes = {"original": leer_original, "lector": leer_lector, "bloques": leer_bloques}
+    with tempfile.TemporaryDirectory() as tmp:
+        for nombre, ruido in (("limpio", 0.0), ("sucio", 0.03)):
+            path = Path(tmp) / f"{nombre}.csv"
+            escribir_csv(path, args.rows, ruido)
+            print(f"{nombre}.csv: {args.rows} filas | {path.stat().st_size / 2**20:.1f} MB")
+            frames = {}
+            for variante, fn in variantes.items():
+                t0 = time.perf_counter()
+                df = _con_fu(fn(path))
+                dt = time.perf_counter() - t0
+                mb = df.memory_usage(deep=True).sum() / 2**20
+                print(f"  {variante:9s}: {dt:6.2f} s | {mb:8.1f} MB en memoria")
+                frames[variante] = df
+
+            ref = frames["original"]
+            for variante in ("lector", "bloques"):
+                df = frames[variante].reset_index(drop=True)
+                assert list(df.columns) == list(ref.columns)
+                for c in ref.columns:
+                    if c in FU_COLS:
+                        pd.testing.assert_series_equal(df[c], ref[c], check_names=False)
+                    else:
+                        # Texto comparado sin espacios de los bordes: read_csv(dtype=object)
+                        # a veces pierde el espacio inicial en el borde de su buffer
+                        # interno; la etapa base los quita igual.
+                        assert _texto(df[c]) == _texto(ref[c]), c
+            print("  mismos valores")
+
+
+if __name__ == "__main__":
+    main()
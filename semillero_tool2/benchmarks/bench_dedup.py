@@ -0,0 +1,83 @@
+"""
+Benchmark de deduplicación entre cohortes: chequear un archivo nuevo contra
+N cohortes previas releyendo sus outputs (columna ID de cada DATA.csv) vs
+con el índice persistente (dedup.IndiceIds: un segmento .ids.npy por
+cohorte, búsqueda binaria sobre mmap). Verifica que ambos encuentren los
+mismos IDs repetidos.
+
+Uso:
+    python benchmarks/bench_dedup.py --cohortes 20 --rows 50000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from semillero_tool.dedup import DeduplicadorIds, IndiceIds, claves_id
+
+
+def cohorte(rng: np.random.Generator, rows: int, poblacion: int) -> pd.DataFrame:
+    ids = rng.integers(10**6, 10**6 + poblacion, rows).astype(str)
+    dias = rng.integers(0, 365, rows)
+    fechas = (np.datetime64("2025-01-01") + dias.astype("timedelta64[D]")).astype(str)
+    return pd.DataFrame({"ID": pd.Series(ids, dtype="str"), "FECHA": fechas, "OBSERVACIONES": "texto libre " * 5})
+
+
+def releyendo(outputs: list[Path], nuevo: pd.DataFrame) -> np.ndarray:
+    """Camino sin índice: todos los IDs de los outputs previos, después isin."""
+    previos = pd.concat([pd.read_csv(p, usecols=["ID"], dtype=str)["ID"] for p in outputs], ignore_index=True)
+    return claves_id(nuevo["ID"]).isin(set(claves_id(previos).dropna())).to_numpy()
+
+
+def con_indice(indice: IndiceIds, nuevo: pd.DataFrame) -> np.ndarray:
+    claves = claves_id(nuevo["ID"])
+    hashes = pd.util.hash_array(claves.to_numpy(dtype=object))
+    encontrado, _, _ = indice.buscar(hashes, "primero", excluir="nuevo")
+    return encontrado
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cohortes", type=int, default=20)
+    ap.add_argument("--rows", type=int, default=50_000)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    poblacion = args.cohortes * args.rows
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        indice = IndiceIds(tmp / "indice")
+        outputs = []
+        t0 = time.perf_counter()
+        for i in range(args.cohortes):
+            df = cohorte(rng, args.rows, poblacion)
+            dedup = DeduplicadorIds("ultima_fecha", indice, cohorte=f"c{i:03d}")
+            df, _ = dedup.aplicar(df)
+            dedup.guardar()
+            outputs.append(tmp / f"c{i:03d}.csv")
+            df.to_csv(outputs[-1], index=False)
+        print(f"{args.cohortes} cohortes x {args.rows} filas indexadas en {time.perf_counter() - t0:.2f} s | "
+              f"índice {sum(p.stat().st_size for p in indice.directorio.iterdir()) / 2**20:.1f} MB | "
+              f"outputs {sum(p.stat().st_size for p in outputs) / 2**20:.1f} MB")
+
+        nuevo = cohorte(rng, args.rows, poblacion)
+        t0 = time.perf_counter()
+        a = releyendo(outputs, nuevo)
+        t_releer = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        b = con_indice(indice, nuevo)
+        t_indice = time.perf_counter() - t0
+        print(f"releyendo outputs: {t_releer:7.3f} s")
+        print(f"índice (mmap)    : {t_indice:7.3f} s | x{t_releer / t_indice:.0f}")
+
+        assert (a == b).all()
+        print(f"mismos IDs repetidos ({int(a.sum())} de {len(nuevo)})")
+
+
+if __name__ == "__main__":
+    main()
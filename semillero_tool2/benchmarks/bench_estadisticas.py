@@ -0,0 +1,73 @@
+"""
+Benchmark de central_por_programa: reducción por ordenamiento (todos los
+grupos a la vez) vs el loop del script original (mean / median / count por
+grupo y por variable) y vs groupby().agg de pandas.
+
+Uso:
+    python benchmarks/bench_estadisticas.py --rows 200000 --grupos 50 1000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.estadisticas import central_por_programa
+
+
+def central_por_programa_original(df: pd.DataFrame) -> pd.DataFrame:
+    """Implementación del script original (con PROGRAMA_CANON)."""
+    rows = []
+    for programa, subdf in df.groupby("PROGRAMA_CANON"):
+        for var in FU_COLS:
+            rows.append({
+                "PROGRAMA": programa,
+                "VARIABLE": var,
+                "MEDIA": subdf[var].mean(),
+                "MEDIANA": subdf[var].median(),
+                "N": subdf[var].count(),
+            })
+    return pd.DataFrame(rows)
+
+
+def central_por_programa_agg(df: pd.DataFrame) -> pd.DataFrame:
+    """Un solo groupby().agg (sin desvío ni percentiles)."""
+    return df.groupby("PROGRAMA_CANON")[FU_COLS].agg(["count", "mean", "median"])
+
+
+def frame(rows: int, grupos: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.integers(0, 100, (rows, len(FU_COLS))).astype(float), columns=FU_COLS)
+    df = df.mask(rng.random(df.shape) < 0.05)
+    programas = np.array([f"Programa {i}" for i in range(grupos)], dtype=object)
+    df["PROGRAMA_CANON"] = programas[rng.integers(0, grupos, rows)]
+    return df
+
+
+def _tiempo(fn, df: pd.DataFrame) -> float:
+    t0 = time.perf_counter()
+    fn(df)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=200_000)
+    ap.add_argument("--grupos", type=int, nargs="+", default=[50, 1000])
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    for grupos in args.grupos:
+        df = frame(args.rows, grupos, args.seed)
+        t_old = _tiempo(central_por_programa_original, df)
+        t_agg = _tiempo(central_por_programa_agg, df)
+        t_new = _tiempo(central_por_programa, df)
+        print(f"{grupos:6d} grupos: original {t_old:8.3f} s | groupby.agg {t_agg:7.3f} s | "
+              f"nuevo {t_new:7.3f} s | x{t_old / t_new:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
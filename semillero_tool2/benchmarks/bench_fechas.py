@@ -0,0 +1,76 @@
+"""
+Benchmark de normalizar_fechas_iso: motor por valores únicos + formatos fijos
+vs la implementación previa (pd.to_datetime sin formato + strftime + replace).
+
+Columnas (FECHA del generador sintetico.py y dos casos extremos):
+- mixta: dd/mm/yyyy, ISO, datetime y seriales de Excel, basura, vacíos
+- mixta_primero_fecha: igual, pero el primer valor es un datetime (pandas
+  pasa a format="mixed": dateutil valor a valor)
+- iso: todo texto ISO (el caso ya rápido; no debe empeorar)
+
+Además del tiempo se cuenta en cuántas filas difieren ambos resultados: es
+esperable (la versión previa lee "02/01/2026" mes primero y los seriales como
+1970-01-01; el motor nuevo lee día primero y seriales de Excel).
+
+Uso:
+    python benchmarks/bench_fechas.py --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import time
+
+import numpy as np
+import pandas as pd
+
+from semillero_tool.dates import normalizar_fechas_iso
+
+from sintetico import _columna_fecha
+
+
+def normalizar_fechas_original(df: pd.DataFrame, col: str = "FECHA") -> pd.DataFrame:
+    """Implementación previa (formato adivinado por pandas)."""
+    df = df.copy()
+    parsed = pd.to_datetime(df[col], errors="coerce")
+    out = parsed.dt.strftime("%Y-%m-%d")
+    df[col] = out.replace({"NaT": pd.NA, "nan": pd.NA, "None": pd.NA})
+    return df
+
+
+def columnas(rows: int, seed: int) -> dict[str, pd.Series]:
+    mixta = _columna_fecha(np.random.default_rng(seed), rows)
+    primero = mixta.copy()
+    primero[0] = dt.datetime(2026, 1, 2)
+    mixta[0] = "02/01/2026"
+    iso = pd.Series(pd.date_range("2020-01-01", periods=rows, freq="h").strftime("%Y-%m-%d"), dtype="str")
+    return {
+        "mixta": pd.Series(mixta, dtype=object),
+        "mixta_primero_fecha": pd.Series(primero, dtype=object),
+        "iso": iso,
+    }
+
+
+def _tiempo(fn, df: pd.DataFrame) -> tuple[float, pd.DataFrame]:
+    t0 = time.perf_counter()
+    out = fn(df)
+    return time.perf_counter() - t0, out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=1_000_000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    for nombre, s in columnas(args.rows, args.seed).items():
+        df = pd.DataFrame({"FECHA": s})
+        t_old, a = _tiempo(normalizar_fechas_original, df)
+        t_new, (b, rep) = _tiempo(lambda d: normalizar_fechas_iso(d, col="FECHA"), df)
+        distintas = int((a["FECHA"].fillna("<NA>") != b["FECHA"].fillna("<NA>")).sum())
+        print(f"{nombre:20s}: original {t_old:8.3f} s | motor {t_new:7.3f} s | x{t_old / t_new:6.1f} | "
+              f"OK {int(a['FECHA'].notna().sum())} -> {int(rep.loc[0, 'N_PARSE_OK'])} | filas distintas {distintas}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark del fallback fuzzy de PROGRAMA (peor caso: casi todo NO reconocido).
+
+Compara el loop original (forma_base(lab) + SequenceMatcher completo contra los
+25 labels en cada llamada) con IndiceFuzzy (formas precalculadas + poda) y
+verifica que ambos devuelvan exactamente lo mismo.
+
+Uso:
+    python benchmarks/bench_fuzzy.py --n 20000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import time
+from difflib import SequenceMatcher
+
+from semillero_tool.programa import LABELS_CANON, FUZZY_MIN_RATIO, IndiceFuzzy, forma_base
+
+
+def fuzzy_original(base: str, min_ratio: float = FUZZY_MIN_RATIO) -> str | None:
+    best = None
+    best_r = 0.0
+    for lab in LABELS_CANON:
+        r = SequenceMatcher(None, base, forma_base(lab)).ratio()
+        if r > best_r:
+            best_r = r
+            best = lab
+    return best if best is not None and best_r >= min_ratio else None
+
+
+def generar_valores(n: int, pct_typos: float, seed: int) -> list[str]:
+    """Mayoría basura tipo texto libre; una fracción son typos de labels reales."""
+    rnd = random.Random(seed)
+    bases = [forma_base(lab) for lab in LABELS_CANON]
+    out = []
+    for _ in range(n):
+        if rnd.random() < pct_typos:
+            b = list(rnd.choice(bases))
+            i = rnd.randrange(len(b))
+            b[i] = rnd.choice(string.ascii_lowercase)
+            out.append("".join(b))
+        else:
+            largo = rnd.randint(4, 30)
+            out.append("".join(rnd.choice(string.ascii_lowercase + "  ") for _ in range(largo)).strip())
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20_000, help="Cantidad de valores distintos")
+    ap.add_argument("--pct-typos", type=float, default=0.05)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    valores = generar_valores(args.n, args.pct_typos, args.seed)
+
+    t0 = time.perf_counter()
+    idx = IndiceFuzzy(LABELS_CANON)
+    t_build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    res_orig = [fuzzy_original(v) for v in valores]
+    t_orig = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    res_idx = [idx.mejor(v) for v in valores]
+    t_idx = time.perf_counter() - t0
+
+    assert res_orig == res_idx, "IndiceFuzzy difiere del loop original"
+
+    n_match = sum(r is not None for r in res_idx)
+    print(f"valores: {len(valores)} | reconocidos por fuzzy: {n_match}")
+    print(f"original : {t_orig:8.3f} s")
+    print(f"indice   : {t_idx:8.3f} s  (+ build {t_build * 1000:.2f} ms)")
+    print(f"speedup  : {t_orig / t_idx:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
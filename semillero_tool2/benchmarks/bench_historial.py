@@ -0,0 +1,83 @@
+"""
+Benchmark del historial local: "filas de un programa en un semestre" a
+través de N cohortes, releyendo los outputs de cada corrida (DATA.csv
+completo + filtro) vs con historial.consultar() (poda por manifiesto +
+filtros de pyarrow sobre el Parquet particionado por PERIODO). Verifica
+que ambos devuelvan las mismas filas.
+
+Uso:
+    python benchmarks/bench_historial.py --cohortes 8 --rows 50000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+
+from sintetico import frame_intake
+from semillero_tool.historial import archivos_consulta, consultar
+from semillero_tool.pipeline import RunConfig, run
+
+DESDE, HASTA = "2025-01-01", "2025-06-30"
+
+
+def releyendo(outputs: list[Path], programa: str) -> pd.DataFrame:
+    """Camino sin historial: leer cada DATA.csv entero y filtrar."""
+    partes = []
+    for p in outputs:
+        df = pd.read_csv(p, dtype={"PROGRAMA_CANON": "str", "FECHA": "str"}, low_memory=False)
+        partes.append(df[(df["PROGRAMA_CANON"] == programa) & (df["FECHA"] >= DESDE) & (df["FECHA"] <= HASTA)])
+    return pd.concat(partes, ignore_index=True)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cohortes", type=int, default=8)
+    ap.add_argument("--rows", type=int, default=50_000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        outputs = []
+        base = RunConfig(
+            input_path=tmp, output_path=tmp, sheet=None, strict_schema=False,
+            fu_validate=False, fu_drop_mode="none", min_non_missing_fu=None, canonizar_programa=True,
+            reemplazar_programa=False, drop_missing_mode="none", critical_cols_csv=None,
+            formato_salida="csv", usar_cache=False, historial=tmp / "historial",
+        )
+        t0 = time.perf_counter()
+        for i in range(args.cohortes):
+            entrada = tmp / f"c{i:02d}.csv"
+            frame_intake(args.rows, seed=i).to_csv(entrada, index=False)
+            cfg = replace(base, input_path=entrada, output_path=tmp / f"c{i:02d}")
+            df = run(cfg)
+            outputs.append(cfg.output_path / "DATA.csv")
+        programa = df["PROGRAMA_CANON"].value_counts().index[0]
+        print(f"{args.cohortes} cohortes x {args.rows} filas procesadas (csv + historial) en "
+              f"{time.perf_counter() - t0:.2f} s")
+
+        t0 = time.perf_counter()
+        a = releyendo(outputs, programa)
+        t_releer = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        b = consultar(tmp / "historial", programas=[programa], desde=DESDE, hasta=HASTA)
+        t_consulta = time.perf_counter() - t0
+        total = len(list((tmp / "historial").glob("PERIODO=*/*.parquet")))
+        abiertos = len(archivos_consulta(tmp / "historial", [programa], DESDE, HASTA))
+        print(f"releyendo outputs   : {t_releer:7.3f} s")
+        print(f"historial.consultar : {t_consulta:7.3f} s | x{t_releer / t_consulta:.0f} "
+              f"({abiertos} de {total} partes abiertas)")
+
+        clave = ["ID", "FECHA", "PROGRAMA_CANON"]
+        a = a[clave].astype("str").sort_values(clave, ignore_index=True)
+        b = b[clave].astype("str").sort_values(clave, ignore_index=True)
+        assert a.equals(b), (len(a), len(b))
+        print(f"mismas filas ({len(b)}) para {programa!r} entre {DESDE} y {HASTA}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark de ingesta multi-hoja (ingesta.leer_hojas): un libro con N hojas
+iguales leído hoja por hoja en serie (como se unían a mano) vs en el pool de
+procesos. Verifica que ambos den el mismo DataFrame.
+
+Con una sola CPU el pool no acelera (solo suma el costo de pasar los frames
+entre procesos): correr en la máquina donde corre el batch.
+
+Uso:
+    python benchmarks/bench_hojas.py --hojas 8 --rows 20000 --workers 1 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent))
+import sintetico  # noqa: E402
+
+from semillero_tool.ingesta import leer_hojas  # noqa: E402
+from semillero_tool.io_excel import leer_excel  # noqa: E402
+
+
+def escribir_libro(path: Path, hojas: int, rows: int) -> None:
+    # Misma semilla: headers crudos idénticos (la unión a mano no los alinea).
+    df = sintetico.frame_intake(rows, columnas_extra=10, seed=0)
+    with pd.ExcelWriter(path, engine="openpyxl") as w:
+        for i in range(hojas):
+            df.to_excel(w, sheet_name=f"F{i}", index=False)
+
+
+def unir_a_mano(path: Path, hojas: int) -> pd.DataFrame:
+    partes = []
+    for i in range(hojas):
+        df = leer_excel(path, f"F{i}")
+        df["SOURCE_FILE"] = path.name
+        df["SHEET"] = f"F{i}"
+        partes.append(df)
+    return pd.concat(partes, ignore_index=True)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--hojas", type=int, default=8)
+    ap.add_argument("--rows", type=int, default=20_000)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "facultades.xlsx"
+        escribir_libro(path, args.hojas, args.rows)
+        print(f"{args.hojas} hojas x {args.rows} filas | CPUs: {os.cpu_count()}")
+
+        t0 = time.perf_counter()
+        ref = unir_a_mano(path, args.hojas)
+        base = time.perf_counter() - t0
+        print(f"a mano (serie)    {base:7.2f} s")
+
+        for w in args.workers:
+            t0 = time.perf_counter()
+            df, _ = leer_hojas([path], ["*"], workers=w)
+            seg = time.perf_counter() - t0
+            pd.testing.assert_frame_equal(df, ref)
+            print(f"leer_hojas w={w:<3}  {seg:7.2f} s  x{base / seg:.2f}")
+
+
+if __name__ == "__main__":
+    main()
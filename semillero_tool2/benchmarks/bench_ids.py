@@ -0,0 +1,82 @@
+"""
+Benchmark de asegurar_ids_como_texto: caminos por dtype (int / float / texto
+en una pasada) vs la implementación previa (astype(str) x5 + regex + endswith).
+
+Columnas ID como las deja read_excel:
+- float: IDs de 10 dígitos con vacíos (float64, "123.0")
+- int: IDs de 10 dígitos sin vacíos (int64)
+- mixta: ID del generador sintetico.py (float + texto " 1.234.567 " + vacíos, object)
+- texto: IDs "123.0" / " 123 " ya como texto (dtype str)
+
+Además del tiempo se verifica que ambos resultados (valores y reporte) sean iguales.
+
+Uso:
+    python benchmarks/bench_ids.py --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from semillero_tool.text_clean import asegurar_ids_como_texto
+
+from sintetico import columnas_intake
+
+
+def asegurar_ids_original(df: pd.DataFrame) -> tuple[pd.DataFrame, list[tuple[int, int]]]:
+    """Implementación previa (una columna 'ID')."""
+    df = df.copy()
+    s = df["ID"]
+    s2 = s.where(s.isna(), s.astype(str).str.strip())
+    s3 = s2.where(s2.isna(), s2.astype(str).str.replace(r"\.0$", "", regex=True))
+    before = s.where(s.isna(), s.astype(str))
+    after = s3.where(s3.isna(), s3.astype(str))
+    n_changed = int(((before != after) & before.notna() & after.notna()).sum())
+    n_dot0 = int(((s2.notna()) & (s2.astype(str).str.endswith(".0"))).sum())
+    df["ID"] = s3
+    return df, [(n_changed, n_dot0)]
+
+
+def columnas(rows: int, seed: int) -> dict[str, pd.Series]:
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(10**9, 10**10, rows)
+    flotantes = ids.astype(float)
+    flotantes[rng.random(rows) < 0.01] = np.nan
+    texto = np.where(rng.random(rows) < 0.5, [f"{v}.0" for v in ids], [f" {v} " for v in ids])
+    mixta = dict(columnas_intake(rows, columnas_extra=0, seed=seed))["ID"]
+    return {
+        "float": pd.Series(flotantes),
+        "int": pd.Series(ids),
+        "mixta": pd.Series(mixta, dtype=object),
+        "texto": pd.Series(texto, dtype="str"),
+    }
+
+
+def _tiempo(fn, df: pd.DataFrame):
+    t0 = time.perf_counter()
+    out = fn(df)
+    return time.perf_counter() - t0, out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=1_000_000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    for nombre, s in columnas(args.rows, args.seed).items():
+        df = pd.DataFrame({"ID": s})
+        t_old, (a, rep_a) = _tiempo(asegurar_ids_original, df)
+        t_new, (b, rep_b) = _tiempo(asegurar_ids_como_texto, df)
+        iguales = a["ID"].equals(b["ID"]) and rep_a == list(
+            rep_b[["N_CAMBIOS_TOTAL", "N_DOT0_FIX"]].itertuples(index=False, name=None)
+        )
+        print(f"{nombre:6s}: original {t_old:7.3f} s | nuevo {t_new:7.3f} s | x{t_old / t_new:6.1f} | "
+              f"cambios {rep_a[0][0]} | iguales {iguales}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark de lectura de .xlsx: camino actual (pd.ExcelFile + pd.read_excel)
+vs lector streaming (openpyxl read_only + iter_rows(values_only)).
+
+Genera un libro sintético con columnas tipo intake: ID numérico,
+PROGRAMA/texto libre, FECHA, bloque F..U y columnas extra. Cada variante corre
+en un subproceso limpio; se reporta tiempo y pico de RSS sobre el RSS previo a
+leer (Linux: pico reseteado vía /proc/self/clear_refs, tras calentar imports
+con un libro mínimo) y se verifica que los DataFrames sean idénticos.
+
+Uso:
+    python benchmarks/bench_lectura_excel.py --rows 50000 --extra-cols 30
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+
+
+def escribir_libro(path: Path, rows: int, extra_cols: int, seed: int = 0) -> None:
+    from openpyxl import Workbook
+
+    rnd = random.Random(seed)
+    programas = ["Ing. Sistemas", "psicologia ", "Derecho", "adm empresas", "xyz", None]
+    textos = [" texto ", "otro valor", None, "OBSERVACION larga ", "NA"]
+    # Modo normal (no write_only): escribe sharedStrings y la dimensión de la
+    # hoja, como Excel. write_only usa inlineStr y es mucho más lento de leer.
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Hoja1"
+    ws.append(["ID", "Programa", "Fecha"] + list(FU_COLS) + [f"Extra {i}" for i in range(extra_cols)])
+    for r in range(rows):
+        fila = [float(rnd.randrange(10**9, 10**10)), rnd.choice(programas), f"2026-01-{r % 28 + 1:02d}"]
+        fila += [rnd.choice((None, "x")) if rnd.random() < 0.03 else rnd.randrange(100) for _ in FU_COLS]
+        fila += [rnd.choice(textos) for _ in range(extra_cols)]
+        ws.append(fila)
+    wb.save(path)
+
+
+def leer_original(path: Path) -> pd.DataFrame:
+    """Camino previo: ExcelFile para detectar la hoja y read_excel (segundo open)."""
+    xls = pd.ExcelFile(path, engine="openpyxl")
+    return pd.read_excel(path, sheet_name=xls.sheet_names[0], engine="openpyxl")
+
+
+def _status_kb(campo: str) -> int:
+    with open("/proc/self/status", encoding="ascii") as f:
+        for linea in f:
+            if linea.startswith(campo + ":"):
+                return int(linea.split()[1])
+    raise RuntimeError(f"{campo} no disponible")
+
+
+def _reset_pico() -> None:
+    with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+        f.write("5")
+
+
+def _hijo(variante: str, path: Path, salida: Path) -> None:
+    from semillero_tool.io_excel import leer_excel, leer_excel_streaming
+
+    fn = {"original": leer_original, "pandas": lambda p: leer_excel(p, None),
+          "streaming": lambda p: leer_excel_streaming(p, None)}[variante]
+    # Calentamiento: los imports perezosos (pyarrow para dtype "str", parsers
+    # de pandas) suman decenas de MB y no son costo de la lectura.
+    fn(path.with_name("mini.xlsx"))
+    _reset_pico()
+    antes = _status_kb("VmRSS")
+    t0 = time.perf_counter()
+    df = fn(path)
+    dt = time.perf_counter() - t0
+    pico = _status_kb("VmHWM")
+    df.to_pickle(salida)
+    print(json.dumps({"segundos": dt, "pico_mb": (pico - antes) / 1024, "shape": list(df.shape)}))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=50_000)
+    ap.add_argument("--extra-cols", type=int, default=30)
+    ap.add_argument("--_hijo", nargs=3, default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args._hijo:
+        variante, path, salida = args._hijo
+        _hijo(variante, Path(path), Path(salida))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        libro = tmp / "sintetico.xlsx"
+        escribir_libro(libro, args.rows, args.extra_cols)
+        escribir_libro(tmp / "mini.xlsx", 5, args.extra_cols)
+        print(f"libro: {args.rows} filas x {3 + len(FU_COLS) + args.extra_cols} columnas | "
+              f"{libro.stat().st_size / 2**20:.1f} MB en disco")
+
+        frames = {}
+        for variante in ("original", "pandas", "streaming"):
+            salida = tmp / f"{variante}.pkl"
+            out = subprocess.run(
+                [sys.executable, __file__, "--_hijo", variante, str(libro), str(salida)],
+                check=True, capture_output=True, text=True,
+            )
+            r = json.loads(out.stdout)
+            frames[variante] = pd.read_pickle(salida)
+            print(f"{variante:9s}: {r['segundos']:7.2f} s | pico RSS +{r['pico_mb']:8.1f} MB")
+
+        pd.testing.assert_frame_equal(frames["original"], frames["pandas"])
+        pd.testing.assert_frame_equal(frames["original"], frames["streaming"])
+        print("DataFrames idénticos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Perfil de memoria de pipeline.run: modo defensivo (copia por etapa) vs sin copias.
+
+Cada modo corre en un subproceso limpio. Se reemplazan leer_excel/escribir_salida
+por un frame sintético en memoria y un no-op, para medir SOLO las etapas.
+Se reporta el pico de RSS (sobre el RSS del intérprete ya importado) expresado
+como múltiplo del tamaño residente del input (RSS tras construirlo; no se usa
+memory_usage(deep=True) porque cuenta N veces los str compartidos).
+
+Linux: el pico se resetea vía /proc/self/clear_refs (VmHWM).
+
+Uso:
+    python benchmarks/bench_memoria_pipeline.py --rows 200000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+
+
+def frame_sintetico(rows: int, extra_cols: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    programas = np.array(["Ing. Sistemas", "psicologia ", "Derecho", "adm empresas", "xyz", None], dtype=object)
+    data: dict[str, object] = {
+        "ID": rng.integers(10**9, 10**10, rows).astype(float),
+        "Programa": programas[rng.integers(0, len(programas), rows)],
+        "Fecha": pd.Series(pd.date_range("2026-01-01", periods=rows, freq="min").strftime("%Y-%m-%d"), dtype="str"),
+    }
+    for c in FU_COLS:
+        vals = rng.integers(0, 100, rows).astype(object)
+        vals[rng.random(rows) < 0.01] = "x"
+        vals[rng.random(rows) < 0.02] = None
+        data[c] = vals
+    pool = np.array([" texto ", "otro valor", "nan", None, "OBSERVACION larga "], dtype=object)
+    for i in range(extra_cols):
+        data[f"Extra {i}"] = pd.Series(pool[rng.integers(0, len(pool), rows)], dtype="str" if i % 2 else object)
+    return pd.DataFrame(data)
+
+
+def _status_kb(campo: str) -> int:
+    with open("/proc/self/status", encoding="ascii") as f:
+        for linea in f:
+            if linea.startswith(campo + ":"):
+                return int(linea.split()[1])
+    raise RuntimeError(f"{campo} no disponible")
+
+
+def _reset_pico() -> None:
+    with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+        f.write("5")
+
+
+def _hijo(copiar: bool, rows: int, extra_cols: int) -> None:
+    from semillero_tool import pipeline
+
+    base_kb = _status_kb("VmRSS")
+    holder = [frame_sintetico(rows, extra_cols)]
+    input_kb = _status_kb("VmRSS") - base_kb
+
+    # El pipeline recibe el frame como si lo hubiera leído (y queda como único dueño).
+    pipeline.leer_excel = lambda *_a, **_k: holder.pop()
+    pipeline.escribir_salida = lambda *_a, **_k: None
+
+    cfg = pipeline.RunConfig(
+        input_path=Path("sintetico.xlsx"),
+        output_path=Path("sintetico_out.xlsx"),
+        sheet=None,
+        strict_schema=True,
+        fu_validate=True,
+        fu_drop_mode="threshold",
+        min_non_missing_fu=14,
+        canonizar_programa=True,
+        reemplazar_programa=False,
+        drop_missing_mode="all",
+        critical_cols_csv=None,
+        usar_cache=False,  # mide las etapas, no la caché
+        copiar_etapas=copiar,
+    )
+
+    _reset_pico()
+    out = pipeline.run(cfg)
+    pico_kb = _status_kb("VmHWM")
+
+    print(json.dumps({
+        "copiar_etapas": copiar,
+        "input_mb": input_kb / 1024,
+        "pico_mb": (pico_kb - base_kb) / 1024,
+        "x_input": (pico_kb - base_kb) / input_kb,
+        "filas_out": len(out),
+    }))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=200_000)
+    ap.add_argument("--extra-cols", type=int, default=40)
+    ap.add_argument("--_hijo", default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args._hijo:
+        _hijo(args._hijo == "copiar", args.rows, args.extra_cols)
+        return
+
+    for modo in ("copiar", "sin_copias"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--rows", str(args.rows), "--extra-cols", str(args.extra_cols),
+             "--_hijo", modo],
+            check=True, capture_output=True, text=True,
+        )
+        r = json.loads(out.stdout)
+        print(
+            f"{modo:10s}: input {r['input_mb']:7.1f} MB | pico {r['pico_mb']:7.1f} MB "
+            f"({r['x_input']:.2f}x input) | filas out {r['filas_out']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
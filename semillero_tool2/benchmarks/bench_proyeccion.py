@@ -0,0 +1,106 @@
+"""
+Benchmark de lectura con proyección de columnas (--solo-columnas-usadas):
+libro / CSV ancho (bloque F..U + muchas columnas de texto que el pipeline no
+usa), leído entero vs solo con las columnas que usan las etapas, con cada
+lector (pd.read_excel, streaming, CSV).
+
+Cada variante corre en un subproceso limpio: tiempo de lectura, pico de RSS
+del proceso (ru_maxrss, incluye imports) y memoria del DataFrame. Verifica
+que lo proyectado sea idéntico a esas columnas de la lectura completa.
+
+Uso:
+    python benchmarks/bench_proyeccion.py --rows 5000 --extra-cols 120
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pickle
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from sintetico import escribir_intake, frame_intake
+
+VARIANTES = ("pandas", "streaming", "csv")
+
+
+def _hijo(variante: str, path: Path, proyectar: bool, salida: Path) -> None:
+    from semillero_tool.io_csv import LectorCsv
+    from semillero_tool.io_excel import LectorExcelStreaming, leer_excel
+    from semillero_tool.proyeccion import SelectorColumnas, columnas_usadas
+
+    usecols = SelectorColumnas(columnas_usadas()) if proyectar else None
+    t0 = time.perf_counter()
+    if variante == "pandas":
+        df = leer_excel(path, None, usecols=usecols)
+    elif variante == "streaming":
+        with LectorExcelStreaming(path, None, usecols=usecols) as lector:
+            df = lector.leer()
+    else:
+        with LectorCsv(path, usecols=usecols) as lector:
+            df = lector.leer()
+    segundos = time.perf_counter() - t0
+    with open(salida, "wb") as f:
+        pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(json.dumps({
+        "segundos": segundos,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "df_mb": df.memory_usage(deep=True).sum() / 2**20,
+        "columnas": df.shape[1],
+    }))
+
+
+def _correr(variante: str, path: Path, proyectar: bool, salida: Path) -> dict:
+    cmd = [sys.executable, __file__, "--hijo", variante, str(path), str(int(proyectar)), str(salida)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=5_000)
+    ap.add_argument("--extra-cols", type=int, default=120)
+    ap.add_argument("--hijo", nargs=4, default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.hijo:
+        variante, path, proyectar, salida = args.hijo
+        _hijo(variante, Path(path), proyectar == "1", Path(salida))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        xlsx, csv = tmp / "ancho.xlsx", tmp / "ancho.csv"
+        escribir_intake(xlsx, args.rows, columnas_extra=args.extra_cols)
+        frame_intake(args.rows, columnas_extra=args.extra_cols).to_csv(csv, index=False)
+        print(f"{args.rows} filas x {args.extra_cols} columnas extra | "
+              f"xlsx {xlsx.stat().st_size / 2**20:.1f} MB, csv {csv.stat().st_size / 2**20:.1f} MB")
+
+        for variante in VARIANTES:
+            path = csv if variante == "csv" else xlsx
+            r = {}
+            for proyectar in (False, True):
+                r[proyectar] = _correr(variante, path, proyectar, tmp / f"{variante}_{int(proyectar)}.pkl")
+            for proyectar, nombre in ((False, "todas"), (True, "proyección")):
+                x = r[proyectar]
+                print(f"{variante:9s} {nombre:10s}: {x['segundos']:7.2f} s | RSS pico {x['rss_mb']:7.1f} MB | "
+                      f"df {x['df_mb']:7.1f} MB | {x['columnas']} columnas")
+            print(f"{'':9s} {'':10s}  x{r[False]['segundos'] / r[True]['segundos']:.1f} tiempo, "
+                  f"x{r[False]['df_mb'] / r[True]['df_mb']:.1f} memoria del df")
+
+            with open(tmp / f"{variante}_0.pkl", "rb") as f:
+                todo = pickle.load(f)
+            with open(tmp / f"{variante}_1.pkl", "rb") as f:
+                proyectado = pickle.load(f)
+            assert todo[list(proyectado.columns)].equals(proyectado), variante
+        print("mismas columnas proyectadas que la lectura completa")
+
+
+if __name__ == "__main__":
+    main()
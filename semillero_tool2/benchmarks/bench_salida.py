@@ -0,0 +1,74 @@
+"""
+Benchmark de escritura del output: xlsx (escribir_excel, openpyxl) vs
+bundles parquet / feather / csv (io_salida.escribir_salida).
+
+Usa un frame sintético con la forma del output limpio (ID texto, PROGRAMA,
+FECHA ISO, F..U float, columnas extra de texto) y reportes chicos. Se mide
+solo la escritura y se verifica que DATA vuelva a cargarse igual.
+
+Uso:
+    python benchmarks/bench_salida.py --rows 100000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.io_salida import FORMATOS_SALIDA, escribir_salida, tipos_columnar
+
+
+def frame_limpio(rows: int, extra_cols: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    programas = np.array(["Ing. Sistemas", "Psicología", "Derecho", None], dtype=object)
+    data: dict[str, object] = {
+        "ID": pd.Series(rng.integers(10**9, 10**10, rows).astype(str), dtype="str"),
+        "PROGRAMA": programas[rng.integers(0, len(programas), rows)],
+        "FECHA": pd.Series(pd.date_range("2026-01-01", periods=rows, freq="min").strftime("%Y-%m-%d"), dtype="str"),
+    }
+    for c in FU_COLS:
+        vals = rng.integers(0, 100, rows).astype(float)
+        vals[rng.random(rows) < 0.02] = np.nan
+        data[c] = vals
+    pool = np.array(["texto", "otro valor", None, "OBSERVACION larga"], dtype=object)
+    for i in range(extra_cols):
+        data[f"EXTRA_{i}"] = pool[rng.integers(0, len(pool), rows)]
+    return pd.DataFrame(data)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--extra-cols", type=int, default=20)
+    args = ap.parse_args()
+
+    df = frame_limpio(args.rows, args.extra_cols)
+    reportes = {
+        "REPORTE_FU_CAST": pd.DataFrame({"COLUMNA": FU_COLS, "COERCIONES_A_NA": range(len(FU_COLS))}),
+        "REPORTE_FECHAS": pd.DataFrame([{"COLUMNA": "FECHA", "N_TOTAL": args.rows}]),
+    }
+    print(f"DATA: {df.shape[0]} filas x {df.shape[1]} columnas")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for formato in FORMATOS_SALIDA:
+            out = Path(tmp) / ("salida.xlsx" if formato == "xlsx" else formato)
+            t0 = time.perf_counter()
+            escribir_salida(out, formato, df, reportes)
+            dt = time.perf_counter() - t0
+            tam = out.stat().st_size if out.is_file() else sum(p.stat().st_size for p in out.iterdir())
+            print(f"{formato:8s}: {dt:7.2f} s | {tam / 2**20:7.1f} MB")
+
+            if formato in ("parquet", "feather"):
+                leer = pd.read_parquet if formato == "parquet" else pd.read_feather
+                pd.testing.assert_frame_equal(
+                    leer(out / f"DATA.{formato}"), tipos_columnar(df), check_dtype=False
+                )
+
+
+if __name__ == "__main__":
+    main()
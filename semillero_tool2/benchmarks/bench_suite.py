@@ -0,0 +1,213 @@
+"""
+Suite de benchmarks por etapa pública, sobre intakes sintéticos (sintetico.py).
+
+Mide, a cada tamaño (default 1k / 100k / 1M filas), en el orden del pipeline
+y con el output de cada etapa como input de la siguiente:
+
+    leer_excel -> normalizar_columnas_suffix -> limpiar_texto ->
+    asegurar_ids_como_texto -> cast_fu_numeric -> canonizar_programa ->
+    normalizar_fechas_iso -> escribir_excel
+
+Cada repetición parte de una copia fresca del input (fuera del tiempo) y corre
+como en el pipeline (copiar=False). canonizar_programa usa una caché vacía por
+repetición (costo de una primera corrida). Se guarda el mínimo y la mediana.
+
+Los resultados van a benchmarks/resultados/<fecha>_<commit>.json para
+compararlos entre commits:
+
+    python benchmarks/bench_suite.py                           # 1k, 100k, 1M
+    python benchmarks/bench_suite.py --filas 1000 100000 --max-filas-excel 100000
+    python benchmarks/bench_suite.py --comparar resultados/A.json [resultados/B.json]
+
+--comparar sin B usa el resultado más reciente; sale con código 1 si alguna
+etapa empeoró más que --umbral (default 10 %).
+
+leer_excel / escribir_excel con 1M filas tardan decenas de minutos (openpyxl);
+--max-filas-excel los limita a los tamaños menores.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from semillero_tool.cache import CacheLRU
+from semillero_tool.columns import normalizar_columnas_suffix
+from semillero_tool.dates import normalizar_fechas_iso
+from semillero_tool.fu import cast_fu_numeric
+from semillero_tool.io_excel import escribir_excel, leer_excel
+from semillero_tool.programa import CACHE_PROGRAMA_MAX, FIRMA_REGLAS, canonizar_programa
+from semillero_tool.text_clean import asegurar_ids_como_texto, limpiar_texto
+
+from sintetico import escribir_intake, frame_intake
+
+RESULTADOS = Path(__file__).parent / "resultados"
+
+# (nombre, etapa(df) -> df) en orden de pipeline
+CADENA = [
+    ("normalizar_columnas_suffix", lambda df: normalizar_columnas_suffix(df, copiar=False)[0]),
+    ("limpiar_texto", lambda df: limpiar_texto(df, copiar=False)[0]),
+    ("asegurar_ids_como_texto", lambda df: asegurar_ids_como_texto(df, copiar=False)[0]),
+    ("cast_fu_numeric", lambda df: cast_fu_numeric(df, copiar=False)[0]),
+    ("canonizar_programa", lambda df: canonizar_programa(
+        df, cache=CacheLRU(None, FIRMA_REGLAS, max_entradas=CACHE_PROGRAMA_MAX), copiar=False
+    )[0]),
+    ("normalizar_fechas_iso", lambda df: normalizar_fechas_iso(df, col="FECHA", copiar=False)[0]),
+]
+
+
+def _git(*args: str) -> str | None:
+    try:
+        out = subprocess.run(["git", *args], cwd=Path(__file__).parent, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _medir(fn, preparar, repeticiones: int):
+    """Tiempos de fn(preparar()) (preparar fuera del tiempo) y el último output."""
+    tiempos = []
+    out = None
+    for _ in range(repeticiones):
+        arg = preparar()
+        t0 = time.perf_counter()
+        out = fn(arg)
+        tiempos.append(time.perf_counter() - t0)
+        del arg
+    return tiempos, out
+
+
+def _fila(etapa: str, filas: int, tiempos: list[float]) -> dict:
+    t_min = min(tiempos)
+    r = {
+        "etapa": etapa,
+        "filas": filas,
+        "repeticiones": len(tiempos),
+        "segundos_min": round(t_min, 6),
+        "segundos_mediana": round(statistics.median(tiempos), 6),
+        "filas_por_segundo": round(filas / t_min) if t_min > 0 else None,
+    }
+    print(f"  {etapa:28s} {r['segundos_min']:10.4f} s  (mediana {r['segundos_mediana']:.4f}, "
+          f"{len(tiempos)} rep)", flush=True)
+    return r
+
+
+def correr_tamano(filas: int, args, tmp: Path) -> list[dict]:
+    rep = args.repeticiones if filas <= 100_000 else 1
+    excel = args.max_filas_excel is None or filas <= args.max_filas_excel
+    print(f"\n== {filas} filas x {3 + 16 + args.columnas_extra} columnas ==", flush=True)
+    resultados = []
+
+    if excel:
+        libro = tmp / f"intake_{filas}.xlsx"
+        escribir_intake(libro, filas, args.columnas_extra, args.seed)
+        tiempos, df = _medir(lambda p: leer_excel(p, None), lambda: libro, rep)
+        resultados.append(_fila("leer_excel", filas, tiempos))
+        libro.unlink()
+    else:
+        df = frame_intake(filas, args.columnas_extra, args.seed)
+
+    for nombre, etapa in CADENA:
+        tiempos, df = _medir(etapa, lambda: df.copy(deep=True), rep)
+        resultados.append(_fila(nombre, filas, tiempos))
+
+    if excel:
+        salida = tmp / f"salida_{filas}.xlsx"
+        tiempos, _ = _medir(lambda d: escribir_excel(salida, d), lambda: df, rep)
+        resultados.append(_fila("escribir_excel", filas, tiempos))
+        salida.unlink()
+    return resultados
+
+
+def correr(args) -> Path:
+    commit = _git("rev-parse", "--short", "HEAD")
+    sucio = bool(_git("status", "--porcelain", "--untracked-files=no"))
+    payload = {
+        "commit": commit,
+        "sucio": sucio,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "cpus": os.cpu_count(),
+        "parametros": {
+            "filas": args.filas,
+            "columnas_extra": args.columnas_extra,
+            "seed": args.seed,
+            "repeticiones": args.repeticiones,
+            "max_filas_excel": args.max_filas_excel,
+        },
+        "resultados": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for filas in args.filas:
+            payload["resultados"] += correr_tamano(filas, args, Path(tmp))
+
+    args.salida.mkdir(parents=True, exist_ok=True)
+    nombre = f"{datetime.now():%Y%m%d-%H%M%S}_{commit or 'sin-git'}{'-sucio' if sucio else ''}.json"
+    path = args.salida / nombre
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados: {path}")
+    return path
+
+
+def comparar(base: Path, nuevo: Path, umbral: float) -> int:
+    """Tabla base vs nuevo por (etapa, filas); 1 si alguna etapa empeoró > umbral."""
+    a = json.loads(base.read_text(encoding="utf-8"))
+    b = json.loads(nuevo.read_text(encoding="utf-8"))
+    idx_a = {(r["etapa"], r["filas"]): r for r in a["resultados"]}
+    print(f"base : {base.name} ({a.get('commit')})\nnuevo: {nuevo.name} ({b.get('commit')})\n")
+    print(f"{'etapa':28s} {'filas':>9s} {'base s':>10s} {'nuevo s':>10s} {'x':>7s}")
+    peor = 0
+    for r in b["resultados"]:
+        ra = idx_a.get((r["etapa"], r["filas"]))
+        if ra is None:
+            continue
+        ratio = r["segundos_min"] / ra["segundos_min"] if ra["segundos_min"] > 0 else float("nan")
+        marca = "  <- más lento" if ratio > 1 + umbral else ""
+        peor = max(peor, int(ratio > 1 + umbral))
+        print(f"{r['etapa']:28s} {r['filas']:9d} {ra['segundos_min']:10.4f} {r['segundos_min']:10.4f} "
+              f"{ratio:7.2f}{marca}")
+    return peor
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--filas", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    ap.add_argument("--columnas-extra", type=int, default=20)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--repeticiones", type=int, default=3, help="Repeticiones hasta 100k filas (más grandes: 1)")
+    ap.add_argument("--max-filas-excel", type=int, default=None,
+                    help="Solo mide leer_excel / escribir_excel hasta este tamaño")
+    ap.add_argument("--salida", type=Path, default=RESULTADOS)
+    ap.add_argument("--comparar", type=Path, nargs="+", default=None, metavar="JSON")
+    ap.add_argument("--umbral", type=float, default=0.10)
+    args = ap.parse_args()
+
+    if args.comparar:
+        base = args.comparar[0]
+        if len(args.comparar) > 1:
+            nuevo = args.comparar[1]
+        else:
+            nuevo = max(args.salida.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        return comparar(base, nuevo, args.umbral)
+
+    correr(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
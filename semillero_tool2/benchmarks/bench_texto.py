@@ -0,0 +1,137 @@
+"""
+Benchmark de limpiar_texto: tiempo y memoria pico (RSS) en hojas anchas.
+
+Cada variante corre en un subproceso limpio; se reporta el incremento del pico
+de RSS durante la limpieza respecto del RSS con la hoja ya cargada. En Linux el
+pico se resetea con /proc/self/clear_refs (VmHWM); en otros sistemas se usa
+ru_maxrss (incluye el pico de construir la hoja, menos preciso). Se usa RSS y
+no tracemalloc porque los buffers Arrow no pasan por el allocator de Python.
+
+Uso:
+    python benchmarks/bench_texto.py --rows 50000 --cols 150
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def limpiar_texto_original(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Implementación previa (4x astype(str) + replace + 2x where por columna)."""
+    df = df.copy()
+    rows = []
+    for c in df.columns:
+        if pd.api.types.is_string_dtype(df[c]) or df[c].dtype == object:
+            s = df[c]
+            s2 = s.where(s.isna(), s.astype(str))
+            s2 = s2.replace({"nan": pd.NA, "None": pd.NA, "NaT": pd.NA})
+            stripped = s2.where(s2.isna(), s2.astype(str).str.strip())
+            before = s2.where(s2.isna(), s2.astype(str))
+            after = stripped.where(stripped.isna(), stripped.astype(str))
+            n_changed = int(((before != after) & before.notna() & after.notna()).sum())
+            df[c] = stripped
+            if n_changed:
+                rows.append({"COLUMNA": c, "N_STRIP_CAMBIOS": n_changed})
+    rep = (
+        pd.DataFrame(rows, columns=["COLUMNA", "N_STRIP_CAMBIOS"])
+        .sort_values("N_STRIP_CAMBIOS", ascending=False)
+        if rows
+        else pd.DataFrame(columns=["COLUMNA", "N_STRIP_CAMBIOS"])
+    )
+    return df, rep
+
+
+def hoja_ancha(rows: int, cols: int, seed: int = 0) -> pd.DataFrame:
+    """Mezcla de columnas object y str (como las deja read_excel), con NA y sentinelas."""
+    rng = np.random.default_rng(seed)
+    pool = np.array([
+        " a ", "Psicología", "nan", None, "x", "  y", "123", "None",
+        "OBSERVACION larga con varias palabras ", "Ing. Sistemas ",
+    ], dtype=object)
+    data = {}
+    for i in range(cols):
+        col = pool[rng.integers(0, len(pool), rows)]
+        data[f"C{i}"] = pd.Series(col, dtype="str" if i % 2 else object)
+    return pd.DataFrame(data)
+
+
+def _status_kb(campo: str) -> int | None:
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for linea in f:
+                if linea.startswith(campo + ":"):
+                    return int(linea.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def _reset_pico() -> int:
+    """Resetea el pico de RSS (si se puede) y devuelve el RSS actual en KB."""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+    except OSError:
+        pass
+    actual = _status_kb("VmRSS")
+    return actual if actual is not None else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _rss_pico_kb() -> int:
+    pico = _status_kb("VmHWM")
+    return pico if pico is not None else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _hijo(variante: str, rows: int, cols: int) -> None:
+    from semillero_tool.text_clean import limpiar_texto
+
+    fn = limpiar_texto if variante == "nuevo" else limpiar_texto_original
+    df = hoja_ancha(rows, cols)
+    antes = _reset_pico()
+    t0 = time.perf_counter()
+    _, rep = fn(df)
+    dt = time.perf_counter() - t0
+    print(json.dumps({
+        "variante": variante,
+        "segundos": dt,
+        "rss_delta_mb": (_rss_pico_kb() - antes) / 1024,
+        "reporte": rep.to_dict("list"),
+    }))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=50_000)
+    ap.add_argument("--cols", type=int, default=150)
+    ap.add_argument("--_hijo", default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args._hijo:
+        _hijo(args._hijo, args.rows, args.cols)
+        return
+
+    res = {}
+    for variante in ("original", "nuevo"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--rows", str(args.rows), "--cols", str(args.cols), "--_hijo", variante],
+            check=True, capture_output=True, text=True,
+        )
+        res[variante] = json.loads(out.stdout)
+
+    assert res["original"]["reporte"] == res["nuevo"]["reporte"], "REPORTE_TEXTO difiere"
+
+    print(f"hoja: {args.rows} filas x {args.cols} columnas | REPORTE_TEXTO idéntico")
+    for v in ("original", "nuevo"):
+        r = res[v]
+        print(f"{v:9s}: {r['segundos']:7.2f} s | pico RSS +{r['rss_delta_mb']:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
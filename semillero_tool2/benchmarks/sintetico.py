@@ -0,0 +1,193 @@
+"""
+Generador determinista de intakes sintéticos (misma semilla -> mismo libro).
+
+Imita lo que llega de los formularios:
+- ID leído como float (123456789.0), a veces texto (" 1.234.567 "), a veces vacío
+- PROGRAMA con las variantes reales (abreviaturas, tildes, typos, mayúsculas,
+  espacios y NBSP) + valores no reconocibles
+- FECHA mezclada: dd/mm/yyyy, ISO, datetime de Excel, serial de Excel, basura
+- F..U numéricos con ruido no numérico ("x", "N/A", "12,5", " 7 ") y vacíos
+- columnas extra de texto con NBSP / espacios, y headers que colisionan al
+  normalizar ("Observaciones" / "OBSERVACIONES\xa0")
+
+frame_intake() devuelve el DataFrame como lo entregaría pd.read_excel;
+escribir_intake() escribe el libro .xlsx (openpyxl write-only).
+
+Lo usan bench_suite.py y se puede importar desde otros benchmarks:
+    from sintetico import frame_intake, escribir_intake
+"""
+from __future__ import annotations
+
+import datetime as dt
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+
+NBSP = "\xa0"
+
+# Familias de variantes reales (lo que escribe la gente para cada programa).
+FAMILIAS_PROGRAMA = [
+    ["Ing. Sistemas", "inge.sistemas", "Ing.Sistemas", "Ingenieria en sistemas", "ING SIST", "ingeniería de sistemas"],
+    ["Ing. Electronica", "ing electronica", "Ingeniería Electrónica", "inge electronico"],
+    ["Ing. Industrial", "ing industrial", "INGENIERIA INDUSTRIAL"],
+    ["Ing. Ambiental", "ingen ambiental", "Ingeniería ambiental"],
+    ["Lic. Lenguas Extranjeras", "lic lenguas extranjeras", "Licenciatura en Lenguas Extranjeras"],
+    ["Lic. Educación Infantil", "lic edu infantil", "licenciatura en educacion infantil"],
+    ["Lic. Educación Física", "lic. ed fisica", "Lic en educacion fisica", "licenciatura en educación física"],
+    ["Lic. Ciencias Naturales", "lic ciencias naturales", "Licenciatura en Ciencias Naturales"],
+    ["Psicología", "psicologia", "PSICOLOGIA", "Psicologìa"],
+    ["Derecho", "derecho", "DERECHO"],
+    ["Comunicación Social", "comunicacion social", "Comunicación social y periodismo"],
+    ["Trabajo Social", "trabajo social", "TRABAJO SOCIAL"],
+    ["Teología", "teologia", "teol virtual", "Teología Virtual"],
+    ["Gerontología", "gerontologia", "Gerontología virtual"],
+    ["Administración de Empresas", "adm empresas", "Administacion de Empresas", "admin. de empresas"],
+    ["Contaduría Pública", "contaduria publica", "CONTADURÍA"],
+    ["Comercio Exterior", "comercio exterior", "Comercio exterior"],
+    ["Agronomía", "agronomia", "zootecnia", "Zootecnia"],
+    ["Enfermería", "enfemeria", "Enfermeria", "enferemería"],
+    ["Nutrición y Dietética", "nutricion y dietetica", "Nutrición"],
+]
+PROGRAMA_NO_RECONOCIDO = ["xyz", "N/A", "no sabe", "otro", "Ing. Civil", "Medicina veterinaria"]
+
+RUIDO_FU = ["x", "N/A", "12,5", " 7 ", "-", "sin dato"]
+TEXTOS_EXTRA = ["texto", " otro valor ", f"obs{NBSP}larga", f"{NBSP}NA", "nan", "Sí", "no aplica "]
+FECHA_BASURA = ["sin fecha", "pendiente", "31/02/2026", "2026-13-01"]
+
+EXCEL_EPOCH = dt.datetime(1899, 12, 30)
+
+
+def _ensuciar(rng: np.random.Generator, s: str) -> str:
+    """Una variante más sucia de s: mayúsculas, espacios, NBSP, sin tildes."""
+    r = rng.random()
+    if r < 0.2:
+        s = s.upper()
+    elif r < 0.35:
+        s = s.lower()
+    if rng.random() < 0.3:
+        s = s + rng.choice([" ", "  ", NBSP])
+    if rng.random() < 0.15:
+        s = rng.choice([" ", NBSP]) + s
+    if rng.random() < 0.2:
+        s = s.replace("í", "i").replace("ó", "o").replace("é", "e").replace("á", "a")
+    return s
+
+
+def _pool_programa(rng: np.random.Generator, n_variantes: int) -> np.ndarray:
+    base = [v for fam in FAMILIAS_PROGRAMA for v in fam]
+    pool = base + [_ensuciar(rng, base[i]) for i in rng.integers(0, len(base), n_variantes)]
+    pool += PROGRAMA_NO_RECONOCIDO
+    return np.array(pool, dtype=object)
+
+
+def _columna_fecha(rng: np.random.Generator, filas: int) -> np.ndarray:
+    dias = rng.integers(0, 3 * 365, filas)
+    base = np.datetime64("2024-01-01") + dias.astype("timedelta64[D]")
+    py = base.astype(dt.datetime)  # dt.date
+    tipo = rng.random(filas)
+    out = np.empty(filas, dtype=object)
+    for i in range(filas):
+        d = py[i]
+        t = tipo[i]
+        if t < 0.35:
+            out[i] = f"{d.day:02d}/{d.month:02d}/{d.year}"              # día primero (CO)
+        elif t < 0.55:
+            out[i] = d.isoformat()
+        elif t < 0.80:
+            out[i] = dt.datetime(d.year, d.month, d.day)                # celda fecha de Excel
+        elif t < 0.90:
+            out[i] = (dt.datetime(d.year, d.month, d.day) - EXCEL_EPOCH).days  # serial
+        elif t < 0.95:
+            out[i] = FECHA_BASURA[i % len(FECHA_BASURA)]
+        else:
+            out[i] = None
+    return out
+
+
+def columnas_intake(
+    filas: int,
+    columnas_extra: int = 20,
+    seed: int = 0,
+    pct_ruido_fu: float = 0.03,
+    pct_na_fu: float = 0.02,
+    duplicados: bool = True,
+) -> list[tuple[str, np.ndarray]]:
+    """
+    Columnas crudas (header, valores object) en el orden del libro. Valores
+    Python (float, int, str, datetime, None) como los guarda una celda.
+    """
+    rng = np.random.default_rng(seed)
+
+    ids = rng.integers(10**6, 10**10, filas).astype(float).astype(object)
+    r = rng.random(filas)
+    txt = r < 0.05
+    ids[txt] = [f" {int(v):,} ".replace(",", ".") for v in ids[txt]]  # " 1.234.567 "
+    ids[r > 0.99] = None
+
+    programas = _pool_programa(rng, n_variantes=400)
+    prog = programas[rng.integers(0, len(programas), filas)]
+    prog[rng.random(filas) < 0.02] = None
+
+    cols: list[tuple[str, np.ndarray]] = [
+        ("ID", ids),
+        (f"Programa{NBSP}", prog),
+        ("Fecha", _columna_fecha(rng, filas)),
+    ]
+
+    ruido = np.array(RUIDO_FU, dtype=object)
+    for c in FU_COLS:
+        vals = rng.integers(0, 100, filas).astype(object)
+        r = rng.random(filas)
+        sucio = r < pct_ruido_fu
+        vals[sucio] = ruido[rng.integers(0, len(ruido), int(sucio.sum()))]
+        vals[r > 1 - pct_na_fu] = None
+        cols.append((c.replace("_", " ").title() if rng.random() < 0.5 else c, vals))
+
+    textos = np.array(TEXTOS_EXTRA + [None], dtype=object)
+    for i in range(columnas_extra):
+        header = f"Extra {i}"
+        if duplicados and i == 1:
+            header = "Observaciones"
+        elif duplicados and i == 2:
+            header = f"OBSERVACIONES{NBSP}"  # colisiona con la anterior al normalizar
+        cols.append((header, textos[rng.integers(0, len(textos), filas)]))
+    return cols
+
+
+def frame_intake(filas: int, columnas_extra: int = 20, seed: int = 0, **kw) -> pd.DataFrame:
+    """
+    El intake como lo devuelve pd.read_excel (mismo TextParser: NA por texto,
+    inferencia numérica, dtypes), sin pasar por el .xlsx.
+    """
+    from pandas.io.parsers import TextParser
+
+    cols = columnas_intake(filas, columnas_extra, seed, **kw)
+    filas_celdas = [[h for h, _ in cols]]
+    filas_celdas += [[_celda(x) for x in f] for f in zip(*(v for _, v in cols))]
+    return TextParser(filas_celdas, header=0).read()
+
+
+def _celda(x):
+    """Conversión del reader openpyxl de pandas: vacía -> "", 5.0 -> 5."""
+    if x is None:
+        return ""
+    if isinstance(x, float) and x.is_integer():
+        return int(x)
+    return x
+
+
+def escribir_intake(path: Path, filas: int, columnas_extra: int = 20, seed: int = 0, **kw) -> None:
+    """El intake como libro .xlsx (una hoja 'Hoja1')."""
+    from openpyxl import Workbook
+
+    cols = columnas_intake(filas, columnas_extra, seed, **kw)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Hoja1")
+    ws.append([h for h, _ in cols])
+    for fila in zip(*(v for _, v in cols)):
+        ws.append(fila)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(path)
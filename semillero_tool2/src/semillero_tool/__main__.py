@@ -4,7 +4,10 @@ from pathlib import Path
 from .cli import parse_args
 from .config import VERSION
 from .errors import SemilleroToolError
-from .pipeline import RunConfig, run
+
+# pipeline / batch (pandas, numpy, pyarrow: ~0.5 s) se importan recién
+# después de argparse: --version, --help y errores de argumentos no los pagan.
+# tests/test_arranque.py vigila que siga así.
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -15,9 +18,11 @@ def main(argv: list[str] | None = None) -> int:
         print(VERSION)
         return 0
 
+    from .pipeline import RunConfig, ejecutar
+
     try:
         cfg = RunConfig(
-            input_path=Path(args.input).expanduser(),
+            input_path=Path(args.input or "").expanduser(),
             output_path=Path(args.output).expanduser(),
             sheet=args.sheet,
 
@@ -32,9 +37,29 @@ def main(argv: list[str] | None = None) -> int:
 
             drop_missing_mode=str(getattr(args, "drop_missing_mode", "none")),
             critical_cols_csv=getattr(args, "critical_cols", None),
+
+            lector_excel=str(getattr(args, "lector_excel", "pandas")),
+            filas_por_bloque=getattr(args, "filas_por_bloque", None),
+            formato_salida=str(getattr(args, "formato", "xlsx")),
+            usar_cache=not getattr(args, "no_cache", False),
+            perfil=getattr(args, "profile", None),
+            estadisticas=bool(getattr(args, "estadisticas", False)),
+            mediana=str(getattr(args, "mediana", "exacta")),
+            hojas=_hojas(getattr(args, "hojas", None)),
+            libros_extra=tuple(Path(x).expanduser() for x in (getattr(args, "libros_extra", None) or [])),
+            workers_lectura=None if args.batch else getattr(args, "workers", None),
+            dedup_ids=getattr(args, "dedup_ids", None),
+            indice_ids=Path(args.indice_ids).expanduser() if getattr(args, "indice_ids", None) else None,
+            historial=Path(args.historial).expanduser() if getattr(args, "historial", None) else None,
+            solo_columnas_usadas=bool(getattr(args, "solo_columnas_usadas", False)),
+            conservar_columnas=tuple(c.strip() for c in (getattr(args, "conservar_columnas", None) or "").split(",")
+                                     if c.strip()),
         )
 
-        df = run(cfg)
+        if args.batch:
+            return _main_batch(args, cfg)
+
+        n_filas, n_columnas = ejecutar(cfg)
 
     except SemilleroToolError as e:
         print(f"[ERROR] {e}", file=sys.stderr)
@@ -44,9 +69,34 @@ def main(argv: list[str] | None = None) -> int:
         return 3
 
     print(f"[OK] Output escrito en: {cfg.output_path}")
-    print(f"[OK] Filas: {len(df)} | Columnas: {len(df.columns)}")
+    print(f"[OK] Filas: {n_filas} | Columnas: {n_columnas}")
     return 0
 
 
+def _hojas(csv: str | None) -> tuple[str, ...] | None:
+    """--hojas "A, B" -> ("A", "B"); "*" -> ("*",)."""
+    if csv is None:
+        return None
+    return tuple(h.strip() for h in csv.split(",") if h.strip())
+
+
+def _main_batch(args, base) -> int:
+    """--batch: un run por archivo (pool de procesos) + manifest.json en -o."""
+    from .batch import MANIFEST, codigo_salida, resolver_entradas, run_batch
+
+    entradas = resolver_entradas(args.batch)
+
+    def reportar(r) -> None:
+        if r.estado == "ok":
+            print(f"[OK] {r.input} -> {r.output} | Filas: {r.filas} | {r.segundos:.1f} s")
+        else:
+            print(f"[{r.estado.upper()}] {r.input}: {r.error}", file=sys.stderr)
+
+    resultados = run_batch(entradas, base.output_path, base, workers=args.workers, al_terminar=reportar)
+    n_ok = sum(r.estado == "ok" for r in resultados)
+    print(f"[OK] Batch: {n_ok}/{len(resultados)} archivos ok | manifest: {base.output_path / MANIFEST}")
+    return codigo_salida(resultados)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import FU_COLS, PERCENTILES_FU
+from .errors import ConfigError
+from .estadisticas import (
+    COLUMNAS_GENERAL,
+    COLUMNAS_X_PROGRAMA,
+    columna_programa,
+    nombre_percentil,
+    reducir_por_grupo,
+)
+from .fu import MatrizFU, validate_fu_schema
+
+
+# ============================================================
+# ACUMULADORES DE ESTADÍSTICAS (FU_COLS x PROGRAMA)
+# ------------------------------------------------------------
+# Las hojas GENERAL / X_PROGRAMA sin tener todo el df en memoria:
+# - agregar(df) por bloque / por archivo; combinar(otro) entre archivos o
+#   procesos; guardar / cargar en disco (pickle).
+# - N, media y desvío: momentos de Welford por (programa, variable),
+#   combinados con la fórmula de Chan (exactos salvo redondeo).
+# - MIN / MAX: exactos.
+# - Mediana y percentiles, según el modo:
+#     exacta     -> guarda los valores F..U (16 floats por fila) y reduce al
+#                   final: mismo resultado que estadisticas.central_*
+#     aproximada -> un sketch KLL por (programa, variable), memoria acotada
+#                   (~3*k valores) y error de rango ~1-2 % con k=200
+# ============================================================
+
+MODOS_MEDIANA = ("exacta", "aproximada")
+
+# Tamaño del sketch KLL: más grande = más preciso y más pesado.
+K_SKETCH = 200
+
+_VERSION = 1
+
+
+class SketchKLL:
+    """
+    Sketch de cuantiles KLL determinista (sin azar: el offset de cada
+    compactación alterna). Nivel h guarda valores de peso 2**h; cuando un
+    nivel se llena se ordena y la mitad sube al siguiente. Mergeable:
+    combinar() une nivel a nivel y vuelve a compactar.
+    """
+
+    def __init__(self, k: int = K_SKETCH):
+        if k < 2:
+            raise ValueError(f"k inválido: {k}")
+        self.k = k
+        self.n = 0
+        self.niveles: list[np.ndarray] = [np.empty(0)]
+        self._offset: list[int] = [0]
+
+    def _capacidad(self, h: int) -> int:
+        return max(2, int(np.ceil(self.k * (2 / 3) ** (len(self.niveles) - 1 - h))))
+
+    def _compactar(self) -> None:
+        h = 0
+        while h < len(self.niveles):
+            nivel = self.niveles[h]
+            if len(nivel) <= self._capacidad(h):
+                h += 1
+                continue
+            if h + 1 == len(self.niveles):
+                self.niveles.append(np.empty(0))
+                self._offset.append(0)
+            nivel = np.sort(nivel)
+            impar = len(nivel) % 2  # un valor queda en el nivel (el peso total no cambia)
+            sube = nivel[impar:][self._offset[h]::2]
+            self._offset[h] ^= 1
+            self.niveles[h] = nivel[:impar]
+            self.niveles[h + 1] = np.concatenate([self.niveles[h + 1], sube])
+            h = 0  # con un nivel más, las capacidades de abajo bajan
+
+    def agregar(self, valores: np.ndarray) -> None:
+        if len(valores) == 0:
+            return
+        self.n += len(valores)
+        self.niveles[0] = np.concatenate([self.niveles[0], valores])
+        self._compactar()
+
+    def combinar(self, otro: SketchKLL) -> None:
+        while len(self.niveles) < len(otro.niveles):
+            self.niveles.append(np.empty(0))
+            self._offset.append(0)
+        for h, nivel in enumerate(otro.niveles):
+            self.niveles[h] = np.concatenate([self.niveles[h], nivel])
+        self.n += otro.n
+        self._compactar()
+
+    def cuantil(self, q: float) -> float:
+        """Cuantil q (0..1). Sin compactaciones todavía: exacto (interpolación lineal)."""
+        if self.n == 0:
+            return np.nan
+        if len(self.niveles) == 1:
+            return float(np.quantile(self.niveles[0], q))
+        valores = np.concatenate(self.niveles)
+        pesos = np.concatenate([np.full(len(v), 2.0 ** h) for h, v in enumerate(self.niveles)])
+        orden = np.argsort(valores, kind="stable")
+        acumulado = np.cumsum(pesos[orden])
+        i = int(np.searchsorted(acumulado, q * acumulado[-1], side="left"))
+        return float(valores[orden][min(i, len(valores) - 1)])
+
+
+class _Momentos:
+    """N, media, SS (suma de cuadrados de desvíos), MIN y MAX por (grupo, variable)."""
+
+    def __init__(self, n_grupos: int = 0):
+        forma = (n_grupos, len(FU_COLS))
+        self.n = np.zeros(forma, dtype=np.int64)
+        self.media = np.zeros(forma)
+        self.ss = np.zeros(forma)
+        self.minimo = np.full(forma, np.nan)
+        self.maximo = np.full(forma, np.nan)
+
+    def crecer(self, n_grupos: int) -> None:
+        extra = n_grupos - self.n.shape[0]
+        if extra <= 0:
+            return
+        forma = (extra, len(FU_COLS))
+        self.n = np.vstack([self.n, np.zeros(forma, dtype=np.int64)])
+        self.media = np.vstack([self.media, np.zeros(forma)])
+        self.ss = np.vstack([self.ss, np.zeros(forma)])
+        self.minimo = np.vstack([self.minimo, np.full(forma, np.nan)])
+        self.maximo = np.vstack([self.maximo, np.full(forma, np.nan)])
+
+    def combinar(self, filas: np.ndarray, n, media, ss, minimo, maximo) -> None:
+        """Chan et al.: suma los momentos (n, media, ss) en las filas dadas."""
+        na = self.n[filas]
+        total = na + n
+        con = total > 0
+        delta = np.where(con, media - self.media[filas], 0.0)
+        peso = np.divide(n, total, out=np.zeros(total.shape), where=con)
+        self.media[filas] = np.where(n > 0, self.media[filas] + delta * peso, self.media[filas])
+        self.ss[filas] = self.ss[filas] + np.where(n > 0, ss + delta * delta * na * peso, 0.0)
+        self.n[filas] = total
+        self.minimo[filas] = np.fmin(self.minimo[filas], minimo)
+        self.maximo[filas] = np.fmax(self.maximo[filas], maximo)
+
+    def tabla(self) -> dict[str, np.ndarray]:
+        n = self.n
+        media = np.where(n > 0, self.media, np.nan)
+        desvio = np.sqrt(np.divide(self.ss, n - 1, out=np.full(n.shape, np.nan), where=n > 1))
+        return {"N": n, "MEDIA": media, "DESV_EST": desvio, "MIN": self.minimo, "MAX": self.maximo}
+
+
+def _remapear(codigos: np.ndarray, mapa: np.ndarray) -> np.ndarray:
+    """Códigos locales -> globales (-1 = sin programa se mantiene)."""
+    out = np.full(len(codigos), -1, dtype=np.int64)
+    con = codigos >= 0
+    out[con] = mapa[codigos[con]]
+    return out
+
+
+class AcumuladorFU:
+    """
+    Estadísticas de FU_COLS acumuladas por bloques, global y por programa.
+
+        acum = AcumuladorFU("aproximada")
+        for bloque in bloques:
+            acum.agregar(bloque)
+        acum.combinar(AcumuladorFU.cargar(otro_archivo))
+        general, por_programa = acum.general(), acum.por_programa()
+
+    El grupo de cada fila es PROGRAMA_CANON (o PROGRAMA); filas sin programa
+    cuentan en GENERAL y no en X_PROGRAMA, como estadisticas.central_*.
+    """
+
+    def __init__(self, modo: str = "exacta", k: int = K_SKETCH):
+        if modo not in MODOS_MEDIANA:
+            raise ConfigError(f"modo de mediana inválido: {modo}")
+        self.modo = modo
+        self.k = k
+        self.programas: list = []
+        self._indice: dict = {}
+        self._filas = 0
+        self._general = _Momentos(1)
+        self._grupos = _Momentos(0)
+        # exacta: trozos (códigos de programa globales, valores F..U)
+        self._trozos: list[tuple[np.ndarray, np.ndarray]] = []
+        # aproximada: un sketch por variable (general) y por (programa, variable)
+        self._sketch_general = [SketchKLL(k) for _ in FU_COLS]
+        self._sketches: list[list[SketchKLL]] = []
+
+    def __len__(self) -> int:
+        """Filas acumuladas."""
+        return self._filas
+
+    def _codigos(self, programas) -> np.ndarray:
+        """Índice global de cada programa (los nuevos se agregan al final)."""
+        nuevos = [p for p in programas if p not in self._indice]
+        for p in nuevos:
+            self._indice[p] = len(self.programas)
+            self.programas.append(p)
+            self._sketches.append([SketchKLL(self.k) for _ in FU_COLS])
+        self._grupos.crecer(len(self.programas))
+        return np.array([self._indice[p] for p in programas], dtype=np.int64)
+
+    def agregar(self, df: pd.DataFrame, col: str | None = None) -> None:
+        """Suma un bloque de filas. Requiere las columnas FU_COLS (ya numéricas)."""
+        validate_fu_schema(df)
+        col = col or columna_programa(df)
+        valores = MatrizFU.desde_df(df).valores
+        if col is None:
+            locales, programas = np.full(len(df), -1, dtype=np.int64), []
+        else:
+            locales, programas = pd.factorize(df[col])  # NA -> -1
+        globales = self._codigos(list(programas))
+        con_programa = locales >= 0
+        self._filas += len(df)
+
+        if self.modo == "exacta":
+            self._trozos.append((_remapear(locales, globales), np.ascontiguousarray(valores)))
+            return
+
+        self._sumar_momentos(self._general, np.zeros(1, dtype=np.int64), valores, np.zeros(len(df), np.int64), 1)
+        self._sumar_momentos(self._grupos, globales, valores[con_programa], locales[con_programa], len(programas))
+        for j in range(len(FU_COLS)):
+            v = valores[:, j]
+            ok = ~np.isnan(v)
+            self._sketch_general[j].agregar(v[ok])
+            g, x = locales[ok & con_programa], v[ok & con_programa]
+            orden = np.argsort(g, kind="stable")
+            cortes = np.cumsum(np.bincount(g, minlength=len(programas)))[:-1]
+            for i, trozo in enumerate(np.split(x[orden], cortes)):
+                if len(trozo):
+                    self._sketches[globales[i]][j].agregar(trozo)
+
+    @staticmethod
+    def _sumar_momentos(destino: _Momentos, filas, valores, codigos, n_grupos) -> None:
+        if n_grupos == 0:
+            return
+        r = reducir_por_grupo(valores, codigos, n_grupos, percentiles=False)
+        destino.combinar(filas, r["N"], np.nan_to_num(r["MEDIA"]), r["SS"], r["MIN"], r["MAX"])
+
+    def combinar(self, otro: AcumuladorFU) -> AcumuladorFU:
+        """Suma otro acumulador (mismo modo) a este. Devuelve self."""
+        if otro.modo != self.modo:
+            raise ConfigError(f"No se combinan acumuladores de mediana {self.modo} y {otro.modo}.")
+        mapa = self._codigos(otro.programas)
+        self._filas += otro._filas
+        if self.modo == "exacta":
+            for codigos, valores in otro._trozos:
+                self._trozos.append((_remapear(codigos, mapa), valores))
+            return self
+
+        t = otro._general
+        self._general.combinar(np.zeros(1, dtype=np.int64), t.n, t.media, t.ss, t.minimo, t.maximo)
+        t = otro._grupos
+        self._grupos.combinar(mapa, t.n, t.media, t.ss, t.minimo, t.maximo)
+        for j in range(len(FU_COLS)):
+            self._sketch_general[j].combinar(otro._sketch_general[j])
+        for i, sketches in enumerate(otro._sketches):
+            for j, s in enumerate(sketches):
+                self._sketches[mapa[i]][j].combinar(s)
+        return self
+
+    # -------------------------
+    # Resultados
+    # -------------------------
+
+    def _exactas(self, general: bool) -> dict[str, np.ndarray]:
+        codigos = np.concatenate([c for c, _ in self._trozos]) if self._trozos else np.empty(0, np.int64)
+        valores = (
+            np.concatenate([v for _, v in self._trozos]) if self._trozos else np.empty((0, len(FU_COLS)))
+        )
+        if general:
+            return reducir_por_grupo(valores, np.zeros(len(codigos), dtype=np.int64), 1)
+        con = codigos >= 0
+        return reducir_por_grupo(valores[con], codigos[con], len(self.programas))
+
+    def _aproximadas(self, momentos: _Momentos, sketches: list[list[SketchKLL]]) -> dict[str, np.ndarray]:
+        out = momentos.tabla()
+        for p in sorted({50, *PERCENTILES_FU}):
+            out[nombre_percentil(p)] = np.array(
+                [[s.cuantil(p / 100) for s in fila] for fila in sketches], dtype=float,
+            ).reshape(len(sketches), len(FU_COLS))
+        return out
+
+    def general(self) -> pd.DataFrame:
+        """Hoja GENERAL (mismas columnas que estadisticas.central_general)."""
+        stats = self._exactas(True) if self.modo == "exacta" else self._aproximadas(
+            self._general, [self._sketch_general]
+        )
+        return pd.DataFrame({"VARIABLE": FU_COLS, **{c: a.reshape(-1) for c, a in stats.items()}},
+                            columns=COLUMNAS_GENERAL)
+
+    def por_programa(self) -> pd.DataFrame:
+        """Hoja X_PROGRAMA (programas en orden alfabético, como central_por_programa)."""
+        stats = self._exactas(False) if self.modo == "exacta" else self._aproximadas(self._grupos, self._sketches)
+        orden = np.asarray(pd.Index(self.programas, dtype=object).argsort(), dtype=np.int64)
+        programas = np.asarray(self.programas, dtype=object)[orden] if len(orden) else np.empty(0, dtype=object)
+        return pd.DataFrame({
+            "PROGRAMA": np.repeat(programas, len(FU_COLS)),
+            "VARIABLE": np.tile(np.asarray(FU_COLS, dtype=object), len(orden)),
+            **{c: a[orden].reshape(-1) for c, a in stats.items()},
+        }, columns=COLUMNAS_X_PROGRAMA)
+
+    # -------------------------
+    # Disco
+    # -------------------------
+
+    def guardar(self, path: Path) -> None:
+        """Pickle con escritura atómica (tmp por proceso + replace)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump((_VERSION, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    @classmethod
+    def cargar(cls, path: Path) -> AcumuladorFU:
+        try:
+            with open(path, "rb") as f:
+                version, acum = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError) as e:
+            raise ConfigError(f"Acumulador ilegible: {path} ({e})") from e
+        if version != _VERSION or not isinstance(acum, cls):
+            raise ConfigError(f"Acumulador de otra versión: {path}")
+        return acum
+
+
+def combinar_archivos(paths: list[Path]) -> AcumuladorFU:
+    """Carga y combina acumuladores guardados (p.ej. uno por archivo del batch)."""
+    if not paths:
+        raise ConfigError("Sin acumuladores para combinar.")
+    acum = AcumuladorFU.cargar(paths[0])
+    for p in paths[1:]:
+        acum.combinar(AcumuladorFU.cargar(p))
+    return acum
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from pathlib import Path
+
+from .acumuladores import combinar_archivos
+from .errors import ConfigError, SemilleroToolError
+from .io_csv import SUFIJOS_CSV
+from .io_salida import escribir_reportes
+from .pipeline import RunConfig, validar_config, ejecutar
+from .programa import abrir_modelo_programa
+
+
+# ============================================================
+# BATCH: un directorio / glob de libros, un proceso por archivo
+# ------------------------------------------------------------
+# - Cada archivo corre el mismo pipeline (misma config) en un pool de procesos.
+# - Fallas aisladas por archivo: SemilleroToolError -> "error" (código 2),
+#   cualquier otra excepción -> "fatal" (código 3), igual que el CLI.
+# - El modelo de canonización de PROGRAMA se compila antes de abrir el pool.
+# - Manifest JSON consolidado (filas, columnas, tiempos y estado por archivo).
+# - Con estadisticas: cada run guarda su AcumuladorFU en acumuladores/ y al
+#   final se combinan los de archivos ok en ESTADISTICAS_GLOBAL (sin releer
+#   ningún libro).
+# - Con indice_ids (dedup.py): en serie y en orden de nombre, cada archivo
+#   contra las cohortes anteriores.
+# - Con historial (historial.py): cada archivo publica su cohorte con su
+#   propio manifiesto, así que el pool sigue en paralelo.
+# ============================================================
+
+MANIFEST = "manifest.json"
+SUFIJO_SALIDA = "_LIMPIO"
+DIR_ACUMULADORES = "acumuladores"
+ESTADISTICAS_GLOBAL = "ESTADISTICAS_GLOBAL"
+
+
+@dataclass(frozen=True)
+class ResultadoArchivo:
+    input: str
+    output: str
+    estado: str           # ok | error | fatal
+    codigo: int           # 0 | 2 | 3 (mismos exit codes del CLI)
+    filas: int | None
+    columnas: int | None
+    segundos: float
+    error: str | None = None
+
+
+def resolver_entradas(patron: str) -> list[Path]:
+    """
+    Archivos del batch:
+    - archivo existente -> ese archivo (nombres con [ ] no se tratan como glob)
+    - directorio -> sus .xlsx / .csv / .tsv (sin recursión; ignora lockfiles '~$' de Excel)
+    - si no, glob (acepta ** recursivo), con el mismo filtro de extensiones
+    """
+    p = Path(patron).expanduser()
+    if p.is_file():
+        archivos = [p]
+    else:
+        candidatos = p.iterdir() if p.is_dir() else map(Path, glob.glob(str(p), recursive=True))
+        archivos = [x for x in candidatos if x.suffix.lower() in (".xlsx", *SUFIJOS_CSV) and x.is_file()]
+
+    archivos = sorted(x for x in archivos if not x.name.startswith("~$"))
+    if not archivos:
+        raise ConfigError(f"Batch sin archivos de entrada: {patron}")
+
+    stems = [x.stem for x in archivos]
+    repetidos = sorted({s for s in stems if stems.count(s) > 1})
+    if repetidos:
+        # Mismo nombre en carpetas distintas -> mismo output: ambiguo.
+        raise ConfigError(f"Batch con nombres de archivo repetidos: {repetidos}")
+    return archivos
+
+
+def salida_para(entrada: Path, output_dir: Path, formato: str) -> Path:
+    nombre = entrada.stem + SUFIJO_SALIDA
+    return output_dir / (nombre + ".xlsx" if formato == "xlsx" else nombre)
+
+
+def procesar_archivo(cfg: RunConfig) -> ResultadoArchivo:
+    """Corre un archivo y nunca lanza: la falla queda en el resultado."""
+    t0 = time.perf_counter()
+    filas = columnas = None
+    try:
+        filas, columnas = ejecutar(cfg)
+        estado, codigo, error = "ok", 0, None
+    except SemilleroToolError as e:
+        estado, codigo, error = "error", 2, str(e)
+    except Exception as e:
+        estado, codigo, error = "fatal", 3, f"{type(e).__name__}: {e}"
+    return ResultadoArchivo(
+        input=str(cfg.input_path),
+        output=str(cfg.output_path),
+        estado=estado,
+        codigo=codigo,
+        filas=filas,
+        columnas=columnas,
+        segundos=round(time.perf_counter() - t0, 3),
+        error=error,
+    )
+
+
+def run_batch(
+    entradas: list[Path],
+    output_dir: Path,
+    base: RunConfig,
+    workers: int | None = None,
+    al_terminar=None,
+) -> list[ResultadoArchivo]:
+    """
+    Corre el pipeline para cada entrada con la config base (input/output
+    reemplazados) y escribe output_dir/manifest.json.
+    workers: procesos (default: CPUs); 1 = secuencial en este proceso.
+    al_terminar(resultado): callback opcional a medida que termina cada archivo.
+    Devuelve los resultados en el orden de entradas.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ConfigError(f"workers debe ser >= 1: {workers}")
+    if base.indice_ids is not None:
+        # Cada archivo se compara con los anteriores (orden de entradas): en
+        # paralelo, el resultado dependería de cuál termina primero.
+        workers = 1
+    # Config inválida: un solo ConfigError, no uno por archivo.
+    validar_config(base)
+    if base.canonizar_programa and base.usar_cache:
+        # Modelo de canonización compilado una vez: los workers lo cargan.
+        abrir_modelo_programa()
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cfgs = [
+        replace(
+            base,
+            input_path=e,
+            output_path=salida_para(e, output_dir, base.formato_salida),
+            acumulador_path=(output_dir / DIR_ACUMULADORES / f"{e.stem}.acum") if base.estadisticas else None,
+            # Ya hay un proceso por archivo: las hojas de cada uno se leen en serie.
+            workers_lectura=1 if workers > 1 else base.workers_lectura,
+        )
+        for e in entradas
+    ]
+
+    inicio = datetime.now().isoformat(timespec="seconds")
+    t0 = time.perf_counter()
+    resultados: dict[int, ResultadoArchivo] = {}
+
+    if workers == 1 or len(cfgs) == 1:
+        for i, cfg in enumerate(cfgs):
+            resultados[i] = procesar_archivo(cfg)
+            if al_terminar:
+                al_terminar(resultados[i])
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(cfgs))) as pool:
+            futuros = {pool.submit(procesar_archivo, cfg): i for i, cfg in enumerate(cfgs)}
+            for fut in as_completed(futuros):
+                i = futuros[fut]
+                try:
+                    resultados[i] = fut.result()
+                except Exception as e:
+                    # El worker murió (p.ej. sin memoria): BrokenProcessPool.
+                    cfg = cfgs[i]
+                    resultados[i] = ResultadoArchivo(
+                        input=str(cfg.input_path), output=str(cfg.output_path), estado="fatal",
+                        codigo=3, filas=None, columnas=None, segundos=0.0,
+                        error=f"{type(e).__name__}: {e}",
+                    )
+                if al_terminar:
+                    al_terminar(resultados[i])
+
+    ordenados = [resultados[i] for i in range(len(cfgs))]
+    estadisticas = None
+    acumuladores = [c.acumulador_path for c, r in zip(cfgs, ordenados) if r.estado == "ok"]
+    if base.estadisticas and acumuladores:
+        estadisticas = escribir_estadisticas_global(output_dir, base.formato_salida, acumuladores)
+    escribir_manifest(output_dir / MANIFEST, ordenados, inicio, time.perf_counter() - t0, workers, estadisticas)
+    return ordenados
+
+
+def escribir_estadisticas_global(output_dir: Path, formato: str, acumuladores: list[Path]) -> Path:
+    """GENERAL / X_PROGRAMA de todos los archivos juntos (combinando acumuladores)."""
+    acum = combinar_archivos(acumuladores)
+    path = output_dir / (ESTADISTICAS_GLOBAL + ".xlsx" if formato == "xlsx" else ESTADISTICAS_GLOBAL)
+    escribir_reportes(path, formato, {"GENERAL": acum.general(), "X_PROGRAMA": acum.por_programa()})
+    return path
+
+
+def escribir_manifest(
+    path: Path,
+    resultados: list[ResultadoArchivo],
+    inicio: str,
+    segundos: float,
+    workers: int,
+    estadisticas: Path | None = None,
+) -> None:
+    payload = {
+        "inicio": inicio,
+        "segundos": round(segundos, 3),
+        "workers": workers,
+        "estadisticas": str(estadisticas) if estadisticas is not None else None,
+        "resumen": {
+            "archivos": len(resultados),
+            "ok": sum(r.estado == "ok" for r in resultados),
+            "error": sum(r.estado == "error" for r in resultados),
+            "fatal": sum(r.estado == "fatal" for r in resultados),
+            "filas": sum(r.filas or 0 for r in resultados),
+        },
+        "archivos": [asdict(r) for r in resultados],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+
+def codigo_salida(resultados: list[ResultadoArchivo]) -> int:
+    """Exit code del batch: 0 si todo ok; si no, el peor código por archivo."""
+    return max((r.codigo for r in resultados), default=0)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+
+
+# ============================================================
+# CACHÉ LOCAL (determinista, acotada, persistente)
+# ------------------------------------------------------------
+# - Toda entrada vive bajo una FIRMA (hash de las reglas que la produjeron).
+#   Si cambian las reglas, cambia la firma y la caché vieja se descarta entera.
+# - Acotada: LRU con máximo de entradas (no crece sin límite entre corridas).
+# - La caché es una optimización: si el archivo está corrupto o no se puede
+#   escribir, se sigue sin caché (el resultado no depende de ella).
+# ============================================================
+
+CACHE_DIR_ENV = "SEMILLERO_CACHE_DIR"
+CACHE_ETAPAS_MB_ENV = "SEMILLERO_CACHE_ETAPAS_MB"
+CACHE_ETAPAS_MB_DEFAULT = 2048
+
+
+def directorio_cache() -> Path:
+    """
+    Directorio base de cachés locales.
+    Prioridad: $SEMILLERO_CACHE_DIR > $XDG_CACHE_HOME/semillero_tool > ~/.cache/semillero_tool
+    """
+    env = os.environ.get(CACHE_DIR_ENV)
+    if env:
+        return Path(env).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "semillero_tool"
+
+
+def _canonico(obj):
+    """Forma serializable y estable (sets ordenados) para hashear tablas de reglas."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(_canonico(x) for x in obj)
+    if isinstance(obj, (list, tuple)):
+        return [_canonico(x) for x in obj]
+    if isinstance(obj, dict):
+        return {str(k): _canonico(v) for k, v in sorted(obj.items(), key=lambda kv: str(kv[0]))}
+    return obj
+
+
+def firma_tablas(*tablas) -> str:
+    """
+    Hash estable de tablas declarativas (listas, tuplas, sets, dicts, escalares).
+    No depende del orden de iteración de sets ni de PYTHONHASHSEED.
+    """
+    payload = json.dumps(_canonico(list(tablas)), ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class CacheLRU:
+    """
+    Diccionario LRU acotado, opcionalmente persistido en JSON.
+
+    - path=None  -> solo memoria (vive lo que vive el proceso).
+    - path=Path  -> se carga al construir y se escribe con guardar().
+    Claves: str. Valores: cualquier cosa serializable a JSON.
+    """
+
+    def __init__(self, path: Path | None, firma: str, max_entradas: int = 50_000):
+        if max_entradas <= 0:
+            raise ValueError(f"max_entradas inválido: {max_entradas}")
+        self.path = path
+        self.firma = firma
+        self.max_entradas = max_entradas
+        self._datos: OrderedDict[str, object] = OrderedDict()
+        self._sucio = False
+        if path is not None:
+            self._cargar()
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+    def __contains__(self, clave: str) -> bool:
+        return clave in self._datos
+
+    def get(self, clave: str, default=None):
+        if clave not in self._datos:
+            return default
+        self._datos.move_to_end(clave)
+        return self._datos[clave]
+
+    def put(self, clave: str, valor) -> None:
+        self._datos[clave] = valor
+        self._datos.move_to_end(clave)
+        while len(self._datos) > self.max_entradas:
+            self._datos.popitem(last=False)
+        self._sucio = True
+
+    def _cargar(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(raw, dict) or raw.get("firma") != self.firma:
+            # Reglas distintas -> caché inválida completa (no se mezclan resultados).
+            return
+
+        entradas = raw.get("entradas") or []
+        for item in entradas[-self.max_entradas:]:
+            if isinstance(item, list) and len(item) == 2:
+                self._datos[str(item[0])] = item[1]
+
+    def guardar(self) -> None:
+        """
+        Escritura atómica (tmp + replace). Solo escribe si hubo cambios.
+        El tmp es por proceso: varias corridas en paralelo (batch) no se pisan
+        el archivo a medio escribir; gana la última que reemplaza.
+        """
+        if self.path is None or not self._sucio:
+            return
+        payload = {
+            "firma": self.firma,
+            "entradas": [[k, v] for k, v in self._datos.items()],
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            # Caché no escribible (p.ej. FS de solo lectura): se sigue sin persistir.
+            tmp.unlink(missing_ok=True)
+            return
+        self._sucio = False
+
+
+def hash_archivo(path: Path) -> str:
+    """sha256 del contenido (no de la ruta ni del mtime): mismo libro -> misma clave."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for bloque in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def firma_codigo() -> str:
+    """
+    Hash del código del paquete + versiones de pandas/numpy. Un checkpoint
+    solo vale para el código que lo produjo (reglas, etapas, dtypes).
+    """
+    import numpy as np
+    import pandas as pd
+
+    h = hashlib.sha256(f"{pd.__version__}|{np.__version__}".encode())
+    for py in sorted(Path(__file__).parent.glob("*.py")):
+        h.update(py.name.encode())
+        h.update(py.read_bytes())
+    return h.hexdigest()[:16]
+
+
+class CacheEtapas:
+    """
+    Checkpoints de etapas en disco: un pickle por clave.
+
+    - La clave la arma el llamador (hash del input + parámetros de las etapas
+      hasta ese punto); acá solo se guarda / carga.
+    - Acotada por tamaño: al guardar se borran los checkpoints menos usados
+      (mtime; cargar() lo refresca) hasta quedar bajo max_bytes.
+    - Igual que CacheLRU: corrupta o no escribible -> se sigue sin caché.
+    """
+
+    def __init__(self, directorio: Path, max_bytes: int):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes inválido: {max_bytes}")
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+
+    def _path(self, clave: str) -> Path:
+        return self.directorio / f"{clave}.pkl"
+
+    def cargar(self, clave: str):
+        """Valor guardado o None (sin entrada / ilegible)."""
+        path = self._path(clave)
+        try:
+            with open(path, "rb") as f:
+                valor = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Pickle truncado / de otra versión: se descarta.
+            path.unlink(missing_ok=True)
+            return None
+        return valor
+
+    def guardar(self, clave: str, valor) -> None:
+        """Escritura atómica (tmp por proceso + replace) y poda por tamaño."""
+        path = self._path(clave)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directorio.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump(valor, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self._podar()
+
+    def _podar(self) -> None:
+        entradas = []
+        for path in self.directorio.glob("*.pkl"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:  # otro proceso la podó
+                continue
+            entradas.append((st.st_mtime, st.st_size, path))
+        total = sum(tam for _, tam, _ in entradas)
+        for _, tam, path in sorted(entradas, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= tam
+
+
+def abrir_cache_etapas(directorio: Path | None = None) -> CacheEtapas:
+    """
+    Checkpoints del pipeline en <directorio_cache()>/etapas.
+    Tope: $SEMILLERO_CACHE_ETAPAS_MB (default 2048 MB).
+    """
+    directorio = directorio if directorio is not None else directorio_cache() / "etapas"
+    mb = os.environ.get(CACHE_ETAPAS_MB_ENV)
+    try:
+        max_mb = float(mb) if mb else CACHE_ETAPAS_MB_DEFAULT
+    except ValueError:
+        max_mb = CACHE_ETAPAS_MB_DEFAULT
+    return CacheEtapas(directorio, max_bytes=max(1, int(max_mb * 2**20)))
@@ -9,13 +9,69 @@ def build_argparser() -> argparse.ArgumentParser:
     )
 
     p.add_argument("-i", "--input", required=False,
-                   help="Ruta del archivo Excel de entrada (.xlsx)")
+                   help="Ruta del archivo de entrada: Excel (.xlsx) o CSV / TSV (.csv, .tsv; encoding y "
+                        "delimitador detectados)")
     p.add_argument("-o", "--output", required=False,
-                   help="Ruta del archivo Excel de salida (.xlsx)")
+                   help="Ruta del archivo Excel de salida (.xlsx), o directorio si --formato no es xlsx")
     p.add_argument("--sheet", default=None,
                    help="Nombre de hoja a leer (default: primera hoja)")
+    p.add_argument("--hojas", default=None,
+                   help="Varias hojas del libro, en CSV (\"Ingenieria,Derecho\"), o \"*\" para todas. Se parsean "
+                        "en paralelo y se unen en un solo output con columnas SOURCE_FILE y SHEET; las hojas con "
+                        "otro header (normalizado) se omiten y se listan en REPORTE_HOJAS.")
+    p.add_argument("--libros-extra",
+                   nargs="+",
+                   default=None,
+                   metavar="XLSX",
+                   help="Más libros que se unen a -i (mismas hojas: --sheet / --hojas, o la primera).")
     p.add_argument("--version", action="store_true",
                    help="Imprime versión y sale")
+    p.add_argument("--lector-excel",
+                   default="pandas",
+                   choices=["pandas", "streaming"],
+                   help="Lector de Excel: pandas (default) | streaming (openpyxl read_only por bloques, "
+                        "para libros grandes; valida el header antes de leer el cuerpo).")
+    p.add_argument("--formato",
+                   default="xlsx",
+                   choices=["xlsx", "parquet", "feather", "csv"],
+                   help="Formato de salida: xlsx (default, libro con DATA + reportes) | parquet | feather | csv. "
+                        "Los no-xlsx escriben un directorio (-o) con un archivo por hoja; parquet/feather "
+                        "requieren pyarrow.")
+    p.add_argument("--filas-por-bloque",
+                   type=int,
+                   default=None,
+                   help="Procesa el archivo por bloques de N filas de punta a punta (lectura streaming, "
+                        "etapas y escritura), con memoria acotada. Mismo output que el modo en memoria.")
+    p.add_argument("--solo-columnas-usadas", action="store_true",
+                   help="Lee solo las columnas que usa el pipeline (IDs, F..U, PROGRAMA, FECHA y las críticas de "
+                        "--critical-cols); el resto no se carga ni sale en el output. Menos tiempo y memoria con "
+                        "hojas anchas (observaciones, columnas administrativas).")
+    p.add_argument("--conservar-columnas",
+                   default=None,
+                   metavar="CSV",
+                   help="Con --solo-columnas-usadas: columnas que igual se leen y pasan al output sin tocarlas "
+                        "(\"Edad,Sexo\"; se comparan normalizadas).")
+    p.add_argument("--batch",
+                   default=None,
+                   metavar="GLOB_O_DIR",
+                   help="Modo batch: procesa cada .xlsx / .csv del directorio (o del glob) con la misma config, en "
+                        "paralelo. -o es el directorio de salida (<nombre>_LIMPIO.xlsx por archivo + "
+                        "manifest.json). No se combina con -i.")
+    p.add_argument("--workers",
+                   type=int,
+                   default=None,
+                   help="Procesos en paralelo para --batch, o para leer las hojas de --hojas / --libros-extra "
+                        "(default: número de CPUs).")
+    p.add_argument("--no-cache", action="store_true",
+                   help="No lee ni escribe cachés en disco (checkpoints de etapas y canonización de PROGRAMA).")
+    p.add_argument("--profile",
+                   nargs="?",
+                   const="etapas",
+                   default=None,
+                   choices=["etapas", "cprofile", "tracemalloc"],
+                   help="Mide cada etapa (tiempo, CPU, filas, pico de memoria): hoja REPORTE_PERFORMANCE + "
+                        "<output>_PERFIL.json. 'cprofile' / 'tracemalloc' además envuelven la corrida y "
+                        "escriben los dumps crudos (.prof / .tracemalloc + resumen .txt).")
 
     # Strict mode
     p.add_argument("--strict-schema", action="store_true",
@@ -61,6 +117,48 @@ def build_argparser() -> argparse.ArgumentParser:
                    default=None,
                    help="Lista CSV de columnas críticas para drop-missing.")
 
+    # -----------------------------
+    # Duplicados de ID
+    # -----------------------------
+
+    p.add_argument("--dedup-ids",
+                   default=None,
+                   choices=["ultima_fecha", "mas_fu", "primero"],
+                   help="Una fila por persona (NROIDENTI / ID normalizado): se queda la de FECHA más reciente, "
+                        "la de más valores F..U o la primera. Las descartadas van a REPORTE_IDS_DUPLICADOS.")
+
+    p.add_argument("--indice-ids",
+                   default=None,
+                   metavar="DIR",
+                   help="Índice persistente de IDs (requiere --dedup-ids): compara también contra las cohortes "
+                        "ya procesadas y agrega esta (una por nombre de archivo; reprocesar la reemplaza).")
+
+    # -----------------------------
+    # Historial
+    # -----------------------------
+
+    p.add_argument("--historial",
+                   default=None,
+                   metavar="DIR",
+                   help="Agrega la DATA limpia a un historial local (Parquet particionado por período, requiere "
+                        "pyarrow), con el hash del input como clave: re-correr el mismo archivo reemplaza su "
+                        "cohorte. Se consulta con semillero_tool.historial.consultar().")
+
+    # -----------------------------
+    # Estadísticas
+    # -----------------------------
+
+    p.add_argument("--estadisticas", action="store_true",
+                   help="Agrega hojas GENERAL y X_PROGRAMA: N, media, desvío, mínimo, percentiles y máximo "
+                        "de F..U, global y por PROGRAMA_CANON (o PROGRAMA si no se canoniza). Con --batch "
+                        "además ESTADISTICAS_GLOBAL con todos los archivos combinados.")
+
+    p.add_argument("--mediana",
+                   default="exacta",
+                   choices=["exacta", "aproximada"],
+                   help="Mediana y percentiles de --estadisticas: exacta (default; guarda los F..U) | "
+                        "aproximada (sketch KLL por programa, memoria acotada, error de rango ~1 %%).")
+
     return p
 
 
@@ -73,9 +171,40 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         return args
 
     # I/O obligatorio
-    if not args.input or not args.output:
+    if args.batch:
+        if args.input:
+            ap.error("--batch no se combina con -i/--input")
+        if not args.output:
+            ap.error("--batch requiere -o/--output (directorio de salida)")
+    elif not args.input or not args.output:
         ap.error("Se requieren -i/--input y -o/--output (o usa --version).")
 
+    multi_hoja = args.hojas is not None or bool(args.libros_extra)
+
+    if args.workers is not None and not (args.batch or multi_hoja):
+        ap.error("--workers solo aplica con --batch, --hojas o --libros-extra")
+
+    if args.hojas is not None and args.sheet:
+        ap.error("--hojas no se combina con --sheet")
+
+    if args.libros_extra and args.batch:
+        ap.error("--libros-extra no se combina con --batch")
+
+    if multi_hoja and args.filas_por_bloque is not None:
+        ap.error("--filas-por-bloque lee una sola hoja (no se combina con --hojas / --libros-extra)")
+
+    if args.workers is not None and args.workers < 1:
+        ap.error("--workers debe ser >= 1")
+
+    if args.filas_por_bloque is not None and args.filas_por_bloque < 1:
+        ap.error("--filas-por-bloque debe ser >= 1")
+
+    if args.filas_por_bloque is not None and args.formato not in ("xlsx", "csv"):
+        ap.error("--filas-por-bloque solo escribe --formato xlsx o csv")
+
+    if args.conservar_columnas and not args.solo_columnas_usadas:
+        ap.error("--conservar-columnas requiere --solo-columnas-usadas")
+
     # -----------------------------
     # Validaciones FU deterministas
     # -----------------------------
@@ -96,6 +225,12 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     if args.reemplazar_programa and not args.canonizar_programa:
         ap.error("--reemplazar-programa requiere --canonizar-programa")
 
+    if args.indice_ids and not args.dedup_ids:
+        ap.error("--indice-ids requiere --dedup-ids")
+
+    if args.dedup_ids not in (None, "primero") and args.filas_por_bloque is not None:
+        ap.error("--filas-por-bloque solo deduplica con --dedup-ids primero")
+
     # -----------------------------
     # Validaciones coherencia global
     # -----------------------------
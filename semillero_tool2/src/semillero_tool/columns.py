@@ -33,12 +33,17 @@ def detect_duplicate_columns(df: pd.DataFrame) -> None:
         raise SchemaError(f"Columnas duplicadas detectadas en input: {dups}")
 
 
-def normalizar_columnas_suffix(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+def normalizar_columnas_suffix(
+    df: pd.DataFrame,
+    copiar: bool = True,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Normaliza columnas y resuelve duplicados por sufijo __{n} (legacy).
     Devuelve (df_normalizado, reporte_duplicados).
+    copiar=False renombra df in-place (el pipeline es dueño del frame).
     """
-    df = df.copy()
+    if copiar:
+        df = df.copy()
     original_cols = list(df.columns)
 
     normalized = [normalizar_columna(c) for c in original_cols]
@@ -13,6 +13,14 @@ VERSION = "0.3.0"
 # Columnas que tratamos como identificadores (forzamos string/strip)
 COLUMNAS_ID = {"ID", "NROIDENTI", "NROIDENTI_1", "NROIDENTI.1"}
 
+# Deduplicación de IDs (dedup.py): la primera de estas columnas presente es
+# la clave de la persona (en ese orden de preferencia).
+COLUMNAS_ID_DEDUP = ["NROIDENTI", "ID"]
+
+# Proyección de columnas (proyeccion.py, --solo-columnas-usadas): además de
+# IDs, F..U y las críticas del drop general, las que lee alguna etapa.
+COLUMNAS_USADAS = ["PROGRAMA", "FECHA"]
+
 # Bloque F..U (variables psicométricas core)
 FU_COLS = [
     "V", "E", "A", "CON", "R", "N", "M", "O",
@@ -26,6 +34,31 @@ FU_COLS = [
     "ANSIEDAD_A_LA_EVALUACION",
 ]
 
+# Rango válido (mínimo, máximo, inclusivos) de cada columna FU, heredado del
+# script original. Solo se audita (REPORTE_FU_RANGOS); no dropea filas.
+RANGOS_FU = {
+    "V": (0, 100), "E": (0, 100), "A": (0, 100),
+    "CON": (0, 100), "R": (0, 100),
+    "N": (0, 100), "M": (0, 100), "O": (0, 100),
+    "TOTAL_CAPACIDAD": (-200, 200),
+    "INTELIGENCIA_FLUIDA": (0, 200),
+    "INTELIGENCIA_CRISTALIZADA": (0, 200),
+    "MOTIVACION_SUPERFICIAL": (0, 100),
+    "MOTIVACION_PROFUNDA": (0, 100),
+    "MOTIVACION_DE_RENDIMIENTO": (0, 100),
+    "P._TOTAL_PROCRASTINACION": (0, 100),
+    "ANSIEDAD_A_LA_EVALUACION": (0, 100),
+}
+
+# Estadísticas descriptivas de FU (hojas GENERAL / X_PROGRAMA): percentiles
+# además de la mediana (interpolación lineal, como pandas.quantile).
+PERCENTILES_FU = (25, 75)
+
+# Entrada CSV / TSV (io_csv.py): delimitadores candidatos (ante empate gana
+# el primero) y encoding cuando el archivo no es UTF-8 válido.
+CSV_DELIMITADORES = [",", ";", "\t", "|"]
+CSV_ENCODING_ALTERNATIVO = "cp1252"
+
 # ============================================================
 # PROGRAMA: canonización determinista
 # ------------------------------------------------------------
@@ -174,4 +207,29 @@ PROGRAMA_ABREVIATURAS = [
     (r"\bnutricion\b", "nutricion"),
     (r"\bdietética\b", "dietetica"),
     (r"\bdietetica\b", "dietetica"),
-]
\ No newline at end of file
+]
+
+# ============================================================
+# FECHA: formatos conocidos (dates.normalizar_fechas_iso)
+# ------------------------------------------------------------
+# Se prueban en este orden sobre los textos que faltan por parsear (match
+# exacto, sin adivinar). Día primero: "12/03/2026" es 12 de marzo.
+# La etiqueta es el nombre de la columna N_<etiqueta> en REPORTE_FECHAS.
+# ============================================================
+FECHA_FORMATOS = [
+    ("AAAA-MM-DD", "%Y-%m-%d"),
+    ("DD/MM/AAAA", "%d/%m/%Y"),
+    ("DD-MM-AAAA", "%d-%m-%Y"),
+    ("DD.MM.AAAA", "%d.%m.%Y"),
+    ("AAAA/MM/DD", "%Y/%m/%d"),
+    ("DD/MM/AA", "%d/%m/%y"),
+    ("AAAA-MM-DD HH:MM:SS", "%Y-%m-%d %H:%M:%S"),
+    ("AAAA-MM-DDTHH:MM:SS", "%Y-%m-%dT%H:%M:%S"),
+    ("DD/MM/AAAA HH:MM:SS", "%d/%m/%Y %H:%M:%S"),
+    ("DD/MM/AAAA HH:MM", "%d/%m/%Y %H:%M"),
+]
+
+# Seriales de Excel (días desde 1899-12-30) aceptados como fecha:
+# 1950-01-01 .. 2099-12-31. Fuera de rango (p.ej. un año suelto 2026) -> NA.
+FECHA_SERIAL_MIN = 18264
+FECHA_SERIAL_MAX = 73050
@@ -1,45 +1,191 @@
 from __future__ import annotations
 
+import datetime as dt
+
+import numpy as np
 import pandas as pd
 
+from .config import FECHA_FORMATOS, FECHA_SERIAL_MAX, FECHA_SERIAL_MIN
+from .reports import sumar_reportes
+
+
+# Reglas del reporte además de los formatos de texto: serial numérico de
+# Excel y celdas que ya son fecha (datetime / date / columna datetime64).
+_SERIAL = "SERIAL_EXCEL"
+_CELDA = "FECHA_EXCEL"
+_EPOCH_EXCEL = np.datetime64("1899-12-30", "D")
+_RELATIVAS = frozenset({"now", "today"})
+
+
+def _reglas(formatos) -> list[str]:
+    return [etiqueta for etiqueta, _ in formatos] + [_SERIAL, _CELDA]
+
+
+def _iso(fechas: np.ndarray) -> np.ndarray:
+    """datetime64 -> 'YYYY-MM-DD' (object), sin pasar por strftime."""
+    return np.datetime_as_string(fechas.astype("datetime64[D]"), unit="D").astype(object)
+
+
+def _desde_serial(dias: np.ndarray) -> np.ndarray:
+    """Días Excel (float) -> datetime64[D]; NaT fuera de [FECHA_SERIAL_MIN, FECHA_SERIAL_MAX]."""
+    ok = (dias >= FECHA_SERIAL_MIN) & (dias <= FECHA_SERIAL_MAX)
+    out = np.full(len(dias), np.datetime64("NaT"), dtype="datetime64[D]")
+    out[ok] = _EPOCH_EXCEL + np.floor(dias[ok]).astype("int64").astype("timedelta64[D]")
+    return out
 
-def normalizar_fechas_iso(df: pd.DataFrame, col: str = "FECHA") -> tuple[pd.DataFrame, pd.DataFrame]:
+
+def _parsear_unicos(valores: np.ndarray, formatos) -> tuple[np.ndarray, np.ndarray]:
+    """
+    ISO y regla (índice en _reglas(formatos), -1 = no parseó) de cada valor
+    distinto. Textos: un pd.to_datetime(format=...) vectorizado por formato
+    sobre lo que aún no parseó; números / textos numéricos: serial de Excel;
+    datetime / date: su fecha.
+    """
+    n = len(valores)
+    iso = np.full(n, None, dtype=object)
+    regla = np.full(n, -1, dtype=np.intp)
+    k_serial, k_celda = len(formatos), len(formatos) + 1
+
+    es_texto = np.fromiter((isinstance(v, str) for v in valores), bool, n)
+    es_celda = np.fromiter((isinstance(v, dt.date) for v in valores), bool, n)
+    es_num = np.fromiter(
+        (isinstance(v, (int, float, np.integer, np.floating)) and not isinstance(v, (bool, np.bool_))
+         for v in valores),
+        bool, n,
+    )
+
+    seriales = [np.flatnonzero(es_num)]
+    dias = [np.asarray(valores[seriales[0]], dtype="float64")]
+
+    pend = np.flatnonzero(es_texto)
+    if len(pend):
+        textos = pd.Series(valores[pend], dtype=object).str.strip().to_numpy(dtype=object)
+        # pd.to_datetime resuelve "now"/"today" a la fecha actual aun con format
+        relativas = np.isin(textos, list(_RELATIVAS))
+        pend, textos = pend[~relativas], textos[~relativas]
+        for k, (_, fmt) in enumerate(formatos):
+            if not len(pend):
+                break
+            parseado = pd.to_datetime(textos, format=fmt, errors="coerce").to_numpy()
+            ok = ~np.isnat(parseado)
+            iso[pend[ok]] = _iso(parseado[ok])
+            regla[pend[ok]] = k
+            pend, textos = pend[~ok], textos[~ok]
+        if len(pend):
+            # "45123" / "45123.0": serial escrito como texto
+            num = pd.to_numeric(pd.Series(textos, dtype=object), errors="coerce").to_numpy(dtype="float64")
+            ok = ~np.isnan(num)
+            seriales.append(pend[ok])
+            dias.append(num[ok])
+
+    idx_serial = np.concatenate(seriales)
+    if len(idx_serial):
+        fechas = _desde_serial(np.concatenate(dias))
+        ok = ~np.isnat(fechas)
+        iso[idx_serial[ok]] = _iso(fechas[ok])
+        regla[idx_serial[ok]] = k_serial
+
+    for i in np.flatnonzero(es_celda):
+        v = valores[i]
+        d = v.date() if isinstance(v, dt.datetime) else v
+        if dt.date(1677, 9, 22) <= d <= dt.date(2262, 4, 11):  # rango de datetime64[ns], como antes
+            iso[i] = d.isoformat()
+            regla[i] = k_celda
+    return iso, regla
+
+
+def normalizar_fechas_iso(
+    df: pd.DataFrame,
+    col: str = "FECHA",
+    copiar: bool = True,
+    formatos: list[tuple[str, str]] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Fuerza FECHA a string ISO 'YYYY-MM-DD' (Excel-friendly).
+    - Cada valor distinto se parsea una sola vez, con reglas fijas (no se
+      adivina el formato): textos con formatos (default config.FECHA_FORMATOS,
+      día primero), seriales de Excel y celdas fecha. Lo demás -> NA.
     - No deja datetime en el df final (evita '00:00:00').
-    - Devuelve (df, reporte) con conteos de parseo.
+    - Devuelve (df, reporte) con conteos de parseo y filas por regla.
+    - copiar=False: reescribe la columna sobre el mismo df.
+    Como cada valor se resuelve solo, parsear por bloques da lo mismo que
+    parsear la columna entera.
     """
-    df = df.copy()
+    formatos = FECHA_FORMATOS if formatos is None else formatos
+    if copiar:
+        df = df.copy()
 
     if col not in df.columns:
-        rep = pd.DataFrame([{
-            "COLUMNA": col,
-            "EXISTE": False,
-            "N_TOTAL": len(df),
-            "N_PARSE_OK": 0,
-            "N_PARSE_NA": 0,
-        }])
-        return df, rep
+        return df, _reporte_fechas(col, len(df))
+
+    s = df[col]
+    before_na = int(s.isna().sum())
+    por_regla = np.zeros(len(formatos) + 2, dtype=np.int64)
 
-    before_na = df[col].isna().sum()
+    if pd.api.types.is_datetime64_any_dtype(s):
+        if getattr(s.dt, "tz", None) is not None:
+            s = s.dt.tz_localize(None)  # fecha local, no UTC
+        valores = s.to_numpy(dtype="datetime64[ns]")
+        ok = ~np.isnat(valores)
+        iso = np.full(len(s), None, dtype=object)
+        iso[ok] = _iso(valores[ok])
+        por_regla[-1] = int(ok.sum())
+    else:
+        codigos, unicos = pd.factorize(s, use_na_sentinel=True)
+        unicos = np.asarray(unicos, dtype=object)
+        iso_u, regla_u = _parsear_unicos(unicos, formatos)
+        iso = np.append(iso_u, None)[codigos]  # -1 (NA) -> None
+        filas_u = np.bincount(codigos[codigos >= 0], minlength=len(unicos))
+        ok = regla_u >= 0
+        por_regla += np.bincount(regla_u[ok], weights=filas_u[ok], minlength=len(por_regla)).astype(np.int64)
 
-    parsed = pd.to_datetime(df[col], errors="coerce")
+    df[col] = pd.Series(iso, index=df.index, dtype="str")
+    after_na = int(df[col].isna().sum())
 
-    # ISO string
-    out = parsed.dt.strftime("%Y-%m-%d")
-    out = out.replace({"NaT": pd.NA, "nan": pd.NA, "None": pd.NA})
-    df[col] = out
+    conteos = dict(zip(_reglas(formatos), por_regla.tolist()))
+    return df, _reporte_fechas(col, len(df), before_na, after_na, conteos)
 
-    after_na = df[col].isna().sum()
 
-    rep = pd.DataFrame([{
+def _reporte_fechas(
+    col: str,
+    n_total: int,
+    na_antes: int | None = None,
+    na_despues: int | None = None,
+    por_regla: dict[str, int] | None = None,
+) -> pd.DataFrame:
+    # na_antes None = la columna no existe (reporte corto)
+    if na_antes is None:
+        return pd.DataFrame([{
+            "COLUMNA": col,
+            "EXISTE": False,
+            "N_TOTAL": n_total,
+            "N_PARSE_OK": 0,
+            "N_PARSE_NA": 0,
+        }])
+    return pd.DataFrame([{
         "COLUMNA": col,
         "EXISTE": True,
-        "N_TOTAL": len(df),
-        "N_PARSE_OK": int(len(df) - after_na),
-        "N_PARSE_NA": int(after_na),
-        "NA_ANTES": int(before_na),
-        "NA_DESPUES": int(after_na),
+        "N_TOTAL": n_total,
+        "N_PARSE_OK": int(n_total - na_despues),
+        "N_PARSE_NA": int(na_despues),
+        "NA_ANTES": int(na_antes),
+        "NA_DESPUES": int(na_despues),
+        # filas resueltas por cada regla (suman N_PARSE_OK)
+        **{f"N_{r}": int(n) for r, n in (por_regla or {}).items()},
     }])
 
-    return df, rep
+
+def combinar_reportes_fechas(parciales: list[pd.DataFrame]) -> pd.DataFrame:
+    """Une reportes de normalizar_fechas_iso por bloque (conteos sumados)."""
+    primero = parciales[0].iloc[0]
+    if not primero["EXISTE"]:
+        t = sumar_reportes(parciales, None, ["N_TOTAL"])
+        return _reporte_fechas(primero["COLUMNA"], t["N_TOTAL"])
+    reglas = [c for c in parciales[0].columns if c not in _COLUMNAS_BASE]
+    t = sumar_reportes(parciales, None, ["N_TOTAL", "NA_ANTES", "NA_DESPUES", *reglas])
+    return _reporte_fechas(
+        primero["COLUMNA"], t["N_TOTAL"], t["NA_ANTES"], t["NA_DESPUES"], {c[2:]: t[c] for c in reglas}
+    )
+
+
+_COLUMNAS_BASE = ("COLUMNA", "EXISTE", "N_TOTAL", "N_PARSE_OK", "N_PARSE_NA", "NA_ANTES", "NA_DESPUES")
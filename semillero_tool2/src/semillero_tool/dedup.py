@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import COLUMNAS_ID_DEDUP, FU_COLS
+from .dates import normalizar_fechas_iso
+from .drop import separar_por_mascara
+from .errors import ConfigError, SchemaError
+
+
+# ============================================================
+# DEDUPLICACIÓN DE IDS (dentro del archivo y entre cohortes)
+# ------------------------------------------------------------
+# - Clave: la primera columna de config.COLUMNAS_ID_DEDUP presente, ya como
+#   texto (asegurar_ids_como_texto), en mayúsculas y solo letras / dígitos
+#   (" 1.234.567 " == "1234567"); si es toda dígitos, sin ceros a la
+#   izquierda (el Excel los pierde, el CSV no). ID vacío: nunca duplicado.
+#   Se indexa el hash de 64 bits de la clave (pd.util.hash_array, estable
+#   entre corridas).
+# - Política: cuál fila de la persona queda.
+#     ultima_fecha -> FECHA más reciente (sin fecha pierde)
+#     mas_fu       -> más valores F..U presentes
+#     primero      -> la primera vista (en el archivo; antes, en el índice)
+#   Empates -> la primera en el archivo.
+# - Índice persistente (IndiceIds): un directorio con un segmento por
+#   cohorte (= nombre del input), <cohorte>.ids.npy: (hash, fecha, n_fu) de
+#   sus filas conservadas, ordenado por hash. Un archivo nuevo se busca con
+#   searchsorted sobre cada segmento abierto con mmap: O(filas nuevas) sin
+#   leer las cohortes previas. Reprocesar una cohorte reescribe su segmento
+#   y no se compara consigo misma (idempotente).
+# - Contra el índice: con primero gana siempre la cohorte previa; si no, la
+#   fila nueva solo si su FECHA / N_FU es estrictamente mejor (la fila vieja
+#   ya está en el output de su cohorte: se reporta, no se borra).
+# - REPORTE_IDS_DUPLICADOS: las filas descartadas, y las conservadas que
+#   reemplazan a una cohorte previa.
+# ============================================================
+
+POLITICAS_DEDUP = ("ultima_fecha", "mas_fu", "primero")
+
+# Se resuelven bloque a bloque: la fila que queda se conoce al verla.
+POLITICAS_POR_BLOQUES = ("primero",)
+
+COLUMNAS_REPORTE_IDS_DUPLICADOS = [
+    "ID", "FILA", "FECHA", "N_FU", "DECISION", "MOTIVO", "FILA_CONSERVADA", "COHORTE_PREVIA",
+]
+
+_SUFIJO_SEGMENTO = ".ids.npy"
+_DTYPE_SEGMENTO = np.dtype([("hash", "<u8"), ("fecha", "<i4"), ("n_fu", "<i2")])
+_SIN_FECHA = np.iinfo(np.int32).min
+
+_RE_NOMBRE_COHORTE = re.compile(r"[^\w.-]+")
+
+
+def columna_id(df: pd.DataFrame) -> str:
+    for c in COLUMNAS_ID_DEDUP:
+        if c in df.columns:
+            return c
+    raise SchemaError(f"Deduplicación de IDs sin columna ID (se busca una de {COLUMNAS_ID_DEDUP}).")
+
+
+def claves_id(s: pd.Series) -> pd.Series:
+    """ID -> clave de comparación (ver bloque de arriba); vacía -> NA."""
+    t = s.astype("str").str.upper().str.replace(r"[^0-9A-Z]", "", regex=True)
+    t = t.str.replace(r"^0+(?=\d+$)", "", regex=True)
+    return t.where(t.str.len() > 0)
+
+
+def _dias_fecha(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """(días desde 1970 como int32, _SIN_FECHA si no parsea; ISO) de FECHA."""
+    n = len(df)
+    if "FECHA" not in df.columns:
+        return np.full(n, _SIN_FECHA, dtype=np.int32), np.full(n, None, dtype=object)
+    # Mismas reglas que la etapa de fechas (que corre al final, sobre el original).
+    fechas, _ = normalizar_fechas_iso(df[["FECHA"]], col="FECHA", copiar=True)
+    iso = fechas["FECHA"].to_numpy(dtype=object, na_value=None)
+    dias = np.full(n, _SIN_FECHA, dtype=np.int32)
+    ok = np.fromiter((v is not None for v in iso), bool, n)
+    dias[ok] = iso[ok].astype("datetime64[D]").astype(np.int64)
+    return dias, iso
+
+
+def _n_fu(df: pd.DataFrame) -> np.ndarray:
+    cols = [c for c in FU_COLS if c in df.columns]
+    if not cols:
+        return np.zeros(len(df), dtype=np.int16)
+    return df[cols].notna().sum(axis=1).to_numpy(dtype=np.int16)
+
+
+def _puntaje(politica: str, dias: np.ndarray, n_fu: np.ndarray) -> np.ndarray:
+    """Mayor = mejor. primero: todos iguales (decide el orden)."""
+    if politica == "ultima_fecha":
+        return dias.astype(np.int64)
+    if politica == "mas_fu":
+        return n_fu.astype(np.int64)
+    return np.zeros(len(dias), dtype=np.int64)
+
+
+def _reporte_vacio() -> pd.DataFrame:
+    return pd.DataFrame(columns=COLUMNAS_REPORTE_IDS_DUPLICADOS)
+
+
+class IndiceIds:
+    """Índice persistente de IDs por cohorte (ver bloque de arriba)."""
+
+    def __init__(self, directorio: Path):
+        self.directorio = Path(directorio)
+
+    @staticmethod
+    def nombre_cohorte(nombre: str) -> str:
+        """Nombre de cohorte apto para archivo (el que sale en COHORTE_PREVIA)."""
+        return _RE_NOMBRE_COHORTE.sub("_", nombre).strip("._") or "_"
+
+    def _segmento(self, cohorte: str) -> Path:
+        return self.directorio / f"{self.nombre_cohorte(cohorte)}{_SUFIJO_SEGMENTO}"
+
+    def cohortes(self) -> list[str]:
+        if not self.directorio.is_dir():
+            return []
+        return sorted(p.name[: -len(_SUFIJO_SEGMENTO)] for p in self.directorio.glob(f"*{_SUFIJO_SEGMENTO}"))
+
+    def _abrir(self, cohorte: str) -> np.ndarray:
+        path = self._segmento(cohorte)
+        try:
+            seg = np.load(path, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError) as e:
+            raise ConfigError(f"Índice de IDs ilegible: {path} ({e})") from e
+        if seg.dtype != _DTYPE_SEGMENTO or seg.ndim != 1:
+            raise ConfigError(f"Índice de IDs de otra versión: {path}")
+        return seg
+
+    def buscar(
+        self, hashes: np.ndarray, politica: str, excluir: str | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Mejor registro previo (según la política) de cada hash en las otras
+        cohortes. Devuelve (encontrado, cohorte, puntaje); primero -> la
+        primera cohorte por nombre que lo tiene.
+        """
+        n = len(hashes)
+        encontrado = np.zeros(n, dtype=bool)
+        cohorte = np.full(n, None, dtype=object)
+        puntaje = np.zeros(n, dtype=np.int64)
+        excluir = self.nombre_cohorte(excluir) if excluir is not None else None
+        for nombre in self.cohortes():
+            if nombre == excluir or not n:
+                continue
+            seg = self._abrir(nombre)
+            if not len(seg):
+                continue
+            claves = seg["hash"]
+            pos = np.searchsorted(claves, hashes)
+            pos[pos == len(seg)] = 0
+            hit = claves[pos] == hashes  # lee solo las posiciones tocadas
+            if not hit.any():
+                continue
+            previos = seg[pos[hit]]
+            p = _puntaje(politica, previos["fecha"], previos["n_fu"])
+            mejor = np.zeros(n, dtype=bool)
+            mejor[hit] = ~encontrado[hit] | (p > puntaje[hit])
+            donde = np.flatnonzero(mejor)
+            puntaje[donde] = p[mejor[hit]]
+            cohorte[donde] = nombre
+            encontrado |= mejor
+        return encontrado, cohorte, puntaje
+
+    def guardar(self, cohorte: str, registros: np.ndarray) -> Path:
+        """Escribe (reemplaza) el segmento de la cohorte; escritura atómica."""
+        path = self._segmento(cohorte)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        registros = np.sort(np.asarray(registros, dtype=_DTYPE_SEGMENTO), order="hash", kind="stable")
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                np.save(f, registros, allow_pickle=False)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return path
+
+
+class DeduplicadorIds:
+    """
+    Deduplica un df (o sus bloques, en orden) con una política; opcionalmente
+    contra un IndiceIds. guardar() indexa las filas conservadas como la
+    cohorte (llamarlo recién cuando el output ya se escribió).
+
+        dedup = DeduplicadorIds("ultima_fecha", IndiceIds(dir), cohorte="2026-1.xlsx")
+        df, reporte = dedup.aplicar(df)
+        ...
+        dedup.guardar()
+    """
+
+    def __init__(self, politica: str, indice: IndiceIds | None = None, cohorte: str | None = None):
+        if politica not in POLITICAS_DEDUP:
+            raise ConfigError(f"Política de deduplicación inválida: {politica}")
+        if indice is not None and cohorte is None:
+            raise ConfigError("Deduplicar contra un índice requiere el nombre de la cohorte.")
+        self.politica = politica
+        self.indice = indice
+        self.cohorte = cohorte
+        # Claves conservadas en bloques previos (ordenadas) y su FILA.
+        self._vistos = np.empty(0, dtype=np.uint64)
+        self._vistos_fila = np.empty(0, dtype=np.int64)
+        self._conservados: list[np.ndarray] = []
+
+    def aplicar(self, df: pd.DataFrame, copiar: bool = True) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """(df sin las filas descartadas, REPORTE_IDS_DUPLICADOS)."""
+        col = columna_id(df)
+        claves = claves_id(df[col])
+        con_id = np.flatnonzero(claves.notna().to_numpy())
+        n = len(df)
+        if not len(con_id):
+            return df, _reporte_vacio()
+
+        hashes = np.zeros(n, dtype=np.uint64)
+        hashes[con_id] = pd.util.hash_array(claves.to_numpy(dtype=object)[con_id])
+        dias, iso = _dias_fecha(df)
+        n_fu = _n_fu(df)
+        puntaje = _puntaje(self.politica, dias, n_fu)
+        filas = df.index.to_numpy()
+
+        # Grupos por clave; la primera de cada grupo (mejor puntaje, después
+        # posición) es la que queda dentro del df.
+        orden = con_id[np.lexsort((con_id, -puntaje[con_id], hashes[con_id]))]
+        inicio = np.r_[True, hashes[orden][1:] != hashes[orden][:-1]]
+        grupo = np.cumsum(inicio) - 1
+        ganadoras = orden[inicio]
+        g_hash = hashes[ganadoras]
+
+        # Vista en un bloque previo del mismo archivo -> todo el grupo sobra.
+        g_vista = np.zeros(len(ganadoras), dtype=bool)
+        g_fila_vista = np.zeros(len(ganadoras), dtype=np.int64)
+        if len(self._vistos):
+            pos = np.minimum(np.searchsorted(self._vistos, g_hash), len(self._vistos) - 1)
+            g_vista = self._vistos[pos] == g_hash
+            g_fila_vista = self._vistos_fila[pos]
+
+        # Contra las cohortes previas.
+        g_previa = np.zeros(len(ganadoras), dtype=bool)
+        g_cohorte = np.full(len(ganadoras), None, dtype=object)
+        g_gana_previa = np.zeros(len(ganadoras), dtype=bool)
+        if self.indice is not None:
+            g_previa, g_cohorte, p_previo = self.indice.buscar(g_hash, self.politica, excluir=self.cohorte)
+            g_gana_previa = g_previa & ~g_vista
+            if self.politica != "primero":
+                g_gana_previa &= ~(puntaje[ganadoras] > p_previo)
+
+        # Decisión por fila (en orden de grupo).
+        es_ganadora = np.zeros(n, dtype=bool)
+        es_ganadora[ganadoras] = True
+        descartada = np.zeros(n, dtype=bool)
+        reportada = np.zeros(n, dtype=bool)
+        motivo = np.full(n, None, dtype=object)
+        fila_cons = np.full(n, None, dtype=object)
+        cohorte = np.full(n, None, dtype=object)
+
+        g = grupo
+        vista, gana_previa = g_vista[g], g_gana_previa[g]
+        perdedora = ~es_ganadora[orden] & ~vista & ~gana_previa
+        reemplaza = es_ganadora[orden] & g_previa[g] & ~vista & ~gana_previa
+
+        descartada[orden] = vista | gana_previa | perdedora
+        reportada[orden] = descartada[orden] | reemplaza
+        motivo[orden] = np.select(
+            [vista | perdedora, gana_previa, reemplaza],
+            ["repetido_en_archivo", "en_cohorte_previa", "reemplaza_cohorte_previa"],
+            None,
+        )
+        fila_cons[orden] = np.where(vista, g_fila_vista[g], np.where(perdedora, filas[ganadoras][g], None))
+        cohorte[orden] = np.where(gana_previa | reemplaza, g_cohorte[g], None)
+
+        # Conservadas: índice (al guardar) y vistas para los bloques siguientes.
+        quedan = ganadoras[~(g_vista | g_gana_previa)]
+        self._registrar(hashes[quedan], filas[quedan], dias[quedan], n_fu[quedan])
+
+        r = np.flatnonzero(reportada)
+        reporte = pd.DataFrame({
+            "ID": df[col].to_numpy(dtype=object)[r],
+            "FILA": filas[r],
+            "FECHA": iso[r],
+            "N_FU": n_fu[r].astype(np.int64),
+            "DECISION": np.where(descartada[r], "descartada", "conservada").astype(object),
+            "MOTIVO": motivo[r],
+            "FILA_CONSERVADA": pd.array(fila_cons[r], dtype="Int64"),
+            "COHORTE_PREVIA": cohorte[r],
+        }, columns=COLUMNAS_REPORTE_IDS_DUPLICADOS)
+
+        if descartada.any():
+            df, _ = separar_por_mascara(df, pd.Series(descartada, index=df.index), copiar=copiar)
+        return df, reporte
+
+    def _registrar(self, hashes, filas, dias, n_fu) -> None:
+        registros = np.empty(len(hashes), dtype=_DTYPE_SEGMENTO)
+        registros["hash"], registros["fecha"], registros["n_fu"] = hashes, dias, n_fu
+        self._conservados.append(registros)
+        if self.politica in POLITICAS_POR_BLOQUES:
+            todas = np.concatenate([self._vistos, hashes])
+            orden = np.argsort(todas, kind="stable")
+            self._vistos = todas[orden]
+            self._vistos_fila = np.concatenate([self._vistos_fila, filas.astype(np.int64)])[orden]
+
+    def guardar(self) -> Path | None:
+        """Indexa las filas conservadas como la cohorte (reemplaza su segmento)."""
+        if self.indice is None:
+            return None
+        registros = np.concatenate(self._conservados) if self._conservados else np.empty(0, _DTYPE_SEGMENTO)
+        return self.indice.guardar(self.cohorte, registros)
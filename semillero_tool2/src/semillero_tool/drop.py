@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from .errors import ConfigError
 
 
+def separar_por_mascara(
+    df: pd.DataFrame,
+    mask_drop: pd.Series,
+    copiar: bool = True,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Devuelve (kept, dropped) según mask_drop.
+    copiar=False evita el .copy() extra: take() ya materializa filas nuevas
+    (y, a diferencia de .loc[mask], no las marca como "copia de un slice").
+    """
+    if copiar:
+        return df.loc[~mask_drop].copy(), df.loc[mask_drop].copy()
+
+    m = mask_drop.to_numpy(dtype=bool)
+    if not m.any():
+        return df, df.iloc[0:0]
+    return df.take(np.flatnonzero(~m)), df.take(np.flatnonzero(m))
+
+
 def aplicar_drop_missing(
     df: pd.DataFrame,
     mode: str,
     critical_cols: list[str],
+    copiar: bool = True,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Drop controlado por missing en columnas críticas.
@@ -20,11 +41,14 @@ def aplicar_drop_missing(
     Devuelve:
       - df_filtrado
       - rep_dropeadas (subset de filas eliminadas)
+
+    copiar=False: sin copia defensiva (el pipeline es dueño del frame).
     """
-    df = df.copy()
+    if copiar:
+        df = df.copy()
 
     if mode == "none":
-        return df, df.iloc[0:0].copy()
+        return df, (df.iloc[0:0].copy() if copiar else df.iloc[0:0])
 
     if not critical_cols:
         # Si el usuario pidió drop pero no hay cols, es configuración inválida.
@@ -38,7 +62,4 @@ def aplicar_drop_missing(
     else:
         raise ConfigError(f"drop_missing_mode inválido: {mode}")
 
-    dropped = df.loc[mask_drop].copy()
-    kept = df.loc[~mask_drop].copy()
-
-    return kept, dropped
+    return separar_por_mascara(df, mask_drop, copiar=copiar)
@@ -6,6 +6,10 @@ class ExcelReadError(SemilleroToolError):
     pass
 
 
+class CsvReadError(SemilleroToolError):
+    pass
+
+
 class SchemaError(SemilleroToolError):
     pass
 
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from .config import FU_COLS, PERCENTILES_FU
+from .fu import MatrizFU, validate_fu_schema
+
+
+# ============================================================
+# ESTADÍSTICAS DESCRIPTIVAS (FU_COLS)
+# ------------------------------------------------------------
+# - GENERAL: una fila por variable FU sobre todo el df
+# - X_PROGRAMA: una fila por (programa, variable); filas sin programa no entran
+# - Reducción por ordenamiento: por variable, un orden por (grupo, valor)
+#   y de ahí salen N, media, desvío, mínimo, percentiles y
+#   máximo de todos los grupos a la vez (sin loop por grupo).
+# - NA no cuenta (como pandas): N es el número de valores no-NA.
+# ============================================================
+
+def nombre_percentil(p: int) -> str:
+    """Nombre de la columna del percentil p (50 -> MEDIANA)."""
+    return "MEDIANA" if p == 50 else f"P{p}"
+
+
+def _columnas_estadisticos() -> list[str]:
+    percentiles = sorted({50, *PERCENTILES_FU})
+    return ["N", "MEDIA", "DESV_EST", "MIN", *(nombre_percentil(p) for p in percentiles), "MAX"]
+
+
+COLUMNAS_GENERAL = ["VARIABLE", *_columnas_estadisticos()]
+COLUMNAS_X_PROGRAMA = ["PROGRAMA", "VARIABLE", *_columnas_estadisticos()]
+
+
+def reducir_por_grupo(
+    valores: np.ndarray,
+    codigos: np.ndarray,
+    n_grupos: int,
+    percentiles: bool = True,
+) -> dict[str, np.ndarray]:
+    """
+    valores: (filas x variables) float64, NaN = NA. codigos: grupo 0..n_grupos-1
+    por fila. Devuelve {estadístico: (n_grupos x variables)}; NaN donde el grupo
+    no tiene valores (DESV_EST: con menos de 2, ddof=1 como pandas). Además
+    SS: suma de cuadrados de los desvíos (0 sin valores), para acumular.
+    percentiles=False: solo N, MEDIA, DESV_EST, SS, MIN y MAX.
+    """
+    lista_percentiles = sorted({50, *PERCENTILES_FU}) if percentiles else []
+    forma = (n_grupos, valores.shape[1])
+    out = {c: np.full(forma, np.nan) for c in _columnas_estadisticos()}
+    out["N"] = np.zeros(forma, dtype=np.int64)
+    out["SS"] = np.zeros(forma)
+
+    # Orden (grupo, valor) = argsort por valor + argsort estable por grupo;
+    # con códigos de 16 bits numpy usa radix sort (lineal), mucho más rápido
+    # que lexsort sobre las dos claves.
+    if n_grupos <= np.iinfo(np.uint16).max:
+        codigos = codigos.astype(np.uint16)
+
+    for j in range(valores.shape[1]):
+        v = valores[:, j]
+        ok = ~np.isnan(v)
+        g, x = codigos[ok], v[ok]
+        orden = np.argsort(x)
+        orden = orden[np.argsort(g[orden], kind="stable")]
+        g, x = g[orden].astype(np.intp), x[orden]
+
+        n = np.bincount(g, minlength=n_grupos)
+        hay = n > 0
+        inicio = np.cumsum(n) - n
+        media = np.bincount(g, weights=x, minlength=n_grupos)[hay] / n[hay]
+        out["N"][:, j] = n
+        out["MEDIA"][hay, j] = media
+
+        desvio = x - np.repeat(out["MEDIA"][:, j], n)
+        ss = np.bincount(g, weights=desvio * desvio, minlength=n_grupos)
+        out["SS"][:, j] = ss
+        dos = n > 1
+        out["DESV_EST"][dos, j] = np.sqrt(ss[dos] / (n[dos] - 1))
+
+        ini, cnt = inicio[hay], n[hay]
+        out["MIN"][hay, j] = x[ini]
+        out["MAX"][hay, j] = x[ini + cnt - 1]
+        for p in lista_percentiles:
+            pos = (cnt - 1) * (p / 100)
+            bajo = np.floor(pos).astype(np.int64)
+            alto = np.minimum(bajo + 1, cnt - 1)
+            frac = pos - bajo
+            xb, xa = x[ini + bajo], x[ini + alto]
+            out[nombre_percentil(p)][hay, j] = xb + (xa - xb) * frac
+    return out
+
+
+def _tabla(stats: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Aplana (grupos x variables) en filas grupo-mayor."""
+    return {c: a.reshape(-1) for c, a in stats.items()}
+
+
+def central_general(df: pd.DataFrame, matriz: MatrizFU | None = None) -> pd.DataFrame:
+    """
+    Hoja GENERAL: N, media, desvío, mínimo, percentiles y máximo de cada
+    variable FU sobre todas las filas. Requiere validate_fu_schema antes.
+    """
+    if matriz is None:
+        matriz = MatrizFU.desde_df(df)
+    stats = reducir_por_grupo(matriz.valores, np.zeros(len(matriz), dtype=np.int64), 1)
+    return pd.DataFrame({"VARIABLE": FU_COLS, **_tabla(stats)}, columns=COLUMNAS_GENERAL)
+
+
+def central_por_programa(
+    df: pd.DataFrame,
+    col: str = "PROGRAMA_CANON",
+    matriz: MatrizFU | None = None,
+) -> pd.DataFrame:
+    """
+    Hoja X_PROGRAMA: los mismos estadísticos por programa (orden alfabético)
+    y variable FU. Filas con col NA no entran. Requiere validate_fu_schema antes.
+    """
+    if matriz is None:
+        matriz = MatrizFU.desde_df(df)
+    codigos, programas = pd.factorize(df[col], sort=True)  # NA -> -1
+    con_programa = codigos >= 0
+    stats = reducir_por_grupo(matriz.valores[con_programa], codigos[con_programa], len(programas))
+    return pd.DataFrame({
+        "PROGRAMA": np.repeat(np.asarray(programas, dtype=object), len(FU_COLS)),
+        "VARIABLE": np.tile(np.asarray(FU_COLS, dtype=object), len(programas)),
+        **_tabla(stats),
+    }, columns=COLUMNAS_X_PROGRAMA)
+
+
+def columna_programa(df: pd.DataFrame) -> str | None:
+    """PROGRAMA_CANON si se canonizó; si no, PROGRAMA; None si no hay ninguna."""
+    for c in ("PROGRAMA_CANON", "PROGRAMA"):
+        if c in df.columns:
+            return c
+    return None
+
+
+def estadisticas_fu(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    (GENERAL, X_PROGRAMA) con una sola MatrizFU. Sin columna de programa,
+    X_PROGRAMA queda vacía.
+    """
+    validate_fu_schema(df)
+    matriz = MatrizFU.desde_df(df)
+    col = columna_programa(df)
+    por_programa = (
+        central_por_programa(df, col, matriz) if col is not None
+        else pd.DataFrame(columns=COLUMNAS_X_PROGRAMA)
+    )
+    return central_general(df, matriz), por_programa
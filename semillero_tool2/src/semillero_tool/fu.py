@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
-from .config import FU_COLS
+from .config import FU_COLS, RANGOS_FU
+from .drop import separar_por_mascara
 from .errors import SchemaError
+from .reports import sumar_reportes
 
 
-def cast_fu_numeric(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+def cast_fu_numeric(df: pd.DataFrame, copiar: bool = True) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Convierte columnas FU_COLS a numérico (errors='coerce').
     No crea columnas nuevas; si falta una columna, simplemente no la toca (aún).
     Devuelve (df, reporte_coercion).
+    copiar=False castea in-place (uso del pipeline).
     """
-    df = df.copy()
+    if copiar:
+        df = df.copy()
     rows = []
 
     for c in FU_COLS:
@@ -27,7 +34,7 @@ def cast_fu_numeric(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
             continue
 
         before_na = int(df[c].isna().sum())
-        coerced = pd.to_numeric(df[c], errors="coerce")
+        coerced = _a_numerico(df[c])
         after_na = int(coerced.isna().sum())
 
         new_nas = max(0, after_na - before_na)
@@ -42,15 +49,62 @@ def cast_fu_numeric(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
             "COERCIONES_A_NA": int(new_nas),
         })
 
-    rep = pd.DataFrame(rows, columns=[
-        "COLUMNA", "EXISTE", "N_TOTAL", "NA_ANTES", "NA_DESPUES", "COERCIONES_A_NA"
-    ])
+    return df, _reporte_cast(rows)
+
+
+_COLUMNAS_CAST = ["COLUMNA", "EXISTE", "N_TOTAL", "NA_ANTES", "NA_DESPUES", "COERCIONES_A_NA"]
+_COLUMNAS_NA = ["COLUMNA", "N_TOTAL", "N_NA", "PCT_NA"]
+_COLUMNAS_RESUMEN = ["N_TOTAL", "N_COMPLETAS_FU", "N_INCOMPLETAS_FU", "PCT_COMPLETAS_FU"]
+
+
+def _a_numerico(s: pd.Series) -> pd.Series:
+    """
+    pd.to_numeric(errors="coerce"), pero si el resultado es float los números
+    escritos como texto se re-parsean con redondeo correcto: el parser de
+    to_numeric puede errar en el último bit ("3.9290000000000003" -> 3.929), y
+    un CSV leído entero o por bloques tiene que dar los mismos float que el Excel.
+    Enteros (int64/uint64) y lo que to_numeric deja en NA quedan como to_numeric.
+    """
+    coerced = pd.to_numeric(s, errors="coerce")
+    if pd.api.types.is_numeric_dtype(s.dtype) or not pd.api.types.is_float_dtype(coerced.dtype):
+        return coerced
+
+    ok = coerced.notna().to_numpy(dtype=bool)
+    if ok.any():
+        try:
+            # float() de Python (redondeo correcto) solo donde to_numeric aceptó;
+            # para los no-texto (int, bool, float) da lo mismo que to_numeric.
+            coerced[ok] = s.to_numpy(dtype=object)[ok].astype(np.float64)
+        except (ValueError, TypeError):
+            pass  # formato que acepta to_numeric y float() no: queda to_numeric
+    return coerced
+
+
+def _reporte_cast(rows: list[dict]) -> pd.DataFrame:
+    rep = pd.DataFrame(rows, columns=_COLUMNAS_CAST)
 
     rep_exist = rep[rep["EXISTE"] == True].sort_values("COERCIONES_A_NA", ascending=False)  # noqa: E712
     rep_missing = rep[rep["EXISTE"] == False]  # noqa: E712
-    rep = pd.concat([rep_exist, rep_missing], ignore_index=True)
+    return pd.concat([rep_exist, rep_missing], ignore_index=True)
+
 
-    return df, rep
+def combinar_reportes_cast(parciales: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Une reportes de cast_fu_numeric de varios bloques (modo por bloques).
+    Los conteos se suman; COERCIONES_A_NA por bloque ya es NA_DESPUES - NA_ANTES
+    (to_numeric nunca quita NA), así que la suma es la del df completo.
+    """
+    existe = {r["COLUMNA"]: bool(r["EXISTE"]) for r in parciales[0].to_dict("records")}
+    sumas = sumar_reportes(parciales, "COLUMNA", ["N_TOTAL", "NA_ANTES", "NA_DESPUES", "COERCIONES_A_NA"])
+    rows = []
+    for c in FU_COLS:
+        t = sumas[c]
+        if existe[c]:
+            rows.append({"COLUMNA": c, "EXISTE": True, **t})
+        else:
+            rows.append({"COLUMNA": c, "EXISTE": False, "N_TOTAL": t["N_TOTAL"],
+                         "NA_ANTES": None, "NA_DESPUES": None, "COERCIONES_A_NA": None})
+    return _reporte_cast(rows)
 
 
 def validate_fu_schema(df: pd.DataFrame) -> None:
@@ -62,48 +116,129 @@ def validate_fu_schema(df: pd.DataFrame) -> None:
         raise SchemaError(f"Faltan columnas F..U requeridas: {missing}")
 
 
-def audit_fu_missing(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+@dataclass(frozen=True)
+class MatrizFU:
+    """
+    El bloque F..U como una matriz numérica (filas x FU_COLS), armada una vez
+    desde el df y reutilizada por auditoría NA, drop y rangos (en vez de
+    rebanar df[FU_COLS] en cada paso).
+
+    - valores: float64, contigua por columna (int64 -> float64 es exacto para
+      puntajes). NaN en NA y en columnas que no son numéricas (sin cast).
+    - na: máscara de NA, la misma que df[FU_COLS].isna().
+    """
+    valores: np.ndarray
+    na: np.ndarray
+
+    @classmethod
+    def desde_df(cls, df: pd.DataFrame) -> MatrizFU:
+        """Requiere validate_fu_schema antes (todas las columnas FU_COLS)."""
+        forma = (len(df), len(FU_COLS))
+        valores = np.empty(forma, order="F")
+        na = np.empty(forma, dtype=bool, order="F")
+        for j, c in enumerate(FU_COLS):
+            s = df[c]
+            if isinstance(s.dtype, np.dtype) and s.dtype.kind in "iuf":
+                valores[:, j] = s.to_numpy()
+                np.isnan(valores[:, j], out=na[:, j])
+            elif pd.api.types.is_numeric_dtype(s.dtype):  # nullables (Int64, Float64, bool)
+                valores[:, j] = s.to_numpy(dtype=np.float64, na_value=np.nan)
+                np.isnan(valores[:, j], out=na[:, j])
+            else:
+                valores[:, j] = np.nan
+                na[:, j] = s.isna().to_numpy()
+        return cls(valores, na)
+
+    def __len__(self) -> int:
+        return self.valores.shape[0]
+
+    def no_na_por_fila(self) -> np.ndarray:
+        return len(FU_COLS) - self.na.sum(axis=1)
+
+    def filas(self, mascara: np.ndarray) -> MatrizFU:
+        if mascara.all():
+            return self
+        idx = np.flatnonzero(mascara)
+        return MatrizFU(self.valores.take(idx, axis=0), self.na.take(idx, axis=0))
+
+    def fuera_de_rango_por_columna(self) -> np.ndarray:
+        """
+        Cuántos valores de cada columna caen fuera de RANGOS_FU (NA nunca).
+        Primero min/max por columna (ignorando NaN): solo las columnas que se
+        salen del rango pagan la máscara completa.
+        """
+        n_fuera = np.zeros(len(FU_COLS), dtype=np.int64)
+        if len(self) == 0:
+            return n_fuera
+        lo = np.array([RANGOS_FU[c][0] for c in FU_COLS], dtype=np.float64)
+        hi = np.array([RANGOS_FU[c][1] for c in FU_COLS], dtype=np.float64)
+        minimos = np.fmin.reduce(self.valores, axis=0)
+        maximos = np.fmax.reduce(self.valores, axis=0)
+        for j in np.flatnonzero((minimos < lo) | (maximos > hi)):
+            v = self.valores[:, j]
+            n_fuera[j] = int(((v < lo[j]) | (v > hi[j])).sum())  # NaN compara False
+        return n_fuera
+
+
+def audit_fu_missing(df: pd.DataFrame, matriz: MatrizFU | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Auditoría de missing SOLO para FU_COLS.
     Devuelve:
       - rep_na_cols: NA por columna FU
       - rep_resumen: filas completas vs incompletas (en FU)
     Requiere que validate_fu_schema haya pasado antes (para ser determinista).
+    matriz: MatrizFU ya armada de este df (si no, se arma).
     """
-    na_rows = []
-    for c in FU_COLS:
-        s = df[c]
-        na_rows.append({
-            "COLUMNA": c,
-            "N_TOTAL": len(df),
-            "N_NA": int(s.isna().sum()),
-            "PCT_NA": float(s.isna().mean()) if len(df) else 0.0,
-        })
+    if matriz is None:
+        matriz = MatrizFU.desde_df(df)
+    n_na = dict(zip(FU_COLS, matriz.na.sum(axis=0).tolist()))
+    n_complete = int((~matriz.na.any(axis=1)).sum())
+    return _reporte_na_fu(len(df), n_na), _reporte_resumen_fu(len(df), n_complete)
 
-    rep_na_cols = (
-        pd.DataFrame(na_rows, columns=["COLUMNA", "N_TOTAL", "N_NA", "PCT_NA"])
-        .sort_values("N_NA", ascending=False)
-    )
 
-    mask_complete = ~df[FU_COLS].isna().any(axis=1)
-    n_total = int(len(df))
-    n_complete = int(mask_complete.sum())
-    n_incomplete = int((~mask_complete).sum())
+def _reporte_na_fu(n_total: int, n_na: dict[str, int]) -> pd.DataFrame:
+    na_rows = [
+        {
+            "COLUMNA": c,
+            "N_TOTAL": n_total,
+            "N_NA": n_na[c],
+            "PCT_NA": (n_na[c] / n_total) if n_total else 0.0,
+        }
+        for c in FU_COLS
+    ]
+    return pd.DataFrame(na_rows, columns=_COLUMNAS_NA).sort_values("N_NA", ascending=False)
+
 
-    rep_resumen = pd.DataFrame([{
+def _reporte_resumen_fu(n_total: int, n_complete: int) -> pd.DataFrame:
+    return pd.DataFrame([{
         "N_TOTAL": n_total,
         "N_COMPLETAS_FU": n_complete,
-        "N_INCOMPLETAS_FU": n_incomplete,
+        "N_INCOMPLETAS_FU": n_total - n_complete,
         "PCT_COMPLETAS_FU": (n_complete / n_total) if n_total else 0.0,
-    }])
+    }], columns=_COLUMNAS_RESUMEN)
 
-    return rep_na_cols, rep_resumen
+
+def combinar_auditorias_fu(
+    parciales: list[tuple[pd.DataFrame, pd.DataFrame]],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Une auditorías (rep_na_cols, rep_resumen) de audit_fu_missing por bloque:
+    suma conteos y recalcula porcentajes sobre el total.
+    """
+    resumen = sumar_reportes([r for _, r in parciales], None, ["N_TOTAL", "N_COMPLETAS_FU"])
+    n_na = sumar_reportes([r for r, _ in parciales], "COLUMNA", ["N_NA"])
+    return (
+        _reporte_na_fu(resumen["N_TOTAL"], {c: t["N_NA"] for c, t in n_na.items()}),
+        _reporte_resumen_fu(resumen["N_TOTAL"], resumen["N_COMPLETAS_FU"]),
+    )
 
 
 def drop_fu_missing(
     df: pd.DataFrame,
     mode: str,
     min_non_missing: int | None = None,
+    copiar: bool = True,
+    matriz: MatrizFU | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Drop determinista sobre FU_COLS.
@@ -115,14 +250,29 @@ def drop_fu_missing(
 
     Devuelve (kept, dropped).
     Requiere validate_fu_schema antes para ser determinista.
+    copiar=False: kept/dropped sin copia defensiva extra (kept puede ser el mismo df).
     """
-    if mode == "none":
-        return df.copy(), df.iloc[0:0].copy()
+    kept, dropped, _ = separar_fu(df, mode, min_non_missing, copiar=copiar, matriz=matriz)
+    return kept, dropped
 
-    if mode == "all":
-        mask_drop = df[FU_COLS].isna().all(axis=1)
 
-    elif mode == "threshold":
+def separar_fu(
+    df: pd.DataFrame,
+    mode: str,
+    min_non_missing: int | None = None,
+    copiar: bool = True,
+    matriz: MatrizFU | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, MatrizFU | None]:
+    """
+    drop_fu_missing que además devuelve la MatrizFU de las filas conservadas
+    (para auditar el post-drop sin volver al df). Con mode="none" y sin
+    matriz, no arma ninguna (devuelve None).
+    """
+    if mode == "none":
+        kept, dropped = (df.copy(), df.iloc[0:0].copy()) if copiar else (df, df.iloc[0:0])
+        return kept, dropped, matriz
+
+    if mode == "threshold":
         if min_non_missing is None:
             raise ValueError("drop_fu_missing: mode='threshold' requiere min_non_missing")
 
@@ -130,17 +280,57 @@ def drop_fu_missing(
             raise ValueError(
                 f"min_non_missing_fu inválido: {min_non_missing} (rango 0..{len(FU_COLS)})"
             )
+    elif mode != "all":
+        raise ValueError(f"drop_fu_missing: mode inválido: {mode}")
 
-        non_missing = df[FU_COLS].notna().sum(axis=1)
-        mask_drop = non_missing < min_non_missing
-
+    if matriz is None:
+        matriz = MatrizFU.desde_df(df)
+    non_missing = matriz.no_na_por_fila()
+    if mode == "all":
+        mask_drop = non_missing == 0
     else:
-        raise ValueError(f"drop_fu_missing: mode inválido: {mode}")
+        mask_drop = non_missing < min_non_missing
 
-    dropped = df.loc[mask_drop].copy()
-    kept = df.loc[~mask_drop].copy()
+    kept, dropped = separar_por_mascara(df, pd.Series(mask_drop, index=df.index), copiar=copiar)
 
     if len(dropped) > 0:
-        dropped["_FU_NON_MISSING"] = dropped[FU_COLS].notna().sum(axis=1)
+        dropped["_FU_NON_MISSING"] = non_missing[mask_drop]
 
-    return kept, dropped
+    return kept, dropped, matriz.filas(~mask_drop)
+
+
+_COLUMNAS_RANGOS = ["COLUMNA", "MIN", "MAX", "N_VALIDOS", "N_FUERA_RANGO", "PCT_FUERA_RANGO"]
+
+
+def audit_fu_rangos(df: pd.DataFrame, matriz: MatrizFU | None = None) -> pd.DataFrame:
+    """
+    Valores FU fuera de RANGOS_FU, por columna (solo auditoría, no dropea).
+    N_VALIDOS: valores no-NA; PCT_FUERA_RANGO sobre N_VALIDOS.
+    Requiere validate_fu_schema antes.
+    """
+    if matriz is None:
+        matriz = MatrizFU.desde_df(df)
+    n_validos = (~matriz.na).sum(axis=0).tolist()
+    n_fuera = matriz.fuera_de_rango_por_columna().tolist()
+    return _reporte_rangos_fu(dict(zip(FU_COLS, zip(n_validos, n_fuera))))
+
+
+def _reporte_rangos_fu(conteos: dict[str, tuple[int, int]]) -> pd.DataFrame:
+    rows = [
+        {
+            "COLUMNA": c,
+            "MIN": RANGOS_FU[c][0],
+            "MAX": RANGOS_FU[c][1],
+            "N_VALIDOS": n_validos,
+            "N_FUERA_RANGO": n_fuera,
+            "PCT_FUERA_RANGO": (n_fuera / n_validos) if n_validos else 0.0,
+        }
+        for c, (n_validos, n_fuera) in conteos.items()
+    ]
+    return pd.DataFrame(rows, columns=_COLUMNAS_RANGOS).sort_values("N_FUERA_RANGO", ascending=False, kind="stable")
+
+
+def combinar_rangos_fu(parciales: list[pd.DataFrame]) -> pd.DataFrame:
+    """Une reportes de audit_fu_rangos por bloque: suma conteos y recalcula porcentajes."""
+    sumas = sumar_reportes(parciales, "COLUMNA", ["N_VALIDOS", "N_FUERA_RANGO"])
+    return _reporte_rangos_fu({c: (sumas[c]["N_VALIDOS"], sumas[c]["N_FUERA_RANGO"]) for c in FU_COLS})
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from .errors import ConfigError
+from .estadisticas import columna_programa
+from .io_salida import tipos_columnar
+
+
+# ============================================================
+# HISTORIAL LOCAL DE COHORTES (Parquet particionado)
+# ------------------------------------------------------------
+# - Un directorio con la DATA limpia de cada corrida, para análisis
+#   longitudinal sin releer los .xlsx de salida:
+#       <dir>/PERIODO=2026-1/<clave>-<token>-<n>.parquet
+#       <dir>/_cohortes/<clave>.json     (manifiesto de la cohorte)
+#   PERIODO = año-semestre de FECHA (1: ene-jun, 2: jul-dic); sin fecha ->
+#   PERIODO=sin_fecha.
+# - Cohorte = clave del input (hash del contenido, no de la ruta). Volver a
+#   agregar la misma clave reemplaza sus archivos: idempotente. Cada cohorte
+#   tiene su propio manifiesto (escritura atómica): corridas en paralelo no
+#   pisan un archivo común.
+# - Orden de escritura: partes nuevas -> manifiesto -> borrar las viejas. Las
+#   consultas solo leen lo que lista un manifiesto, así que nunca ven una
+#   cohorte a medias.
+# - Cada parte va ordenada por programa y FECHA, con estadísticas por row
+#   group. consultar() descarta archivos con el manifiesto (períodos, rango
+#   de FECHA y programas de cada parte) y lee el resto con filtros de pyarrow
+#   (que saltea row groups por min / max).
+# Requiere pyarrow (extra opcional "columnar").
+# ============================================================
+
+DIR_COHORTES = "_cohortes"
+SIN_FECHA = "sin_fecha"
+
+# Filas por row group de cada parte: más chico = más poda por programa /
+# FECHA al consultar, más overhead de metadata.
+FILAS_POR_GRUPO = 50_000
+
+_VERSION = 1
+
+
+def requiere_pyarrow() -> None:
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ConfigError("El historial (Parquet) requiere pyarrow (pip install 'semillero_tool2[columnar]').")
+
+
+def periodos(fechas: pd.Series) -> pd.Series:
+    """FECHA ISO (AAAA-MM-DD) -> "AAAA-1" / "AAAA-2"; NA -> SIN_FECHA."""
+    s = fechas.astype("str")
+    mes = pd.to_numeric(s.str[5:7], errors="coerce")
+    out = s.str[:4] + "-" + (mes > 6).map({False: "1", True: "2"}).astype("str")
+    return out.where(mes.notna(), SIN_FECHA)
+
+
+class EscritorHistorial:
+    """
+    Agrega la DATA de una cohorte al historial, en uno o más bloques:
+
+        with EscritorHistorial(dir, clave, origen="2026-1.xlsx") as h:
+            h.agregar(df)          # por bloque, o una vez con todo
+            h.confirmar()          # recién con el output escrito
+
+    Sin confirmar(), las partes escritas se borran al salir.
+    """
+
+    def __init__(self, directorio: Path, clave: str, origen: str):
+        requiere_pyarrow()
+        self.directorio = Path(directorio)
+        self.clave = clave
+        self.origen = origen
+        self._token = uuid.uuid4().hex[:8]
+        self._partes: list[dict] = []
+        self._confirmado = False
+
+    def __enter__(self) -> "EscritorHistorial":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if not self._confirmado:
+            for parte in self._partes:
+                (self.directorio / parte["archivo"]).unlink(missing_ok=True)
+
+    def agregar(self, df: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not len(df):
+            return
+        prog = columna_programa(df)
+        per = periodos(df["FECHA"]) if "FECHA" in df.columns else pd.Series(SIN_FECHA, index=df.index)
+        orden = [c for c in (prog, "FECHA") if c is not None and c in df.columns]
+        for periodo, parte in df.groupby(per.to_numpy(), sort=True):
+            if orden:
+                parte = parte.sort_values(orden, kind="stable", na_position="last")
+            rel = Path(f"PERIODO={periodo}") / f"{self.clave}-{self._token}-{len(self._partes)}.parquet"
+            path = self.directorio / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tabla = pa.Table.from_pandas(tipos_columnar(parte), preserve_index=False)
+            pq.write_table(tabla, path, row_group_size=FILAS_POR_GRUPO)
+
+            fechas = parte["FECHA"].dropna() if "FECHA" in parte.columns else pd.Series(dtype="str")
+            self._partes.append({
+                "archivo": rel.as_posix(),
+                "periodo": str(periodo),
+                "filas": len(parte),
+                "fecha_min": None if fechas.empty else str(fechas.min()),
+                "fecha_max": None if fechas.empty else str(fechas.max()),
+                "programas": sorted(map(str, parte[prog].dropna().unique())) if prog else [],
+            })
+
+    def confirmar(self) -> Path:
+        """Publica la cohorte (manifiesto) y borra los archivos de la versión anterior."""
+        previas = _leer_manifiesto(self._manifiesto()) if self._manifiesto().exists() else None
+        manifiesto = {
+            "version": _VERSION,
+            "clave": self.clave,
+            "origen": self.origen,
+            "agregado": datetime.now().isoformat(timespec="seconds"),
+            "filas": sum(p["filas"] for p in self._partes),
+            "partes": self._partes,
+        }
+        path = self._manifiesto()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(manifiesto, ensure_ascii=False, indent=1), encoding="utf-8")
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self._confirmado = True
+
+        nuevas = {p["archivo"] for p in self._partes}
+        for parte in (previas or {}).get("partes", []):
+            if parte["archivo"] not in nuevas:
+                (self.directorio / parte["archivo"]).unlink(missing_ok=True)
+        return path
+
+    def _manifiesto(self) -> Path:
+        return self.directorio / DIR_COHORTES / f"{self.clave}.json"
+
+
+def _leer_manifiesto(path: Path) -> dict:
+    try:
+        m = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        raise ConfigError(f"Manifiesto de historial ilegible: {path} ({e})") from e
+    if m.get("version") != _VERSION:
+        raise ConfigError(f"Manifiesto de historial de otra versión: {path}")
+    return m
+
+
+def cohortes(directorio: Path) -> pd.DataFrame:
+    """Una fila por cohorte del historial: CLAVE, ORIGEN, AGREGADO, FILAS, PERIODOS."""
+    filas = []
+    for path in sorted((Path(directorio) / DIR_COHORTES).glob("*.json")):
+        m = _leer_manifiesto(path)
+        filas.append({
+            "CLAVE": m["clave"],
+            "ORIGEN": m["origen"],
+            "AGREGADO": m["agregado"],
+            "FILAS": m["filas"],
+            "PERIODOS": ", ".join(sorted({p["periodo"] for p in m["partes"]})),
+        })
+    return pd.DataFrame(filas, columns=["CLAVE", "ORIGEN", "AGREGADO", "FILAS", "PERIODOS"])
+
+
+def _parte_sirve(parte: dict, programas: set | None, desde: str | None, hasta: str | None) -> bool:
+    if programas is not None and not programas.intersection(parte["programas"]):
+        return False
+    if desde is not None or hasta is not None:
+        if parte["fecha_min"] is None:
+            return False
+        if desde is not None and parte["fecha_max"] < desde:
+            return False
+        if hasta is not None and parte["fecha_min"] > hasta:
+            return False
+    return True
+
+
+def archivos_consulta(
+    directorio: Path,
+    programas: list[str] | None = None,
+    desde: str | None = None,
+    hasta: str | None = None,
+) -> list[Path]:
+    """Partes que pueden tener filas de la consulta (poda por manifiesto, sin abrirlas)."""
+    directorio = Path(directorio)
+    progs = set(programas) if programas is not None else None
+    out = []
+    for path in sorted((directorio / DIR_COHORTES).glob("*.json")):
+        for parte in _leer_manifiesto(path)["partes"]:
+            if _parte_sirve(parte, progs, desde, hasta):
+                out.append(directorio / parte["archivo"])
+    return out
+
+
+def consultar(
+    directorio: Path,
+    programas: list[str] | None = None,
+    desde: str | None = None,
+    hasta: str | None = None,
+    columnas: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Filas del historial de esos programas (PROGRAMA_CANON, o PROGRAMA si la
+    cohorte no se canonizó) y con FECHA en [desde, hasta] (ISO, inclusive).
+    None = sin filtro. Solo abre las partes que pueden tener filas.
+    """
+    import pyarrow.parquet as pq
+
+    requiere_pyarrow()
+    if columnas is not None:
+        columnas = list(dict.fromkeys(columnas))
+    partes = []
+    for path in archivos_consulta(directorio, programas, desde, hasta):
+        nombres = pq.read_schema(path).names
+        filtros = []
+        if programas is not None:
+            prog = "PROGRAMA_CANON" if "PROGRAMA_CANON" in nombres else "PROGRAMA"
+            filtros.append((prog, "in", list(programas)))
+        if desde is not None:
+            filtros.append(("FECHA", ">=", desde))
+        if hasta is not None:
+            filtros.append(("FECHA", "<=", hasta))
+        cols = None if columnas is None else [c for c in columnas if c in nombres]
+        tabla = pq.read_table(path, columns=cols, filters=filtros or None)
+        if tabla.num_rows:
+            partes.append(tabla.to_pandas())
+    if not partes:
+        return pd.DataFrame(columns=columnas or [])
+    return pd.concat(partes, ignore_index=True)
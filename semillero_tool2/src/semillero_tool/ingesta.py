@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+import pandas as pd
+
+from .columns import normalizar_columnas_suffix
+from .errors import ExcelReadError, SchemaError, SemilleroToolError
+from .io_excel import LectorExcelStreaming, leer_excel
+
+
+# ============================================================
+# INGESTA MULTI-HOJA / MULTI-LIBRO
+# ------------------------------------------------------------
+# - Varias hojas (lista o "*" = todas) de uno o más libros -> UN df.
+# - Cada (libro, hoja) se parsea en un pool de procesos: openpyxl es Python
+#   puro, con threads no hay paralelismo real (GIL).
+# - Headers comparados normalizados (mismas reglas que la etapa base, sufijo
+#   __n incluido). La primera hoja leída es la referencia: las que traen otro
+#   conjunto de columnas quedan fuera y se reportan (REPORTE_HOJAS), sin
+#   frenar la carga; orden distinto o variantes de escritura ("Programa" vs
+#   "PROGRAMA") se alinean a los nombres de la referencia.
+# - Procedencia: columnas SOURCE_FILE (nombre del libro) y SHEET al final.
+# - usecols (proyeccion.py): se aplica en cada hoja al leerla; los headers se
+#   comparan solo en las columnas leídas.
+# ============================================================
+
+TODAS_LAS_HOJAS = "*"
+
+COLUMNAS_PROCEDENCIA = ["SOURCE_FILE", "SHEET"]
+
+COLUMNAS_REPORTE_HOJAS = ["SOURCE_FILE", "SHEET", "ESTADO", "FILAS", "FALTANTES", "SOBRANTES", "DETALLE"]
+
+
+def nombres_hojas(libro: Path) -> list[str]:
+    """Hojas del libro, en orden."""
+    from openpyxl import load_workbook
+
+    try:
+        wb = load_workbook(libro, read_only=True, keep_links=False)
+    except FileNotFoundError as e:
+        raise ExcelReadError(f"No existe input: {libro}") from e
+    except Exception as e:
+        raise ExcelReadError(f"Error leyendo Excel ({libro}): {e}") from e
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def _tareas(libros: list[Path], hojas: list[str] | None) -> list[tuple[Path, str]]:
+    """
+    (libro, hoja) a leer. hojas=None -> primera hoja de cada libro;
+    ["*"] -> todas; si no, esas hojas en cada libro (si falta, se reporta).
+    """
+    tareas = []
+    for libro in libros:
+        if hojas is None or list(hojas) == [TODAS_LAS_HOJAS]:
+            nombres = nombres_hojas(libro)
+            if not nombres:
+                raise ExcelReadError(f"El archivo no contiene hojas: {libro}")
+            elegidas = nombres if hojas is not None else nombres[:1]
+        else:
+            elegidas = list(hojas)
+        tareas.extend((libro, h) for h in elegidas)
+    return tareas
+
+
+def _leer_hoja(libro: Path, hoja: str, lector: str, usecols=None) -> tuple[pd.DataFrame | None, str | None]:
+    """Una hoja -> (df, None) o (None, error). Corre en los workers."""
+    try:
+        if lector == "streaming":
+            with LectorExcelStreaming(libro, hoja, usecols=usecols) as lect:
+                return lect.leer(), None
+        return leer_excel(libro, hoja, usecols=usecols), None
+    except SemilleroToolError as e:
+        return None, str(e)
+
+
+def _leer_todas(tareas: list[tuple[Path, str]], lector: str, workers: int | None, usecols=None) -> list:
+    workers = min(workers or os.cpu_count() or 1, len(tareas))
+    libros = [libro for libro, _ in tareas]
+    hojas = [hoja for _, hoja in tareas]
+    if workers <= 1:
+        return list(map(_leer_hoja, libros, hojas, repeat(lector), repeat(usecols)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_leer_hoja, libros, hojas, repeat(lector), repeat(usecols)))
+
+
+def _normalizadas(columnas) -> list[str]:
+    normalizado, _ = normalizar_columnas_suffix(pd.DataFrame(columns=columnas), copiar=False)
+    return list(normalizado.columns)
+
+
+def leer_hojas(
+    libros: list[Path],
+    hojas: list[str] | None = None,
+    lector: str = "pandas",
+    workers: int | None = None,
+    usecols=None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Lee hojas de uno o más libros y las une (ver bloque de arriba).
+    workers: procesos de lectura (default: CPUs); 1 = secuencial.
+    usecols: columnas a leer de cada hoja (proyeccion.SelectorColumnas); None = todas.
+    Devuelve (df_unido, REPORTE_HOJAS). Falla solo si ninguna hoja sirve.
+    """
+    tareas = _tareas(libros, hojas)
+    leidas = _leer_todas(tareas, lector, workers, usecols)
+
+    filas_rep: list[dict] = []
+    partes: list[pd.DataFrame] = []
+    ref_crudas: list | None = None
+    ref_por_norm: dict[str, object] = {}
+
+    for (libro, hoja), (df, error) in zip(tareas, leidas):
+        fila = {"SOURCE_FILE": libro.name, "SHEET": hoja, "ESTADO": "ok", "FILAS": 0,
+                "FALTANTES": "", "SOBRANTES": "", "DETALLE": ""}
+        filas_rep.append(fila)
+        if df is None:
+            fila.update(ESTADO="error", DETALLE=error)
+            continue
+
+        norm = _normalizadas(df.columns)
+        if ref_crudas is None:
+            choque = [c for c in COLUMNAS_PROCEDENCIA if c in norm]
+            if choque:
+                raise SchemaError(f"La hoja ya trae columnas de procedencia: {choque}")
+            ref_crudas = list(df.columns)
+            ref_por_norm = dict(zip(norm, ref_crudas))
+        else:
+            faltantes = [c for c in ref_por_norm if c not in set(norm)]
+            sobrantes = [c for c in norm if c not in ref_por_norm]
+            if faltantes or sobrantes:
+                fila.update(
+                    ESTADO="header_distinto",
+                    FALTANTES=", ".join(faltantes),
+                    SOBRANTES=", ".join(sobrantes),
+                    DETALLE="hoja omitida",
+                )
+                continue
+            df.columns = [ref_por_norm[c] for c in norm]
+            if list(df.columns) != ref_crudas:
+                df = df[ref_crudas]
+
+        df["SOURCE_FILE"] = libro.name
+        df["SHEET"] = hoja
+        fila["FILAS"] = len(df)
+        partes.append(df)
+
+    reporte = pd.DataFrame(filas_rep, columns=COLUMNAS_REPORTE_HOJAS)
+    if not partes:
+        detalle = "; ".join(f"{f['SOURCE_FILE']}/{f['SHEET']}: {f['DETALLE']}" for f in filas_rep)
+        raise ExcelReadError(f"Ninguna hoja legible: {detalle}")
+
+    df = partes[0] if len(partes) == 1 else pd.concat(partes, ignore_index=True)
+    return df, reporte
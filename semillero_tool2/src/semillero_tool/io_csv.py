@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import importlib.util
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from .columns import normalizar_columnas_suffix
+from .config import CSV_DELIMITADORES, CSV_ENCODING_ALTERNATIVO, FU_COLS
+from .errors import CsvReadError, SchemaError
+from .io_excel import FILAS_POR_BLOQUE
+
+
+# ============================================================
+# LECTURA CSV / TSV
+# ------------------------------------------------------------
+# - Encoding: BOM (utf-8 / utf-16) -> ese; si no, utf-8 si la muestra es
+#   UTF-8 válido; si no, config.CSV_ENCODING_ALTERNATIVO (exports de Excel
+#   en español: cp1252).
+# - Delimitador: el de config.CSV_DELIMITADORES que da un número de campos
+#   constante (y > 1) en las primeras líneas; empate -> más campos, y después
+#   el orden de la lista. Sin candidato: tab si es .tsv, coma si no.
+# - Dtypes explícitos por columna (nombre normalizado, igual que la etapa
+#   base), sin inferencia:
+#     F..U          -> float64 (nunca object). Si alguna celda no es número,
+#                      se relee la columna como texto y cast_fu_numeric la
+#                      convierte y reporta las coerciones, como con el Excel.
+#     resto (IDs)   -> texto: "00123" sigue siendo "00123", nunca un float.
+# - leer(): pyarrow.csv si está instalado (multi-thread), si no el parser C
+#   de pandas. leer_bloques(): parser C por bloques; F..U como texto para
+#   que todos los bloques tengan los mismos dtypes sin releer el archivo
+#   (cast_fu_numeric las parsea con el mismo redondeo: mismos float).
+# - usecols (proyeccion.py): solo esas columnas se parsean (include_columns
+#   de pyarrow / usecols del parser C, por posición).
+# Mismos NA que pd.read_csv / pd.read_excel ("", "NA", "N/A", "null", ...).
+# ============================================================
+
+SUFIJOS_CSV = (".csv", ".tsv")
+
+_MUESTRA_BYTES = 64 * 1024
+_MUESTRA_LINEAS = 50
+
+
+def es_csv(path: Path) -> bool:
+    return path.suffix.lower() in SUFIJOS_CSV
+
+
+@dataclass(frozen=True)
+class DialectoCsv:
+    encoding: str
+    delimitador: str
+
+
+def _detectar_encoding(muestra: bytes) -> str:
+    if muestra.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if muestra.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        # final=False: la muestra puede cortar un carácter multibyte al final.
+        codecs.getincrementaldecoder("utf-8")().decode(muestra, final=False)
+    except UnicodeDecodeError:
+        return CSV_ENCODING_ALTERNATIVO
+    return "utf-8"
+
+
+def _detectar_delimitador(lineas: list[str], path: Path) -> str:
+    mejor, mejor_campos = None, 1
+    for delim in CSV_DELIMITADORES:
+        campos = [len(fila) for fila in csv.reader(lineas, delimiter=delim)]
+        if campos and len(set(campos)) == 1 and campos[0] > mejor_campos:
+            mejor, mejor_campos = delim, campos[0]
+    if mejor is not None:
+        return mejor
+    return "\t" if path.suffix.lower() == ".tsv" else ","
+
+
+def detectar_dialecto(path: Path) -> DialectoCsv:
+    try:
+        with open(path, "rb") as f:
+            muestra = f.read(_MUESTRA_BYTES)
+    except FileNotFoundError as e:
+        raise CsvReadError(f"No existe input: {path}") from e
+    except OSError as e:
+        raise CsvReadError(f"Error leyendo CSV ({path}): {e}") from e
+
+    encoding = _detectar_encoding(muestra)
+    lineas = muestra.decode(encoding, errors="ignore").splitlines()
+    if len(muestra) == _MUESTRA_BYTES:
+        lineas = lineas[:-1]  # última línea posiblemente cortada
+    lineas = [x for x in lineas if x.strip()][:_MUESTRA_LINEAS]
+    return DialectoCsv(encoding, _detectar_delimitador(lineas, path))
+
+
+class LectorCsv:
+    """
+    Lector de un CSV / TSV (ver bloque de arriba). Misma interfaz que
+    io_excel.LectorExcelStreaming, así el pipeline lo usa igual:
+
+        with LectorCsv(path) as lector:
+            columnas = lector.encabezado()
+            df = lector.leer()              # o: for bloque in lector.leer_bloques()
+    """
+
+    def __init__(
+        self,
+        input_path: Path,
+        filas_por_bloque: int = FILAS_POR_BLOQUE,
+        usecols: Callable[[object], bool] | None = None,
+    ):
+        if filas_por_bloque <= 0:
+            raise ValueError("filas_por_bloque debe ser > 0")
+        self.input_path = input_path
+        self.filas_por_bloque = filas_por_bloque
+        self.usecols = usecols
+        self.dialecto = detectar_dialecto(input_path)
+        self._columnas: list | None = None
+
+    def __enter__(self) -> "LectorCsv":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def _read_csv(self, **kw):
+        try:
+            return pd.read_csv(
+                self.input_path,
+                sep=self.dialecto.delimitador,
+                encoding=self.dialecto.encoding,
+                float_precision="round_trip",
+                **kw,
+            )
+        except pd.errors.EmptyDataError as e:
+            raise SchemaError(f"CSV vacío (sin header): {self.input_path}") from e
+        except (UnicodeDecodeError, pd.errors.ParserError) as e:
+            raise CsvReadError(f"Error leyendo CSV ({self.input_path}): {e}") from e
+
+    def encabezado(self) -> list:
+        """Nombres de columna (duplicados como .1, .2 ..., igual que pandas)."""
+        if self._columnas is None:
+            self._columnas = list(self._read_csv(nrows=0, dtype="str").columns)
+        return list(self._columnas)
+
+    def _indices(self) -> list[int] | None:
+        """Posiciones de las columnas a leer (None = todas)."""
+        if self.usecols is None:
+            return None
+        return [j for j, c in enumerate(self.encabezado()) if self.usecols(c)]
+
+    def _dtypes(self, fu_numerico: bool) -> dict:
+        """dtype por columna a leer (en orden de archivo)."""
+        columnas = self.encabezado()
+        normalizado, _ = normalizar_columnas_suffix(pd.DataFrame(columns=columnas), copiar=False)
+        fu = set(FU_COLS) if fu_numerico else set()
+        # El resto (IDs de COLUMNAS_ID incluidos): texto sin inferir.
+        dtypes = [(c, "float64" if n in fu else "str") for c, n in zip(columnas, normalizado.columns)]
+        indices = self._indices()
+        if indices is not None:
+            dtypes = [dtypes[j] for j in indices]
+        return dict(dtypes)
+
+    def leer(self) -> pd.DataFrame:
+        columnas = self.encabezado()
+        if not columnas:
+            raise SchemaError(f"CSV vacío (sin columnas): {self.input_path}")
+        leer = self._leer_arrow if importlib.util.find_spec("pyarrow") else self._leer_c
+        try:
+            return leer(self._dtypes(fu_numerico=True))
+        except ValueError:
+            # Alguna celda F..U no es número: F..U como texto -> cast_fu_numeric.
+            return leer(self._dtypes(fu_numerico=False))
+
+    def _leer_c(self, dtypes: dict) -> pd.DataFrame:
+        return self._read_csv(dtype=dtypes, usecols=self._indices())
+
+    def _leer_arrow(self, dtypes: dict) -> pd.DataFrame:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        from pandas._libs.parsers import STR_NA_VALUES
+
+        columnas = list(dtypes)
+        encoding = "utf8" if self.dialecto.encoding in ("utf-8", "utf-8-sig") else self.dialecto.encoding
+        tipos = {c: (pa.float64() if t == "float64" else pa.string()) for c, t in dtypes.items()}
+        try:
+            tabla = pacsv.read_csv(
+                self.input_path,
+                # Nombres ya resueltos por pandas (duplicados .1): se saltea el header.
+                read_options=pacsv.ReadOptions(encoding=encoding, column_names=self.encabezado(), skip_rows=1),
+                parse_options=pacsv.ParseOptions(delimiter=self.dialecto.delimitador, newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=tipos,
+                    include_columns=columnas,
+                    null_values=sorted(STR_NA_VALUES),
+                    strings_can_be_null=True,
+                ),
+            )
+        except pa.ArrowInvalid as e:
+            if "conversion error" in str(e):
+                raise ValueError(str(e)) from e
+            # Filas con otro número de campos, etc.: el parser C da el error de siempre.
+            return self._leer_c(dtypes)
+        df = tabla.to_pandas()
+        df.columns = columnas
+        return df
+
+    def leer_bloques(self) -> Iterator[pd.DataFrame]:
+        """
+        El CSV en DataFrames de hasta filas_por_bloque filas (índice global).
+        Siempre entrega al menos un bloque (0 filas si solo tiene header).
+        """
+        dtypes = self._dtypes(fu_numerico=False)
+        entregados = 0
+        with self._read_csv(dtype=dtypes, usecols=self._indices(), chunksize=self.filas_por_bloque) as lector:
+            try:
+                for df in lector:
+                    entregados += 1
+                    yield df
+            except (UnicodeDecodeError, pd.errors.ParserError) as e:
+                raise CsvReadError(f"Error leyendo CSV ({self.input_path}): {e}") from e
+        if not entregados:
+            yield pd.DataFrame({c: pd.Series(np.empty(0, dtype=object), dtype=t) for c, t in dtypes.items()})
@@ -1,20 +1,40 @@
 from __future__ import annotations
 
+import datetime as dt
+import pickle
+import tempfile
+from dataclasses import dataclass
+from itertools import zip_longest
 from pathlib import Path
+from typing import Callable, Iterator
+import numpy as np
 import pandas as pd
 
 from .errors import ExcelReadError, SchemaError
 
 
-def leer_excel(input_path: Path, sheet: str | None) -> pd.DataFrame:
+LECTORES_EXCEL = ("pandas", "streaming")
+
+# Streaming: filas por bloque al construir columnas y columnas por grupo al
+# inferir dtypes. Acotan la memoria transitoria (no el resultado).
+FILAS_POR_BLOQUE = 10_000
+COLUMNAS_POR_GRUPO = 16
+
+
+def leer_excel(
+    input_path: Path,
+    sheet: str | None,
+    usecols: Callable[[object], bool] | None = None,
+) -> pd.DataFrame:
+    """usecols: nombre de columna -> se lee (proyeccion.SelectorColumnas); None = todas."""
     try:
-        if sheet:
-            df = pd.read_excel(input_path, sheet_name=sheet, engine="openpyxl")
-        else:
-            xls = pd.ExcelFile(input_path, engine="openpyxl")
-            if not xls.sheet_names:
+        # Un solo open: ExcelFile resuelve la hoja y parsea desde el mismo libro.
+        with pd.ExcelFile(input_path, engine="openpyxl") as xls:
+            if not sheet and not xls.sheet_names:
                 raise ExcelReadError("El archivo no contiene hojas.")
-            df = pd.read_excel(input_path, sheet_name=xls.sheet_names[0], engine="openpyxl")
+            df = xls.parse(sheet_name=sheet or xls.sheet_names[0], usecols=usecols)
+    except ExcelReadError:
+        raise
     except FileNotFoundError as e:
         raise ExcelReadError(f"No existe input: {input_path}") from e
     except ValueError as e:
@@ -23,6 +43,10 @@ def leer_excel(input_path: Path, sheet: str | None) -> pd.DataFrame:
     except Exception as e:
         raise ExcelReadError(f"Error leyendo Excel ({input_path}): {e}") from e
 
+    return _validar_leido(df)
+
+
+def _validar_leido(df) -> pd.DataFrame:
     # Guardrail: pandas puede devolver dict si sheet_name es lista o None raro.
     if isinstance(df, dict):
         raise ExcelReadError(
@@ -39,6 +63,478 @@ def leer_excel(input_path: Path, sheet: str | None) -> pd.DataFrame:
     return df
 
 
+# ============================================================
+# LECTURA STREAMING (openpyxl read_only + iter_rows(values_only))
+# ------------------------------------------------------------
+# - Un solo open del libro: la hoja se resuelve sobre el mismo workbook.
+# - encabezado() lee SOLO la primera fila (checks de esquema antes del cuerpo).
+# - leer() recorre filas sin crear objetos celda y arma columnas por bloques
+#   de FILAS_POR_BLOQUE (arrays object), sin lista de filas de toda la hoja.
+# - Los dtypes se infieren con el mismo TextParser que usa pd.read_excel,
+#   por grupos de columnas: el DataFrame resultante es el mismo.
+# - leer_bloques() entrega la hoja en DataFrames de filas_por_bloque filas
+#   con el dtype de la hoja completa (dos pasadas, spool temporal en disco).
+# - usecols (proyeccion.py): cada fila se recorta a esas columnas apenas se
+#   lee; las demás no se transponen, ni se parsean, ni van al spool.
+# Diferencia conocida: con values_only un texto literal igual a un código de
+# error de Excel ("#DIV/0!", "#REF!", ...) se lee como NaN, igual que el error.
+# ============================================================
+
+def _codigos_error() -> frozenset[str]:
+    from openpyxl.cell.cell import ERROR_CODES
+
+    return frozenset(ERROR_CODES)
+
+
+def _convertir_fila(fila: tuple, errores: frozenset[str]) -> list:
+    """
+    Misma conversión que el reader openpyxl de pandas (_convert_cell):
+    vacío -> "", error -> NaN, float entero -> int. Recorta vacíos finales.
+    """
+    out = []
+    for v in fila:
+        if v is None:
+            v = ""
+        elif v.__class__ is float:
+            i = int(v)
+            if i == v:
+                v = i
+        elif v.__class__ is str and v in errores:
+            v = np.nan
+        out.append(v)
+    while out and out[-1] == "":
+        out.pop()
+    return out
+
+
+def _nombres_columnas(encabezado: list) -> list:
+    """Nombres finales (Unnamed: i, duplicados .1, .2 ...) exactamente como pandas."""
+    from pandas.io.parsers import TextParser
+
+    if not encabezado:
+        return []
+    return list(TextParser([list(encabezado)], header=0, skip_blank_lines=False).read().columns)
+
+
+class LectorExcelStreaming:
+    """
+    Lector de una hoja .xlsx en modo streaming (ver bloque de arriba).
+
+    Uso:
+        with LectorExcelStreaming(path, sheet) as lector:
+            columnas = lector.encabezado()
+            df = lector.leer()              # o: for bloque in lector.leer_bloques()
+
+    usecols: nombre final de columna -> se lee; encabezado() sigue
+    devolviendo el header completo (checks de esquema).
+    """
+
+    def __init__(
+        self,
+        input_path: Path,
+        sheet: str | None,
+        filas_por_bloque: int = FILAS_POR_BLOQUE,
+        columnas_por_grupo: int = COLUMNAS_POR_GRUPO,
+        usecols: Callable[[object], bool] | None = None,
+    ):
+        if filas_por_bloque <= 0 or columnas_por_grupo <= 0:
+            raise ValueError("filas_por_bloque y columnas_por_grupo deben ser > 0")
+        self.input_path = input_path
+        self.filas_por_bloque = filas_por_bloque
+        self.columnas_por_grupo = columnas_por_grupo
+        self.usecols = usecols
+        self._errores = _codigos_error()
+        self._wb = self._abrir(input_path)
+        try:
+            self._ws = self._resolver_hoja(sheet)
+        except Exception:
+            self.cerrar()
+            raise
+
+    def __enter__(self) -> "LectorExcelStreaming":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+    @staticmethod
+    def _abrir(input_path: Path):
+        from openpyxl import load_workbook
+
+        try:
+            return load_workbook(input_path, read_only=True, data_only=True, keep_links=False)
+        except FileNotFoundError as e:
+            raise ExcelReadError(f"No existe input: {input_path}") from e
+        except Exception as e:
+            raise ExcelReadError(f"Error leyendo Excel ({input_path}): {e}") from e
+
+    def _resolver_hoja(self, sheet: str | None):
+        nombres = self._wb.sheetnames
+        if sheet:
+            if sheet not in nombres:
+                raise ExcelReadError(f"Lectura inválida de Excel: Worksheet named '{sheet}' not found")
+            ws = self._wb[sheet]
+        else:
+            if not nombres:
+                raise ExcelReadError("El archivo no contiene hojas.")
+            ws = self._wb[nombres[0]]
+        # Las dimensiones guardadas pueden mentir (igual que en pandas).
+        ws.reset_dimensions()
+        return ws
+
+    def cerrar(self) -> None:
+        wb = getattr(self, "_wb", None)
+        if wb is not None:
+            wb.close()
+            self._wb = None
+
+    def _filas(self):
+        try:
+            for fila in self._ws.iter_rows(values_only=True):
+                yield _convertir_fila(fila, self._errores)
+        except Exception as e:
+            raise ExcelReadError(f"Error leyendo Excel ({self.input_path}): {e}") from e
+
+    def encabezado(self) -> list:
+        """
+        Nombres de columna de la hoja leyendo solo la primera fila.
+        Mismos nombres que pd.read_excel (salvo columnas 'Unnamed' que solo
+        existan por filas de datos más anchas que el header).
+        """
+        primera = next(self._filas(), None)
+        return _nombres_columnas(primera or [])
+
+    def _recorrer(self):
+        """
+        Primero el header; después bloques de hasta filas_por_bloque filas
+        (listas ya convertidas). Filas vacías intermedias se conservan como ()
+        y las finales se descartan, igual que pandas.
+
+        Con usecols el header sale como los nombres finales de las columnas
+        elegidas (únicos: _nombres_columnas los deja igual) y cada fila
+        recortada a ellas. Una fila vacía se decide antes de recortar: si solo
+        tenía datos en columnas no leídas, sigue siendo una fila.
+        """
+        filas = self._filas()
+        header = next(filas, None)
+        indices = None
+        if header is not None and self.usecols is not None:
+            nombres = _nombres_columnas(header)
+            indices = [j for j, n in enumerate(nombres) if self.usecols(n)]
+            header = [nombres[j] for j in indices]
+        yield header
+
+        bloque: list = []
+        vacias_pendientes = 0  # filas vacías: solo cuentan si después hay datos
+        for fila in filas:
+            if not fila:
+                vacias_pendientes += 1
+                continue
+            if vacias_pendientes:
+                bloque.extend([()] * vacias_pendientes)
+                vacias_pendientes = 0
+            if indices is not None:
+                n = len(fila)
+                fila = [fila[j] if j < n else "" for j in indices]
+            bloque.append(fila)
+            if len(bloque) >= self.filas_por_bloque:
+                yield bloque
+                bloque = []
+        if bloque:
+            yield bloque
+
+    def leer(self) -> pd.DataFrame:
+        recorrido = self._recorrer()
+        header = next(recorrido)
+        if header is None:
+            return _validar_leido(pd.DataFrame())
+
+        columnas: list[list[np.ndarray]] = []  # por columna: arrays object por bloque
+        n_filas = 0
+        for bloque in recorrido:
+            arrays = _columnas_de_bloque(bloque)
+            for _ in range(len(columnas), len(arrays)):
+                columnas.append([_vacias(n_filas)] if n_filas else [])
+            for j, col in enumerate(columnas):
+                col.append(arrays[j] if j < len(arrays) else _vacias(len(bloque)))
+            n_filas += len(bloque)
+
+        ancho = max(len(header), len(columnas))
+        if ancho == 0:
+            return _validar_leido(pd.DataFrame())
+        header = _rellenar(header, ancho)
+        if n_filas == 0:
+            return _validar_leido(self._parsear_header(header))
+        for _ in range(len(columnas), ancho):
+            columnas.append([_vacias(n_filas)])
+
+        arrays = []
+        for j in range(ancho):
+            arrays.append(np.concatenate(columnas[j]) if len(columnas[j]) > 1 else columnas[j][0])
+            columnas[j] = None  # libera bloques a medida que se concatenan
+        return _validar_leido(self._parsear(arrays, _nombres_columnas(header)))
+
+    def leer_bloques(self) -> Iterator[pd.DataFrame]:
+        """
+        La hoja en DataFrames de hasta filas_por_bloque filas (índice global),
+        con memoria acotada por bloque. pd.concat(bloques) == leer().
+
+        Dos pasadas: la primera recorre el libro una sola vez, guarda cada
+        bloque crudo en un spool temporal (pickle) y anota el dtype que pandas
+        infiere por bloque; con eso se decide el dtype GLOBAL de cada columna
+        (el mismo que daría leer la hoja entera). La segunda parsea cada bloque
+        desde el spool y lo lleva a ese dtype. Siempre entrega al menos un
+        bloque (0 filas si la hoja solo tiene header).
+        """
+        recorrido = self._recorrer()
+        header = next(recorrido)
+        if header is None:
+            _validar_leido(pd.DataFrame())
+
+        with tempfile.TemporaryDirectory(prefix="semillero_bloques_") as tmp:
+            spool: list[tuple[Path, int]] = []
+            infos: list[dict[int, _InfoColumna]] = []
+            ancho = len(header)
+            for i, bloque in enumerate(recorrido):
+                arrays = _columnas_de_bloque(bloque)
+                ancho = max(ancho, len(arrays))
+                nombres = [f"c{j}" for j in range(len(arrays))]
+                parseado = self._parsear(arrays, nombres)
+                infos.append({j: _InfoColumna.de(arrays[j], parseado[nombres[j]]) for j in range(len(arrays))})
+                del parseado
+                path = Path(tmp) / f"bloque_{i}.pkl"
+                with open(path, "wb") as f:
+                    pickle.dump(arrays, f, protocol=pickle.HIGHEST_PROTOCOL)
+                spool.append((path, len(bloque)))
+                del arrays
+
+            if ancho == 0:
+                _validar_leido(pd.DataFrame())
+            header = _rellenar(header, ancho)
+            if not spool:
+                yield self._parsear_header(header)
+                return
+
+            nombres = _nombres_columnas(header)
+            plan = [_plan_columna([info.get(j) for info in infos]) for j in range(ancho)]
+            forzar_objeto = {nombres[j] for j, (modo, _) in enumerate(plan) if modo != "inferir"}
+
+            # Columnas que quedan object: pandas unifica valores iguales de
+            # distinto tipo (1 / True) al primero que aparece en la columna
+            # entera. Solo las claves que de verdad mezclan tipos.
+            memos = {
+                j: memo for j, (_, dtype) in enumerate(plan) if dtype == np.dtype(object)
+                if (memo := _memo_iguales([info.get(j) for info in infos]))
+            }
+
+            inicio = 0
+            for path, n in spool:
+                with open(path, "rb") as f:
+                    arrays = pickle.load(f)
+                path.unlink()
+                arrays += [_vacias(n) for _ in range(len(arrays), ancho)]
+                df = self._parsear(arrays, nombres, forzar_objeto)
+                del arrays
+                for j, (modo, dtype) in enumerate(plan):
+                    if modo == "bool":
+                        df.isetitem(j, df.iloc[:, j].map(_a_bool))
+                    if dtype is not None and df.dtypes.iloc[j] != dtype:
+                        df.isetitem(j, df.iloc[:, j].astype(dtype))
+                for j, memo in memos.items():
+                    df.isetitem(j, _unificar_iguales(df.iloc[:, j], memo))
+                df.index = pd.RangeIndex(inicio, inicio + n)
+                inicio += n
+                yield df
+
+    def _parsear_header(self, header: list) -> pd.DataFrame:
+        from pandas.io.parsers import TextParser
+
+        return TextParser([header], header=0, skip_blank_lines=False).read()
+
+    def _parsear(
+        self,
+        arrays: list[np.ndarray],
+        nombres: list,
+        forzar_objeto: set | None = None,
+    ) -> pd.DataFrame:
+        """
+        Inferencia de dtypes con el TextParser de pd.read_excel, por grupos de
+        columnas (la inferencia es por columna, así que el resultado no cambia).
+        Solo el grupo en curso se materializa como filas.
+        forzar_objeto: columnas que se parsean con dtype object (sin inferir).
+        """
+        from pandas.io.parsers import TextParser
+
+        partes = []
+        for ini in range(0, len(arrays), self.columnas_por_grupo):
+            grupo = nombres[ini:ini + self.columnas_por_grupo]
+            dtype = {c: object for c in grupo if c in forzar_objeto} if forzar_objeto else None
+            filas = list(zip(*arrays[ini:ini + self.columnas_por_grupo]))
+            partes.append(
+                TextParser(filas, header=None, names=grupo, dtype=dtype or None, skip_blank_lines=False).read()
+            )
+            del filas
+        return pd.concat(partes, axis=1) if len(partes) > 1 else partes[0]
+
+
+def _columnas_de_bloque(bloque: list) -> list[np.ndarray]:
+    """Transpone un bloque de filas (irregulares) a arrays object por columna."""
+    arrays = []
+    for valores in zip_longest(*bloque, fillvalue=""):
+        arr = np.empty(len(bloque), dtype=object)
+        arr[:] = valores
+        arrays.append(arr)
+    return arrays
+
+
+# Lo que hace el parser de pandas con columnas object (sanitize_objects):
+# cada valor se reemplaza por el primero igual (por hash) de la columna. Con
+# las celdas ya convertidas (_convertir_fila: float entero -> int) los únicos
+# iguales de distinto tipo son bools contra 0 / 1: solo esas claves se siguen
+# entre bloques (memoria constante, no un memo por valor distinto).
+_CLAVES_IGUALES = (0, 1)
+
+
+def _primeros_iguales(crudo: np.ndarray) -> tuple:
+    """Por clave de _CLAVES_IGUALES presente en el bloque: (clave, primer valor, tipos)."""
+    out = []
+    for clave in _CLAVES_IGUALES:
+        idx = np.flatnonzero(crudo == clave)
+        if idx.size:
+            out.append((clave, crudo[idx[0]], frozenset(map(type, crudo[idx]))))
+    return tuple(out)
+
+
+def _memo_iguales(infos: list["_InfoColumna | None"]) -> dict:
+    """clave -> primer valor de la columna entera, solo si esa clave mezcla tipos."""
+    primeros: dict = {}
+    tipos: dict = {}
+    for info in infos:
+        if info is None:
+            continue
+        for clave, valor, ts in info.iguales:
+            primeros.setdefault(clave, valor)
+            tipos.setdefault(clave, set()).update(ts)
+    return {c: v for c, v in primeros.items() if len(tipos[c]) > 1}
+
+
+def _unificar_iguales(s: pd.Series, memo: dict) -> pd.Series:
+    """Reemplaza los valores iguales a cada clave del memo por su primer valor."""
+    valores = s.to_numpy(dtype=object, copy=True)
+    for clave, primero in memo.items():
+        valores[valores == clave] = primero
+    return pd.Series(valores, index=s.index, name=s.name, dtype=object)
+
+
+def _vacias(n: int) -> np.ndarray:
+    return np.full(n, "", dtype=object)
+
+
+def _rellenar(fila: list, ancho: int) -> list:
+    return list(fila) + [""] * (ancho - len(fila))
+
+
+# dtypes numéricos que pandas unifica al inferir una columna entera
+# (bool+int -> int, cualquier NA o float -> float).
+_DTYPES_NUMERICOS = (np.dtype(bool), np.dtype("int64"), np.dtype("float64"))
+
+# Textos que el parser de pandas acepta como booleanos (true/false_values default).
+_TEXTOS_BOOL = {"True": True, "TRUE": True, "true": True, "False": False, "FALSE": False, "false": False}
+
+
+def _es_bool_like(v) -> bool:
+    return v is True or v is False or (v.__class__ is str and v in _TEXTOS_BOOL)
+
+
+def _a_bool(v):
+    return _TEXTOS_BOOL.get(v, v) if v.__class__ is str else v
+
+
+@dataclass(frozen=True)
+class _InfoColumna:
+    dtype: object      # dtype inferido en el bloque
+    todo_na: bool
+    hay_na: bool
+    numerico: bool     # el bloque salió de la conversión numérica de pandas
+    bool_like: bool    # valores crudos no-NA: todos bool o textos True/False
+    solo_texto: bool   # valores crudos no-NA: todos str
+    primero_int: bool  # primer valor crudo es int (bool incluido)
+    iguales: tuple     # _primeros_iguales del bloque
+
+    @classmethod
+    def de(cls, crudo: np.ndarray, parseado: pd.Series) -> "_InfoColumna":
+        na = parseado.isna().to_numpy()
+        valores = crudo[~na]
+        tipo = pd.api.types.infer_dtype(valores, skipna=False)
+        if tipo in ("empty", "boolean"):
+            bool_like = True
+        elif tipo in ("string", "mixed"):
+            bool_like = all(_es_bool_like(v) for v in pd.unique(valores))
+        else:
+            bool_like = False
+        dtype = parseado.dtype
+        return cls(
+            dtype=dtype,
+            todo_na=bool(na.all()),
+            hay_na=bool(na.any()),
+            # bool sale de la vía numérica solo con bools reales (no textos True/False)
+            numerico=dtype in _DTYPES_NUMERICOS and (dtype != np.dtype(bool) or tipo == "boolean"),
+            bool_like=bool_like,
+            solo_texto=tipo in ("string", "empty"),
+            primero_int=len(crudo) > 0 and isinstance(crudo[0], int),
+            iguales=_primeros_iguales(crudo),
+        )
+
+
+def _plan_columna(infos: list[_InfoColumna | None]) -> tuple[str, object]:
+    """
+    dtype global de una columna a partir de lo inferido por bloque, con la
+    misma cascada que pandas: numérico -> booleano -> valores originales
+    ("str" si todo es texto). None en infos = el bloque no llegaba a esa
+    columna (todo vacío).
+
+    Devuelve (modo, dtype_final | None si se deja el inferido):
+      "inferir": parseo normal; "objeto": parseo sin inferir;
+      "bool": parseo sin inferir y textos True/False -> bool.
+    """
+    hay_na = any(i is None or i.hay_na for i in infos)
+    activos = [i for i in infos if i is not None and not i.todo_na]
+    if not activos:
+        return "inferir", None
+
+    if all(i.numerico for i in activos):
+        tipos = {i.dtype for i in activos}
+        if hay_na or np.dtype("float64") in tipos:
+            return "inferir", np.dtype("float64")
+        if np.dtype("int64") in tipos:
+            return "inferir", np.dtype("int64")
+        return "inferir", np.dtype(bool)
+
+    # Falla la conversión numérica de la columna entera: pandas intenta
+    # booleanos solo si el primer valor no es int.
+    primero_int = infos[0] is not None and infos[0].primero_int
+    if not primero_int and all(i.bool_like for i in activos):
+        return "bool", np.dtype(object) if hay_na else np.dtype(bool)
+
+    # Un solo dtype por bloque se conserva, salvo bool/object salidos de textos
+    # True/False (p.ej. ["", "True"] -> object [nan, True]) que globalmente no
+    # se convierten.
+    tipos = {i.dtype for i in activos}
+    if len(tipos) == 1 and not any(i.bool_like for i in activos):
+        return "inferir", tipos.pop()
+    # Mezcla (p.ej. números en un bloque y texto en otro): pandas deja los
+    # valores originales; texto puro -> "str".
+    if all(i.solo_texto for i in activos):
+        return "objeto", pd.StringDtype(na_value=np.nan)
+    return "objeto", np.dtype(object)
+
+
+def leer_excel_streaming(input_path: Path, sheet: str | None) -> pd.DataFrame:
+    """Atajo: LectorExcelStreaming(...).leer() con cierre garantizado del libro."""
+    with LectorExcelStreaming(input_path, sheet) as lector:
+        return lector.leer()
+
+
 def escribir_excel(output_path: Path, data: pd.DataFrame, reportes: dict[str, pd.DataFrame] | None = None) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     reportes = reportes or {}
@@ -48,3 +544,105 @@ def escribir_excel(output_path: Path, data: pd.DataFrame, reportes: dict[str, pd
         for name, rep in reportes.items():
             sheet_name = name[:31]
             rep.to_excel(w, sheet_name=sheet_name, index=False)
+
+
+# ============================================================
+# Escritura por bloques
+# ============================================================
+# Límites de hoja de Excel (los mismos que valida DataFrame.to_excel).
+MAX_FILAS_EXCEL = 1_048_576
+MAX_COLUMNAS_EXCEL = 16_384
+
+
+def _valor_excel(v) -> tuple[object, str | None]:
+    """
+    Celda como la escribe DataFrame.to_excel (na_rep="", inf_rep="inf"):
+    (valor python, number_format | None).
+    """
+    if pd.api.types.is_scalar(v) and pd.isna(v):
+        return "", None
+    if pd.api.types.is_integer(v):
+        return int(v), None
+    if pd.api.types.is_float(v):
+        if np.isinf(v):
+            return ("inf" if v > 0 else "-inf"), None
+        return float(v), None
+    if pd.api.types.is_bool(v):
+        return bool(v), None
+    if isinstance(v, dt.datetime):
+        if v.tzinfo is not None:
+            raise ValueError("Excel no soporta datetimes con zona horaria.")
+        return v, "YYYY-MM-DD HH:MM:SS"
+    if isinstance(v, dt.date):
+        return v, "YYYY-MM-DD"
+    if isinstance(v, dt.timedelta):
+        return v.total_seconds() / 86400, "0"
+    return str(v), None
+
+
+class EscritorExcelStreaming:
+    """
+    Escribe un .xlsx hoja por hoja y bloque por bloque (openpyxl write_only):
+    las filas van a disco a medida que llegan, sin retener el DataFrame.
+    El contenido es el mismo que escribir_excel (to_excel, index=False).
+
+    Las hojas se crean al abrir, en el orden dado (write_only no permite
+    reordenarlas después). El header de cada hoja sale del primer bloque
+    agregado; una hoja sin bloques queda vacía. Si hay una excepción dentro
+    del with, el archivo no se escribe.
+    """
+
+    def __init__(self, output_path: Path, hojas: list[str]):
+        from openpyxl import Workbook
+
+        self.output_path = output_path
+        self._wb = Workbook(write_only=True)
+        self._hojas = {h: self._wb.create_sheet(h[:31]) for h in hojas}
+        self._filas = dict.fromkeys(hojas, 0)  # filas de datos (sin header)
+        self._con_header: set[str] = set()
+
+    def __enter__(self) -> "EscritorExcelStreaming":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.guardar()
+
+    def escrita(self, hoja: str) -> bool:
+        """True si la hoja ya tiene header."""
+        return hoja in self._con_header
+
+    def agregar(self, hoja: str, df: pd.DataFrame) -> None:
+        from openpyxl.cell import WriteOnlyCell
+
+        ws = self._hojas[hoja]
+        if df.shape[1] > MAX_COLUMNAS_EXCEL or self._filas[hoja] + len(df) > MAX_FILAS_EXCEL:
+            raise ValueError(
+                f"Hoja {hoja} demasiado grande para Excel "
+                f"(máximo {MAX_FILAS_EXCEL} filas, {MAX_COLUMNAS_EXCEL} columnas)."
+            )
+        if df.shape[1] == 0:
+            return
+
+        def _fila(valores) -> list:
+            fila = []
+            for v in valores:
+                valor, fmt = _valor_excel(v)
+                if fmt is None:
+                    fila.append(valor)
+                else:
+                    celda = WriteOnlyCell(ws, value=valor)
+                    celda.number_format = fmt
+                    fila.append(celda)
+            return fila
+
+        if hoja not in self._con_header:
+            ws.append(_fila(df.columns))
+            self._con_header.add(hoja)
+        for valores in df.itertuples(index=False, name=None):
+            ws.append(_fila(valores))
+        self._filas[hoja] += len(df)
+
+    def guardar(self) -> None:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._wb.save(self.output_path)
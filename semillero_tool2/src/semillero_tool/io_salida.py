@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+
+from .config import COLUMNAS_ID, FU_COLS
+from .errors import ConfigError
+from .io_excel import escribir_excel
+
+
+# ============================================================
+# FORMATOS DE SALIDA
+# ------------------------------------------------------------
+# - xlsx: un libro con DATA + hojas REPORTE_* (escribir_excel, openpyxl).
+# - parquet / feather / csv: bundle = directorio con un archivo por hoja
+#   (DATA.parquet, REPORTE_FU_CAST.parquet, ...). Mucho más rápido que
+#   openpyxl y pensado para volver a cargarlo en pandas.
+# parquet y feather (Arrow IPC) requieren pyarrow (extra opcional "columnar").
+# ============================================================
+FORMATOS_SALIDA = ("xlsx", "parquet", "feather", "csv")
+
+_EXTENSION = {"parquet": ".parquet", "feather": ".feather", "csv": ".csv"}
+
+# infer_dtype de columnas object que Arrow guarda tal cual; el resto (mezclas
+# tipo 1 / "a" / True) se guarda como texto.
+_OBJECT_ARROW = frozenset({
+    "string", "empty", "boolean", "integer", "floating", "mixed-integer-float",
+    "datetime", "datetime64", "date", "decimal",
+})
+
+
+def requiere_pyarrow(formato: str) -> None:
+    """Falla temprano (ConfigError) si el formato necesita pyarrow y no está instalado."""
+    if formato in ("parquet", "feather") and importlib.util.find_spec("pyarrow") is None:
+        raise ConfigError(
+            f"--formato {formato} requiere pyarrow (pip install 'semillero_tool2[columnar]')."
+        )
+
+
+def tipos_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    dtypes estables para formatos columnares:
+    - IDs (COLUMNAS_ID o 'ID*') -> string (nunca float / "123.0")
+    - FU_COLS -> float64
+    - columnas object con tipos mezclados -> string (NA preservado)
+    Devuelve un df nuevo (no toca el original).
+    """
+    out = df.reset_index(drop=True)
+    for i, c in enumerate(out.columns):
+        s = out.iloc[:, i]
+        if c in COLUMNAS_ID or str(c).startswith("ID"):
+            s = s.where(s.isna(), s.astype(str)).astype("string")
+        elif c in FU_COLS:
+            s = s.astype("float64")
+        elif s.dtype == object:
+            tipo = pd.api.types.infer_dtype(s, skipna=True)
+            if tipo in ("string", "empty"):
+                s = s.astype("string")
+            elif tipo not in _OBJECT_ARROW:
+                s = s.where(s.isna(), s.astype(str)).astype("string")
+        else:
+            continue
+        out.isetitem(i, s)
+    out.columns = [str(c) for c in out.columns]
+    return out
+
+
+def escribir_tabla(path: Path, formato: str, df: pd.DataFrame) -> None:
+    """Una tabla en path con el formato dado (parquet | feather | csv)."""
+    df = tipos_columnar(df)
+    if formato == "parquet":
+        df.to_parquet(path, index=False)
+    elif formato == "feather":
+        df.to_feather(path)
+    elif formato == "csv":
+        if df.shape[1] == 0:
+            path.write_text("", encoding="utf-8")  # sin columnas: archivo vacío
+        else:
+            df.to_csv(path, index=False)
+    else:
+        raise ConfigError(f"formato de tabla inválido: {formato}")
+
+
+def escribir_bundle(
+    output_dir: Path,
+    formato: str,
+    data: pd.DataFrame,
+    reportes: dict[str, pd.DataFrame] | None = None,
+) -> None:
+    """DATA + un archivo por reporte en output_dir (se crea si no existe)."""
+    requiere_pyarrow(formato)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    ext = _EXTENSION[formato]
+    escribir_tabla(output_dir / f"DATA{ext}", formato, data)
+    for name, rep in (reportes or {}).items():
+        escribir_tabla(output_dir / f"{name}{ext}", formato, rep)
+
+
+def escribir_salida(
+    output_path: Path,
+    formato: str,
+    data: pd.DataFrame,
+    reportes: dict[str, pd.DataFrame] | None = None,
+) -> None:
+    """
+    xlsx -> output_path es el libro (escribir_excel).
+    parquet / feather / csv -> output_path es el directorio bundle.
+    """
+    if formato == "xlsx":
+        escribir_excel(output_path, data, reportes=reportes)
+    elif formato in _EXTENSION:
+        escribir_bundle(output_path, formato, data, reportes)
+    else:
+        raise ConfigError(f"formato de salida inválido: {formato}")
+
+
+def escribir_reportes(output_path: Path, formato: str, reportes: dict[str, pd.DataFrame]) -> None:
+    """Solo hojas de reporte, sin DATA (p.ej. ESTADISTICAS_GLOBAL del batch)."""
+    if formato == "xlsx":
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with pd.ExcelWriter(output_path, engine="openpyxl") as w:
+            for name, rep in reportes.items():
+                rep.to_excel(w, sheet_name=name[:31], index=False)
+    elif formato in _EXTENSION:
+        requiere_pyarrow(formato)
+        output_path.mkdir(parents=True, exist_ok=True)
+        for name, rep in reportes.items():
+            escribir_tabla(output_path / f"{name}{_EXTENSION[formato]}", formato, rep)
+    else:
+        raise ConfigError(f"formato de salida inválido: {formato}")
+
+
+class EscritorCsvBloques:
+    """
+    Bundle csv escrito por bloques (modo por bloques del pipeline). Misma
+    interfaz que io_excel.EscritorExcelStreaming: agregar(hoja, df) suma
+    filas al archivo de la hoja, con header solo la primera vez.
+    """
+
+    def __init__(self, output_dir: Path, hojas: list[str]):
+        self.output_dir = output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self._paths = {h: output_dir / f"{h}.csv" for h in hojas}
+        self._con_header: set[str] = set()
+        for path in self._paths.values():
+            path.write_text("", encoding="utf-8")
+
+    def __enter__(self) -> "EscritorCsvBloques":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def escrita(self, hoja: str) -> bool:
+        return hoja in self._con_header
+
+    def agregar(self, hoja: str, df: pd.DataFrame) -> None:
+        if df.shape[1] == 0:
+            return
+        header = hoja not in self._con_header
+        tipos_columnar(df).to_csv(self._paths[hoja], mode="a", header=header, index=False)
+        self._con_header.add(hoja)
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import platform
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+
+# ============================================================
+# PERFIL (instrumentación por etapa)
+# ------------------------------------------------------------
+# - Por etapa: tiempo de pared, CPU, filas entrada / salida y pico de memoria
+#   sobre lo que había al entrar (RSS en Linux vía /proc; si no, tracemalloc
+#   si está activo; si no, NA).
+# - En modo por bloques una etapa se mide una vez por bloque y se acumula
+#   (tiempos y filas suman, el pico es el máximo).
+# - Apagado (modo None) no mide nada: etapa() es un nullcontext.
+# ============================================================
+
+MODOS_PERFIL = ("etapas", "cprofile", "tracemalloc")
+
+COLUMNAS_PERFORMANCE = [
+    "ETAPA", "LLAMADAS", "SEGUNDOS", "CPU_SEGUNDOS", "FILAS_ENTRADA", "FILAS_SALIDA", "PICO_MEMORIA_MB",
+]
+
+
+def _status_kb(campo: str) -> int | None:
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for linea in f:
+                if linea.startswith(campo + ":"):
+                    return int(linea.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _inicio_pico() -> tuple[str, int] | None:
+    """Resetea el pico y devuelve (fuente, uso actual) para medir el delta."""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")  # resetea VmHWM al RSS actual
+        rss = _status_kb("VmRSS")
+        if rss is not None:
+            return "rss", rss * 1024
+    except OSError:
+        pass
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        return "tracemalloc", tracemalloc.get_traced_memory()[0]
+    return None
+
+
+def _pico_mb(inicio: tuple[str, int] | None) -> float | None:
+    if inicio is None:
+        return None
+    fuente, antes = inicio
+    if fuente == "rss":
+        hwm = _status_kb("VmHWM")
+        pico = hwm * 1024 if hwm is not None else None
+    else:
+        pico = tracemalloc.get_traced_memory()[1]
+    return None if pico is None else max(0, pico - antes) / 2**20
+
+
+@dataclass
+class MedicionEtapa:
+    etapa: str
+    llamadas: int = 0
+    segundos: float = 0.0
+    cpu_segundos: float = 0.0
+    filas_entrada: int = 0
+    filas_salida: int = 0
+    pico_memoria_mb: float | None = None
+
+
+class _Marca:
+    """Lo que ve el bloque medido: fija filas_salida (default: = entrada)."""
+    __slots__ = ("filas_salida",)
+
+    def __init__(self) -> None:
+        self.filas_salida: int | None = None
+
+
+class MedidorEtapas:
+    def __init__(self, activo: bool = True):
+        self.activo = activo
+        self._etapas: dict[str, MedicionEtapa] = {}
+
+    def etapa(self, nombre: str, df: pd.DataFrame | None = None):
+        """
+        with medidor.etapa("fu", df) as m:
+            df = ...
+            m.filas_salida = len(df)
+        """
+        if not self.activo:
+            return nullcontext(_Marca())
+        return self._medir(nombre, 0 if df is None else len(df))
+
+    @contextmanager
+    def _medir(self, nombre: str, filas_entrada: int) -> Iterator[_Marca]:
+        m = self._etapas.setdefault(nombre, MedicionEtapa(nombre))
+        marca = _Marca()
+        inicio = _inicio_pico()
+        t0, c0 = time.perf_counter(), time.process_time()
+        try:
+            yield marca
+        finally:
+            m.segundos += time.perf_counter() - t0
+            m.cpu_segundos += time.process_time() - c0
+            m.llamadas += 1
+            m.filas_entrada += filas_entrada
+            m.filas_salida += filas_entrada if marca.filas_salida is None else marca.filas_salida
+            pico = _pico_mb(inicio)
+            if pico is not None:
+                m.pico_memoria_mb = max(m.pico_memoria_mb or 0.0, pico)
+
+    def mediciones(self) -> list[MedicionEtapa]:
+        return list(self._etapas.values())
+
+    def reporte(self) -> pd.DataFrame:
+        """Hoja REPORTE_PERFORMANCE (una fila por etapa, en orden de ejecución)."""
+        filas = [
+            [m.etapa, m.llamadas, round(m.segundos, 4), round(m.cpu_segundos, 4),
+             m.filas_entrada, m.filas_salida,
+             None if m.pico_memoria_mb is None else round(m.pico_memoria_mb, 2)]
+            for m in self._etapas.values()
+        ]
+        return pd.DataFrame(filas, columns=COLUMNAS_PERFORMANCE)
+
+
+def base_perfil(output_path: Path, formato: str) -> Path:
+    """Prefijo de los archivos de perfil: junto al libro, o dentro del bundle."""
+    if formato == "xlsx":
+        return output_path.with_name(output_path.stem + "_PERFIL")
+    return output_path / "PERFIL"
+
+
+@contextmanager
+def perfilar(modo: str | None, base: Path, meta: dict | None = None) -> Iterator[MedidorEtapas]:
+    """
+    Envuelve una corrida. modo None -> medidor apagado, sin archivos.
+    Con modo (si la corrida termina bien) escribe <base>.json con las etapas y:
+    - cprofile: <base>.prof (pstats) + <base>_cprofile.txt (top por tiempo acumulado)
+    - tracemalloc: <base>.tracemalloc (Snapshot.dump) + <base>_tracemalloc.txt (top por línea)
+    """
+    if modo is None:
+        yield MedidorEtapas(activo=False)
+        return
+    if modo not in MODOS_PERFIL:
+        raise ValueError(f"modo de perfil inválido: {modo}")
+
+    medidor = MedidorEtapas()
+    perfilador = cProfile.Profile() if modo == "cprofile" else None
+    traza_propia = modo == "tracemalloc" and not tracemalloc.is_tracing()
+    if traza_propia:
+        tracemalloc.start(25)
+
+    t0, c0 = time.perf_counter(), time.process_time()
+    snapshot = None
+    if perfilador is not None:
+        perfilador.enable()
+    try:
+        yield medidor
+    finally:
+        if perfilador is not None:
+            perfilador.disable()
+        if modo == "tracemalloc":
+            snapshot = tracemalloc.take_snapshot()
+            if traza_propia:
+                tracemalloc.stop()
+
+    base.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        **(meta or {}),
+        "modo": modo,
+        "segundos": round(time.perf_counter() - t0, 4),
+        "cpu_segundos": round(time.process_time() - c0, 4),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "etapas": [asdict(m) for m in medidor.mediciones()],
+    }
+    with open(f"{base}.json", "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+    if perfilador is not None:
+        perfilador.dump_stats(f"{base}.prof")
+        with open(f"{base}_cprofile.txt", "w", encoding="utf-8") as f:
+            pstats.Stats(perfilador, stream=f).sort_stats("cumulative").print_stats(60)
+    if snapshot is not None:
+        snapshot.dump(f"{base}.tracemalloc")
+        with open(f"{base}_tracemalloc.txt", "w", encoding="utf-8") as f:
+            for stat in snapshot.statistics("lineno")[:60]:
+                f.write(f"{stat}\n")
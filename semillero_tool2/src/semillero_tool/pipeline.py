@@ -1,16 +1,59 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 import pandas as pd
 
-from .io_excel import leer_excel, escribir_excel
+from .io_excel import (
+    LECTORES_EXCEL,
+    EscritorExcelStreaming,
+    LectorExcelStreaming,
+    leer_excel,
+)
+from .io_csv import LectorCsv, es_csv
+from .ingesta import COLUMNAS_REPORTE_HOJAS, TODAS_LAS_HOJAS, leer_hojas
+from .io_salida import FORMATOS_SALIDA, EscritorCsvBloques, escribir_salida, requiere_pyarrow
+from .cache import CacheLRU, abrir_cache_etapas, firma_codigo, firma_tablas, hash_archivo
 from .columns import detect_duplicate_columns, normalizar_columnas_suffix, normalizar_columna
-from .text_clean import limpiar_texto, asegurar_ids_como_texto
-from .fu import cast_fu_numeric, validate_fu_schema, audit_fu_missing, drop_fu_missing
-from .dates import normalizar_fechas_iso
-from .programa import canonizar_programa
+from .text_clean import (
+    limpiar_texto,
+    asegurar_ids_como_texto,
+    combinar_reportes_texto,
+    combinar_reportes_ids,
+)
+from .fu import (
+    MatrizFU,
+    cast_fu_numeric,
+    validate_fu_schema,
+    audit_fu_missing,
+    audit_fu_rangos,
+    separar_fu,
+    combinar_reportes_cast,
+    combinar_auditorias_fu,
+    combinar_rangos_fu,
+)
+from .dates import normalizar_fechas_iso, combinar_reportes_fechas
+from .estadisticas import COLUMNAS_GENERAL, COLUMNAS_X_PROGRAMA, estadisticas_fu
+from .acumuladores import MODOS_MEDIANA, AcumuladorFU
+from .programa import (
+    canonizar_programa,
+    abrir_cache_programa,
+    contar_no_reconocidos,
+    combinar_no_reconocidos,
+    ordenar_no_reconocidos,
+)
 from .drop import aplicar_drop_missing
+from .historial import EscritorHistorial, requiere_pyarrow as requiere_pyarrow_historial
+from .proyeccion import SelectorColumnas, columnas_usadas
+from .dedup import (
+    COLUMNAS_REPORTE_IDS_DUPLICADOS,
+    POLITICAS_DEDUP,
+    POLITICAS_POR_BLOQUES,
+    DeduplicadorIds,
+    IndiceIds,
+)
+from .perfil import MODOS_PERFIL, MedidorEtapas, base_perfil, perfilar
 from .config import FU_COLS
 from .errors import ConfigError, SchemaError
 
@@ -37,8 +80,67 @@ class RunConfig:
     drop_missing_mode: str
     critical_cols_csv: str | None
 
-
-def _validate_cfg(cfg: RunConfig) -> None:
+    # Memoria: el pipeline es dueño del frame que lee, así que por default las
+    # etapas lo mutan en vez de copiarlo. True = modo defensivo (copia por etapa).
+    copiar_etapas: bool = False
+
+    # Lectura: "pandas" (pd.read_excel) | "streaming" (openpyxl read_only por bloques)
+    lector_excel: str = "pandas"
+
+    # Modo por bloques (run_por_bloques): filas por bloque de punta a punta.
+    # None = todo en memoria (run). Implica el lector streaming.
+    filas_por_bloque: int | None = None
+
+    # Salida: "xlsx" (libro con hojas) | "parquet" | "feather" | "csv" (bundle:
+    # output_path es un directorio con un archivo por hoja)
+    formato_salida: str = "xlsx"
+
+    # Cachés en disco: checkpoints de etapas (run) y canonización de PROGRAMA.
+    # False = corrida sin leer ni escribir cachés (--no-cache).
+    usar_cache: bool = True
+
+    # Perfil: None | "etapas" (REPORTE_PERFORMANCE + JSON) | "cprofile" |
+    # "tracemalloc" (además, dumps crudos junto al output)
+    perfil: str | None = None
+
+    # Estadísticas descriptivas de FU (hojas GENERAL y X_PROGRAMA: N, media,
+    # desvío, mínimo, percentiles y máximo, global y por programa).
+    estadisticas: bool = False
+
+    # Mediana / percentiles: "exacta" | "aproximada" (sketch KLL, memoria
+    # acotada; ver acumuladores.py). acumulador_path: guarda ahí el
+    # AcumuladorFU de la corrida para combinarlo con otros (batch).
+    mediana: str = "exacta"
+    acumulador_path: Path | None = None
+
+    # Multi-hoja / multi-libro (ingesta.py): hojas = nombres o ("*",) = todas;
+    # libros_extra = más libros que se leen igual que input_path. Todo se une
+    # en un solo df con SOURCE_FILE / SHEET. workers_lectura: procesos que
+    # parsean las hojas (None = CPUs).
+    hojas: tuple[str, ...] | None = None
+    libros_extra: tuple[Path, ...] = ()
+    workers_lectura: int | None = None
+
+    # Duplicados de ID (dedup.py): None = no deduplica | "ultima_fecha" |
+    # "mas_fu" | "primero". indice_ids: directorio del índice persistente;
+    # el input se compara también con las cohortes ya indexadas y, escrito
+    # el output, se indexa como cohorte (su nombre de archivo).
+    dedup_ids: str | None = None
+    indice_ids: Path | None = None
+
+    # Historial local (historial.py): directorio Parquet particionado por
+    # período al que se agrega la DATA final, con el hash del input como clave
+    # (volver a correr el mismo input reemplaza su cohorte). None = no agrega.
+    historial: Path | None = None
+
+    # Proyección (proyeccion.py): True = los lectores cargan solo las columnas
+    # que usan las etapas (IDs, F..U, PROGRAMA, FECHA, críticas del drop
+    # general); conservar_columnas = otras que igual se leen y pasan al output.
+    solo_columnas_usadas: bool = False
+    conservar_columnas: tuple[str, ...] = ()
+
+
+def validar_config(cfg: RunConfig) -> None:
     """
     Validaciones internas del pipeline (no dependas del CLI).
     Esto te protege si mañana alguien llama run() desde Python directo.
@@ -58,6 +160,121 @@ def _validate_cfg(cfg: RunConfig) -> None:
     if cfg.fu_drop_mode not in {"none", "all", "threshold"}:
         raise ConfigError(f"fu_drop_mode inválido: {cfg.fu_drop_mode}")
 
+    if cfg.lector_excel not in LECTORES_EXCEL:
+        raise ConfigError(f"lector_excel inválido: {cfg.lector_excel}")
+
+    if cfg.filas_por_bloque is not None and cfg.filas_por_bloque < 1:
+        raise ConfigError(f"filas_por_bloque debe ser >= 1: {cfg.filas_por_bloque}")
+
+    if cfg.formato_salida not in FORMATOS_SALIDA:
+        raise ConfigError(f"formato_salida inválido: {cfg.formato_salida}")
+
+    if cfg.filas_por_bloque is not None and cfg.formato_salida not in ("xlsx", "csv"):
+        # Cada bloque infiere su propio esquema Arrow (p.ej. columna toda NA);
+        # no hay un esquema común garantizado para escribir por partes.
+        raise ConfigError(f"El modo por bloques escribe xlsx o csv, no {cfg.formato_salida}.")
+
+    if cfg.mediana not in MODOS_MEDIANA:
+        raise ConfigError(f"mediana inválida: {cfg.mediana}")
+
+    if cfg.acumulador_path is not None and not cfg.estadisticas:
+        raise ConfigError("acumulador_path requiere estadisticas.")
+
+    if es_csv(cfg.input_path) and (cfg.sheet or _multi_hoja(cfg)):
+        raise ConfigError("Un CSV no tiene hojas: sheet / hojas / libros_extra son para .xlsx.")
+
+    if _multi_hoja(cfg):
+        if cfg.sheet and cfg.hojas is not None:
+            raise ConfigError("sheet y hojas no se combinan: usa solo hojas.")
+        if cfg.hojas is not None and (not cfg.hojas or (TODAS_LAS_HOJAS in cfg.hojas and len(cfg.hojas) > 1)):
+            raise ConfigError(f"hojas inválidas: {cfg.hojas}")
+        if cfg.filas_por_bloque is not None:
+            raise ConfigError("El modo por bloques lee una sola hoja (no combina con hojas / libros_extra).")
+
+    if cfg.dedup_ids is not None and cfg.dedup_ids not in POLITICAS_DEDUP:
+        raise ConfigError(f"dedup_ids inválido: {cfg.dedup_ids}")
+
+    if cfg.indice_ids is not None and cfg.dedup_ids is None:
+        raise ConfigError("indice_ids requiere dedup_ids (política de deduplicación).")
+
+    if cfg.filas_por_bloque is not None and cfg.dedup_ids not in (None, *POLITICAS_POR_BLOQUES):
+        # La fila que queda depende de filas que todavía no se leyeron.
+        raise ConfigError(f"El modo por bloques deduplica IDs solo con {POLITICAS_POR_BLOQUES}, no {cfg.dedup_ids}.")
+
+    if cfg.workers_lectura is not None and cfg.workers_lectura < 1:
+        raise ConfigError(f"workers_lectura debe ser >= 1: {cfg.workers_lectura}")
+
+    if cfg.conservar_columnas and not cfg.solo_columnas_usadas:
+        raise ConfigError("conservar_columnas requiere solo_columnas_usadas (sin proyección se leen todas).")
+
+    if cfg.perfil is not None and cfg.perfil not in MODOS_PERFIL:
+        raise ConfigError(f"perfil inválido: {cfg.perfil}")
+
+    # Sin pyarrow: fallar antes de procesar, no al final.
+    requiere_pyarrow(cfg.formato_salida)
+    if cfg.historial is not None:
+        requiere_pyarrow_historial()
+
+
+def _requiere_fu(cfg: RunConfig) -> bool:
+    # Strict_schema fuerza validar/auditar FU
+    return cfg.strict_schema or cfg.fu_validate or (cfg.fu_drop_mode != "none")
+
+
+def _validar_encabezado(columnas: list, cfg: RunConfig) -> None:
+    """
+    Checks de esquema que solo dependen del header, antes de leer el cuerpo
+    (fail-fast sin cargar la hoja). Son los mismos que corren sobre el df.
+    """
+    vacio = pd.DataFrame(columns=columnas)
+    if cfg.strict_schema:
+        detect_duplicate_columns(vacio)
+    if _requiere_fu(cfg) or cfg.estadisticas:
+        normalizado, _ = normalizar_columnas_suffix(vacio, copiar=False)
+        validate_fu_schema(normalizado)
+
+
+def _multi_hoja(cfg: RunConfig) -> bool:
+    return cfg.hojas is not None or bool(cfg.libros_extra)
+
+
+def _reporte_hojas_vacio() -> pd.DataFrame:
+    return pd.DataFrame(columns=COLUMNAS_REPORTE_HOJAS)
+
+
+def _selector_columnas(cfg: RunConfig) -> SelectorColumnas | None:
+    """usecols de los lectores: None = todas las columnas."""
+    if not cfg.solo_columnas_usadas:
+        return None
+    criticas = None
+    if cfg.drop_missing_mode != "none" and cfg.critical_cols_csv:
+        criticas = cfg.critical_cols_csv.split(",")
+    return SelectorColumnas(columnas_usadas(criticas, cfg.conservar_columnas))
+
+
+def _leer_input(cfg: RunConfig) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """(df, REPORTE_HOJAS); el reporte solo tiene filas en modo multi-hoja."""
+    usecols = _selector_columnas(cfg)
+    if _multi_hoja(cfg):
+        hojas = list(cfg.hojas) if cfg.hojas is not None else ([cfg.sheet] if cfg.sheet else None)
+        return leer_hojas(
+            [cfg.input_path, *cfg.libros_extra], hojas, lector=cfg.lector_excel, workers=cfg.workers_lectura,
+            usecols=usecols,
+        )
+    if es_csv(cfg.input_path) or cfg.lector_excel == "streaming":
+        # Un solo open: header -> checks -> cuerpo.
+        with _abrir_lector(cfg) as lector:
+            _validar_encabezado(lector.encabezado(), cfg)
+            return lector.leer(), _reporte_hojas_vacio()
+    return leer_excel(cfg.input_path, cfg.sheet, usecols=usecols), _reporte_hojas_vacio()
+
+
+def _abrir_lector(cfg: RunConfig, **kw) -> LectorCsv | LectorExcelStreaming:
+    """CSV / TSV por extensión; si no, el .xlsx con el lector streaming."""
+    if es_csv(cfg.input_path):
+        return LectorCsv(cfg.input_path, usecols=_selector_columnas(cfg), **kw)
+    return LectorExcelStreaming(cfg.input_path, cfg.sheet, usecols=_selector_columnas(cfg), **kw)
+
 
 def _resolve_critical_cols(df: pd.DataFrame, cfg: RunConfig) -> list[str]:
     """
@@ -78,39 +295,70 @@ def _resolve_critical_cols(df: pd.DataFrame, cfg: RunConfig) -> list[str]:
     return cols
 
 
-def run(cfg: RunConfig) -> pd.DataFrame:
-    _validate_cfg(cfg)
+# Orden de las hojas de reporte en el output (después de DATA).
+_HOJAS_REPORTE = (
+    "REPORTE_HOJAS",
+    "REPORTE_DUPLICADOS",
+    "REPORTE_TEXTO",
+    "REPORTE_IDS",
 
-    df = leer_excel(cfg.input_path, cfg.sheet)
+    "REPORTE_PROGRAMA_NO_RECONOCIDOS",
 
-    # Fail-fast duplicados crudos (solo en modo estricto)
-    if cfg.strict_schema:
-        detect_duplicate_columns(df)
+    "REPORTE_FU_CAST",
+    "REPORTE_FU_NA_PRE",
+    "REPORTE_FU_RESUMEN_PRE",
+    "REPORTE_FU_DROPEADAS",
+    "REPORTE_FU_NA_POST",
+    "REPORTE_FU_RESUMEN_POST",
+    "REPORTE_FU_RANGOS",
+
+    "REPORTE_DROP_GENERAL",
+    "REPORTE_IDS_DUPLICADOS",
+    "REPORTE_FECHAS",
+
+    "GENERAL",
+    "X_PROGRAMA",
+)
 
+# Hojas que son filas dropeadas (no conteos): en modo por bloques se escriben
+# a medida que salen en vez de unirse al final.
+_HOJAS_FILAS = ("REPORTE_FU_DROPEADAS", "REPORTE_DROP_GENERAL", "REPORTE_IDS_DUPLICADOS")
+
+
+def _etapa_base(df, reportes, cfg, cache_programa, copiar, por_bloques):
     # =========================================================
     # ORDEN DETERMINISTA (core):
     # 1) normaliza headers (y resuelve duplicados por suffix)
     # 2) limpia texto (strip + NA safe)
     # 3) asegura IDs como texto + fix .0 (si tu asegurar_ids ya lo hace)
     # =========================================================
-    df, rep_dups = normalizar_columnas_suffix(df)
-    df, rep_texto = limpiar_texto(df)
-    df, rep_ids = asegurar_ids_como_texto(df)
+    df, reportes["REPORTE_DUPLICADOS"] = normalizar_columnas_suffix(df, copiar=copiar)
+    df, reportes["REPORTE_TEXTO"] = limpiar_texto(df, copiar=copiar)
+    df, reportes["REPORTE_IDS"] = asegurar_ids_como_texto(df, copiar=copiar)
 
     # FU cast (siempre; no exige schema)
-    df, rep_fu_cast = cast_fu_numeric(df)
+    df, reportes["REPORTE_FU_CAST"] = cast_fu_numeric(df, copiar=copiar)
+    return df
 
+
+def _etapa_programa(df, reportes, cfg, cache_programa, copiar, por_bloques):
     # Programa (solo si flag)
     rep_no_recon = pd.DataFrame(columns=["PROGRAMA_ORIGINAL", "PROGRAMA_BASE", "FRECUENCIA"])
     if cfg.canonizar_programa:
-        df, rep_no_recon = canonizar_programa(df)
+        df, rep_no_recon = canonizar_programa(df, cache=cache_programa, copiar=copiar)
+        if por_bloques and "PROGRAMA" in df.columns:
+            rep_no_recon = contar_no_reconocidos(df)
+    reportes["REPORTE_PROGRAMA_NO_RECONOCIDOS"] = rep_no_recon
 
     if cfg.reemplazar_programa:
         # coherencia hard: si se pidió reemplazo y no existe, es bug/estado inválido
         if "PROGRAMA_CANON" not in df.columns:
             raise SchemaError("Se pidió reemplazar PROGRAMA pero no existe PROGRAMA_CANON.")
         df["PROGRAMA"] = df["PROGRAMA_CANON"]
+    return df
 
+
+def _etapa_fu(df, reportes, cfg, cache_programa, copiar, por_bloques):
     # Reportes FU (pre/post). Estructura estable.
     rep_fu_na_pre = pd.DataFrame(columns=["COLUMNA", "N_TOTAL", "N_NA", "PCT_NA"])
     rep_fu_resumen_pre = pd.DataFrame(
@@ -121,41 +369,410 @@ def run(cfg: RunConfig) -> pd.DataFrame:
     rep_fu_resumen_post = pd.DataFrame(
         columns=["N_TOTAL", "N_COMPLETAS_FU", "N_INCOMPLETAS_FU", "PCT_COMPLETAS_FU"]
     )
+    rep_fu_rangos = pd.DataFrame(
+        columns=["COLUMNA", "MIN", "MAX", "N_VALIDOS", "N_FUERA_RANGO", "PCT_FUERA_RANGO"]
+    )
 
-    # Strict_schema fuerza validar/auditar FU
-    do_fu = cfg.strict_schema or cfg.fu_validate or (cfg.fu_drop_mode != "none")
+    do_fu = _requiere_fu(cfg)
     if do_fu:
         validate_fu_schema(df)
-        rep_fu_na_pre, rep_fu_resumen_pre = audit_fu_missing(df)
+        # Una sola matriz F..U para auditoría pre, drop, auditoría post y rangos.
+        matriz = MatrizFU.desde_df(df)
+        rep_fu_na_pre, rep_fu_resumen_pre = audit_fu_missing(df, matriz)
 
         if cfg.fu_drop_mode != "none":
-            df, rep_fu_dropped = drop_fu_missing(df, cfg.fu_drop_mode, cfg.min_non_missing_fu)
-            rep_fu_na_post, rep_fu_resumen_post = audit_fu_missing(df)
+            df, rep_fu_dropped, matriz = separar_fu(
+                df, cfg.fu_drop_mode, cfg.min_non_missing_fu, copiar=copiar, matriz=matriz
+            )
+            rep_fu_na_post, rep_fu_resumen_post = audit_fu_missing(df, matriz)
+
+        rep_fu_rangos = audit_fu_rangos(df, matriz)
+
+    reportes["REPORTE_FU_NA_PRE"] = rep_fu_na_pre
+    reportes["REPORTE_FU_RESUMEN_PRE"] = rep_fu_resumen_pre
+    reportes["REPORTE_FU_DROPEADAS"] = rep_fu_dropped
+    reportes["REPORTE_FU_NA_POST"] = rep_fu_na_post
+    reportes["REPORTE_FU_RESUMEN_POST"] = rep_fu_resumen_post
+    reportes["REPORTE_FU_RANGOS"] = rep_fu_rangos
+    return df
+
 
+def _etapa_drop_general(df, reportes, cfg, cache_programa, copiar, por_bloques):
     # Drop general (solo si flag)
     rep_drop_general = pd.DataFrame()
     if cfg.drop_missing_mode != "none":
         critical_cols = _resolve_critical_cols(df, cfg)
-        df, rep_drop_general = aplicar_drop_missing(df, cfg.drop_missing_mode, critical_cols)
+        df, rep_drop_general = aplicar_drop_missing(
+            df, cfg.drop_missing_mode, critical_cols, copiar=copiar
+        )
+    reportes["REPORTE_DROP_GENERAL"] = rep_drop_general
+    return df
 
-    # Fechas (siempre, al final)
-    df, rep_fechas = normalizar_fechas_iso(df, col="FECHA")
 
-    escribir_excel(cfg.output_path, df, reportes={
-        "REPORTE_DUPLICADOS": rep_dups,
-        "REPORTE_TEXTO": rep_texto,
-        "REPORTE_IDS": rep_ids,
+# Etapas fila a fila en orden: (nombre, función, parámetros de cfg que la
+# afectan). Los parámetros arman la clave de su checkpoint en la caché de
+# etapas: cambiar un flag invalida esa etapa y las siguientes, no las previas.
+_ETAPAS = (
+    ("base", _etapa_base, lambda cfg: {}),
+    ("programa", _etapa_programa, lambda cfg: {
+        "canonizar": cfg.canonizar_programa,
+        "reemplazar": cfg.reemplazar_programa,
+    }),
+    ("fu", _etapa_fu, lambda cfg: {
+        "fu": _requiere_fu(cfg),
+        "modo": cfg.fu_drop_mode,
+        "min_non_missing": cfg.min_non_missing_fu,
+    }),
+    ("drop_general", _etapa_drop_general, lambda cfg: {
+        "modo": cfg.drop_missing_mode,
+        "criticas": cfg.critical_cols_csv if cfg.drop_missing_mode != "none" else None,
+    }),
+)
+
+
+def _deduplicador(cfg: RunConfig) -> DeduplicadorIds | None:
+    if cfg.dedup_ids is None:
+        return None
+    indice = IndiceIds(cfg.indice_ids) if cfg.indice_ids is not None else None
+    return DeduplicadorIds(cfg.dedup_ids, indice, cohorte=cfg.input_path.name)
+
+
+def _dedup_ids(df: pd.DataFrame, dedup: DeduplicadorIds | None, copiar: bool) -> tuple[pd.DataFrame, pd.DataFrame]:
+    if dedup is None:
+        return df, pd.DataFrame(columns=COLUMNAS_REPORTE_IDS_DUPLICADOS)
+    return dedup.aplicar(df, copiar=copiar)
+
+
+def _escritor_historial(cfg: RunConfig) -> EscritorHistorial | nullcontext:
+    """Escritor del historial de la corrida (nullcontext -> None si no se pidió)."""
+    if cfg.historial is None:
+        return nullcontext()
+    clave = firma_tablas([hash_archivo(p) for p in (cfg.input_path, *cfg.libros_extra)], cfg.sheet, cfg.hojas)
+    return EscritorHistorial(cfg.historial, clave, origen=cfg.input_path.name)
+
+
+def _plantillas_estadisticas() -> tuple[pd.DataFrame, pd.DataFrame]:
+    return pd.DataFrame(columns=COLUMNAS_GENERAL), pd.DataFrame(columns=COLUMNAS_X_PROGRAMA)
+
+
+def _hojas_estadisticas(df: pd.DataFrame, cfg: RunConfig) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """(GENERAL, X_PROGRAMA) sobre el df final; plantillas vacías si no se pidieron."""
+    if not cfg.estadisticas:
+        return _plantillas_estadisticas()
+    if cfg.mediana == "exacta" and cfg.acumulador_path is None:
+        return estadisticas_fu(df)
+    acum = AcumuladorFU(cfg.mediana)
+    acum.agregar(df)
+    return _hojas_acumulador(acum, cfg)
+
+
+def _hojas_acumulador(acum: AcumuladorFU, cfg: RunConfig) -> tuple[pd.DataFrame, pd.DataFrame]:
+    if cfg.acumulador_path is not None:
+        acum.guardar(cfg.acumulador_path)
+    return acum.general(), acum.por_programa()
+
+
+def _etapas_por_fila(
+    df: pd.DataFrame,
+    cfg: RunConfig,
+    cache_programa: CacheLRU | None,
+    copiar: bool,
+    por_bloques: bool = False,
+    medidor: MedidorEtapas | None = None,
+) -> tuple[pd.DataFrame, dict[str, object]]:
+    """
+    Etapas fila a fila del pipeline (todo menos lectura, fechas y escritura).
+    Devuelve (df, reportes por hoja).
+
+    por_bloques=True: df es un bloque de filas; REPORTE_PROGRAMA_NO_RECONOCIDOS
+    trae el conteo sin ordenar (contar_no_reconocidos) para unirlo al final.
+    """
+    medidor = medidor if medidor is not None else MedidorEtapas(activo=False)
+    reportes: dict[str, object] = {}
+    for nombre, etapa, _ in _ETAPAS:
+        with medidor.etapa(nombre, df) as m:
+            df = etapa(df, reportes, cfg, cache_programa, copiar, por_bloques)
+            m.filas_salida = len(df)
+    return df, reportes
 
-        "REPORTE_PROGRAMA_NO_RECONOCIDOS": rep_no_recon,
 
-        "REPORTE_FU_CAST": rep_fu_cast,
-        "REPORTE_FU_NA_PRE": rep_fu_na_pre,
-        "REPORTE_FU_RESUMEN_PRE": rep_fu_resumen_pre,
-        "REPORTE_FU_DROPEADAS": rep_fu_dropped,
-        "REPORTE_FU_NA_POST": rep_fu_na_post,
-        "REPORTE_FU_RESUMEN_POST": rep_fu_resumen_post,
+def _claves_etapas(cfg: RunConfig) -> list[str]:
+    """
+    Clave del checkpoint tras cada etapa: encadena el código, el contenido
+    del input (no la ruta), la hoja/lector, las columnas leídas y los
+    parámetros de cada etapa.
+    """
+    selector = _selector_columnas(cfg)
+    clave = firma_tablas(
+        firma_codigo(),
+        [hash_archivo(p) for p in (cfg.input_path, *cfg.libros_extra)],
+        cfg.sheet,
+        cfg.hojas,
+        cfg.lector_excel,
+        None if selector is None else sorted(selector.normalizadas),
+    )
+    claves = []
+    for nombre, _, params in _ETAPAS:
+        clave = firma_tablas(clave, nombre, params(cfg))
+        claves.append(clave)
+    return claves
+
 
-        "REPORTE_DROP_GENERAL": rep_drop_general,
-        "REPORTE_FECHAS": rep_fechas,
-    })
+def run(cfg: RunConfig) -> pd.DataFrame:
+    validar_config(cfg)
+    if cfg.filas_por_bloque is not None:
+        raise ConfigError("filas_por_bloque es del modo por bloques: usa run_por_bloques().")
+
+    with perfilar(cfg.perfil, base_perfil(cfg.output_path, cfg.formato_salida), _meta_perfil(cfg)) as medidor:
+        return _run(cfg, medidor)
+
+
+def _run(cfg: RunConfig, medidor: MedidorEtapas) -> pd.DataFrame:
+    # Caché de etapas: retoma desde el último checkpoint cuyo prefijo de
+    # parámetros no cambió (p.ej. solo cambió --fu-drop-mode -> no se relee).
+    cache = abrir_cache_etapas() if cfg.usar_cache else None
+    claves: list[str] = []
+    desde, estado = 0, None
+    if cache is not None:
+        with medidor.etapa("checkpoint_carga") as m:
+            try:
+                claves = _claves_etapas(cfg)
+            except OSError:
+                # Input ilegible: sin caché; el lector reporta el error de siempre.
+                cache = None
+            for i in reversed(range(len(claves))):
+                estado = cache.cargar(claves[i])
+                if estado is not None:
+                    desde = i + 1
+                    break
+            m.filas_salida = 0 if estado is None else len(estado[1])
+
+    if estado is None:
+        with medidor.etapa("lectura") as m:
+            df, rep_hojas = _leer_input(cfg)
+            m.filas_salida = len(df)
+        columnas_crudas = list(df.columns)
+        # Fail-fast duplicados crudos (solo en modo estricto)
+        if cfg.strict_schema:
+            detect_duplicate_columns(df)
+        reportes = {"REPORTE_HOJAS": rep_hojas}
+    else:
+        columnas_crudas, df, reportes = estado
+        # Los checks de header no dependen de las etapas: se repiten con esta cfg.
+        _validar_encabezado(columnas_crudas, cfg)
+
+    copiar = cfg.copiar_etapas
+    cache_programa = abrir_cache_programa() if cfg.canonizar_programa and cfg.usar_cache else None
+    try:
+        for i in range(desde, len(_ETAPAS)):
+            nombre, etapa, _ = _ETAPAS[i]
+            with medidor.etapa(nombre, df) as m:
+                df = etapa(df, reportes, cfg, cache_programa, copiar, False)
+                m.filas_salida = len(df)
+            if cache is not None:
+                with medidor.etapa("checkpoint_guarda", df):
+                    cache.guardar(claves[i], (columnas_crudas, df, reportes))
+    finally:
+        if cache_programa is not None:
+            cache_programa.guardar()
+
+    # Duplicados de ID: fuera de la caché de etapas (depende del índice en
+    # disco, no solo del input); las estadísticas ya ven una fila por persona.
+    dedup = _deduplicador(cfg)
+    with medidor.etapa("dedup_ids", df) if dedup is not None else nullcontext():
+        df, reportes["REPORTE_IDS_DUPLICADOS"] = _dedup_ids(df, dedup, copiar)
+
+    # Estadísticas sobre las filas que quedan (fuera de la caché de etapas: no cambian el df)
+    with medidor.etapa("estadisticas", df) if cfg.estadisticas else nullcontext():
+        reportes["GENERAL"], reportes["X_PROGRAMA"] = _hojas_estadisticas(df, cfg)
+
+    # Fechas (siempre, al final)
+    with medidor.etapa("fechas", df):
+        df, reportes["REPORTE_FECHAS"] = normalizar_fechas_iso(df, col="FECHA", copiar=copiar)
+
+    hojas = {h: reportes[h] for h in _HOJAS_REPORTE}
+    if medidor.activo:
+        # La hoja cubre hasta antes de escribir; la escritura queda en el JSON.
+        hojas["REPORTE_PERFORMANCE"] = medidor.reporte()
+    with medidor.etapa("escritura", df):
+        escribir_salida(cfg.output_path, cfg.formato_salida, df, reportes=hojas)
+    if dedup is not None:
+        # Recién con el output escrito: una corrida fallida no deja la cohorte indexada.
+        dedup.guardar()
+    if cfg.historial is not None:
+        with medidor.etapa("historial", df), _escritor_historial(cfg) as historial:
+            historial.agregar(df)
+            historial.confirmar()
     return df
+
+
+def _meta_perfil(cfg: RunConfig) -> dict:
+    return {
+        "input": str(cfg.input_path),
+        "output": str(cfg.output_path),
+        "formato": cfg.formato_salida,
+        "lector": cfg.lector_excel,
+        "filas_por_bloque": cfg.filas_por_bloque,
+        "solo_columnas_usadas": cfg.solo_columnas_usadas,
+    }
+
+
+def ejecutar(cfg: RunConfig) -> tuple[int, int]:
+    """run() o run_por_bloques() según cfg. Devuelve (filas, columnas) del output."""
+    if cfg.filas_por_bloque is not None:
+        resultado = run_por_bloques(cfg)
+        return resultado.filas, len(resultado.columnas)
+    df = run(cfg)
+    return len(df), len(df.columns)
+
+
+@dataclass(frozen=True)
+class ResultadoBloques:
+    filas: int
+    columnas: list[str]
+    bloques: int
+
+
+def run_por_bloques(cfg: RunConfig) -> ResultadoBloques:
+    """
+    Mismo pipeline que run(), con memoria acotada: la hoja se lee con el lector
+    streaming en bloques de cfg.filas_por_bloque filas, cada bloque pasa por
+    las etapas fila a fila y se escribe al output antes de leer el siguiente.
+
+    Los reportes de conteo se unen al final (sumas sobre los bloques) y las
+    filas dropeadas se escriben a medida que salen. El output es el mismo que
+    el de run(): el lector fija el dtype global de cada columna y fechas
+    resuelve cada valor por sí solo (no depende del resto de la columna).
+    """
+    validar_config(cfg)
+    if cfg.filas_por_bloque is None:
+        raise ConfigError("run_por_bloques requiere filas_por_bloque.")
+
+    with perfilar(cfg.perfil, base_perfil(cfg.output_path, cfg.formato_salida), _meta_perfil(cfg)) as medidor:
+        return _run_por_bloques(cfg, medidor)
+
+
+def _run_por_bloques(cfg: RunConfig, medidor: MedidorEtapas) -> ResultadoBloques:
+    cache_programa = abrir_cache_programa() if cfg.canonizar_programa and cfg.usar_cache else None
+    # Estadísticas: acumuladas bloque a bloque (mediana exacta guarda los F..U).
+    acum = AcumuladorFU(cfg.mediana) if cfg.estadisticas else None
+    dedup = _deduplicador(cfg)
+    parciales: dict[str, list] = {h: [] for h in _HOJAS_REPORTE if h not in _HOJAS_FILAS}
+    vacias: dict[str, pd.DataFrame] = {}
+    filas = 0
+    bloques = 0
+    columnas: list[str] = []
+
+    try:
+        with _escritor_historial(cfg) as historial:
+            with (
+                _abrir_lector(cfg, filas_por_bloque=cfg.filas_por_bloque) as lector,
+                _escritor_bloques(cfg, perfil=medidor.activo) as escritor,
+            ):
+                _validar_encabezado(lector.encabezado(), cfg)
+
+                fuente = lector.leer_bloques()
+                while True:
+                    # La lectura se mide por bloque (la primera incluye la pasada de dtypes).
+                    with medidor.etapa("lectura") as m:
+                        df = next(fuente, None)
+                        m.filas_salida = 0 if df is None else len(df)
+                    if df is None:
+                        break
+
+                    if bloques == 0 and cfg.strict_schema:
+                        detect_duplicate_columns(df)
+
+                    df, reportes = _etapas_por_fila(
+                        df, cfg, cache_programa, copiar=False, por_bloques=True, medidor=medidor
+                    )
+                    with medidor.etapa("dedup_ids", df) if dedup is not None else nullcontext():
+                        df, reportes["REPORTE_IDS_DUPLICADOS"] = _dedup_ids(df, dedup, copiar=False)
+
+                    with medidor.etapa("fechas", df):
+                        df, reportes["REPORTE_FECHAS"] = normalizar_fechas_iso(df, col="FECHA", copiar=False)
+                    reportes["REPORTE_HOJAS"] = _reporte_hojas_vacio()
+                    if acum is not None:
+                        with medidor.etapa("estadisticas", df):
+                            acum.agregar(df)
+                    reportes["GENERAL"], reportes["X_PROGRAMA"] = _plantillas_estadisticas()
+
+                    with medidor.etapa("escritura", df):
+                        escritor.agregar("DATA", df)
+                        if historial is not None:
+                            historial.agregar(df)
+                        for h in _HOJAS_FILAS:
+                            # header recién con el primer bloque con filas (dropped trae
+                            # columnas extra como _FU_NON_MISSING solo si no está vacío)
+                            if len(reportes[h]):
+                                escritor.agregar(h, reportes[h])
+                            else:
+                                vacias.setdefault(h, reportes[h])
+                    for h, lista in parciales.items():
+                        lista.append(reportes[h])
+
+                    filas += len(df)
+                    bloques += 1
+                    columnas = list(df.columns)
+
+                for h in _HOJAS_FILAS:
+                    if not escritor.escrita(h):
+                        escritor.agregar(h, vacias[h])
+                with medidor.etapa("combinar_reportes"):
+                    finales = _combinar_reportes(parciales, columnas, cfg)
+                    if acum is not None:
+                        finales["GENERAL"], finales["X_PROGRAMA"] = _hojas_acumulador(acum, cfg)
+                with medidor.etapa("escritura"):
+                    for h, rep in finales.items():
+                        escritor.agregar(h, rep)
+                if medidor.activo:
+                    escritor.agregar("REPORTE_PERFORMANCE", medidor.reporte())
+            # Índice de IDs e historial recién con el output cerrado.
+            if dedup is not None:
+                dedup.guardar()
+            if historial is not None:
+                historial.confirmar()
+    finally:
+        if cache_programa is not None:
+            cache_programa.guardar()
+
+    return ResultadoBloques(filas=filas, columnas=columnas, bloques=bloques)
+
+
+def _escritor_bloques(cfg: RunConfig, perfil: bool = False) -> EscritorExcelStreaming | EscritorCsvBloques:
+    hojas = ["DATA", *_HOJAS_REPORTE] + (["REPORTE_PERFORMANCE"] if perfil else [])
+    if cfg.formato_salida == "csv":
+        return EscritorCsvBloques(cfg.output_path, hojas)
+    return EscritorExcelStreaming(cfg.output_path, hojas)
+
+
+def _combinar_reportes(
+    parciales: dict[str, list],
+    columnas: list[str],
+    cfg: RunConfig,
+) -> dict[str, pd.DataFrame]:
+    """
+    Une los reportes por bloque en los del df completo. Los que no se
+    calcularon (flag apagado) son la plantilla vacía del primer bloque.
+    """
+    do_fu = _requiere_fu(cfg)
+    fu_post = do_fu and cfg.fu_drop_mode != "none"
+    conteos = parciales["REPORTE_PROGRAMA_NO_RECONOCIDOS"]
+
+    final = {h: lista[0] for h, lista in parciales.items()}
+    final["REPORTE_TEXTO"] = combinar_reportes_texto(parciales["REPORTE_TEXTO"], columnas)
+    final["REPORTE_IDS"] = combinar_reportes_ids(parciales["REPORTE_IDS"])
+    if isinstance(conteos[0], pd.Series):
+        final["REPORTE_PROGRAMA_NO_RECONOCIDOS"] = ordenar_no_reconocidos(combinar_no_reconocidos(conteos))
+    final["REPORTE_FU_CAST"] = combinar_reportes_cast(parciales["REPORTE_FU_CAST"])
+    if do_fu:
+        final["REPORTE_FU_NA_PRE"], final["REPORTE_FU_RESUMEN_PRE"] = combinar_auditorias_fu(
+            list(zip(parciales["REPORTE_FU_NA_PRE"], parciales["REPORTE_FU_RESUMEN_PRE"]))
+        )
+        final["REPORTE_FU_RANGOS"] = combinar_rangos_fu(parciales["REPORTE_FU_RANGOS"])
+    if fu_post:
+        final["REPORTE_FU_NA_POST"], final["REPORTE_FU_RESUMEN_POST"] = combinar_auditorias_fu(
+            list(zip(parciales["REPORTE_FU_NA_POST"], parciales["REPORTE_FU_RESUMEN_POST"]))
+        )
+    final["REPORTE_FECHAS"] = combinar_reportes_fechas(parciales["REPORTE_FECHAS"])
+    return final
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import os
+import pickle
 import re
+from collections import Counter
+from dataclasses import dataclass
 from difflib import SequenceMatcher
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from unidecode import unidecode
 
+from .cache import CacheLRU, directorio_cache, firma_tablas
+
 
 # ============================================================
 # PROGRAMA CANON ENGINE (determinista, no magia)
@@ -29,6 +37,9 @@ from unidecode import unidecode
 # Resultado:
 # - PROGRAMA_BASE: string normalizada (debug / auditoría)
 # - PROGRAMA_CANON: label estable o NA (modo cerrado)
+#
+# Las tablas de abajo son declarativas; compilar_modelo() las convierte en un
+# ModeloCanon congelado (ver sección 7) que es lo que usa el motor.
 # ============================================================
 
 
@@ -65,6 +76,19 @@ LABELS_CANON = [
 # ------------------------------------------------------------
 # (1) Normalización fuerte
 # ------------------------------------------------------------
+# Typos reales observados (reemplazo literal, en orden, sobre texto sin tildes).
+TYPOS = [
+    ("ingeneria", "ingenieria"),
+    ("ingeniera", "ingenieria"),   # tu caso real
+    ("administacion", "administracion"),
+    ("administación", "administracion"),
+]
+
+_RE_WS = re.compile(r"\s+")
+_RE_SEPARADORES = re.compile(r"[._/\\\-]+")
+_RE_NO_ALNUM = re.compile(r"[^a-z0-9\s]+")
+
+
 def clean_label(x) -> object:
     """
     Limpieza final para labels (incluye NBSP y whitespace raro).
@@ -74,7 +98,7 @@ def clean_label(x) -> object:
         return pd.NA
     s = str(x)
     s = s.replace("\u00a0", " ")          # NBSP (espacio fantasma típico de Excel)
-    s = re.sub(r"\s+", " ", s).strip()    # colapsa espacios
+    s = _RE_WS.sub(" ", s).strip()        # colapsa espacios
     return s if s else pd.NA
 
 
@@ -89,6 +113,10 @@ def forma_base(x) -> str:
 
     Nota: esto NO canoniza; solo prepara para matching.
     """
+    return modelo_canon().forma_base(x)
+
+
+def _forma_base(x, typos: tuple[tuple[str, str], ...]) -> str:
     if pd.isna(x):
         return ""
 
@@ -97,20 +125,18 @@ def forma_base(x) -> str:
     s = s.strip()
     s = unidecode(s).lower()
 
-    # Typos comunes (si aparecen más, se agregan aquí)
-    s = s.replace("ingeneria", "ingenieria")
-    s = s.replace("ingeniera", "ingenieria")   # tu caso real
-    s = s.replace("administacion", "administracion")
-    s = s.replace("administación", "administracion")
+    # Typos comunes (si aparecen más, se agregan en TYPOS)
+    for typo, fix in typos:
+        s = s.replace(typo, fix)
 
     # Separadores típicos -> espacio (incluye punto, guión, slash, underscore)
-    s = re.sub(r"[._/\\\-]+", " ", s)
+    s = _RE_SEPARADORES.sub(" ", s)
 
     # Basura no alfanumérica -> espacio
-    s = re.sub(r"[^a-z0-9\s]+", " ", s)
+    s = _RE_NO_ALNUM.sub(" ", s)
 
     # whitespace final
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _RE_WS.sub(" ", s).strip()
     return s
 
 
@@ -151,18 +177,96 @@ ABREVIATURAS = [
 ]
 
 
+# Compilación (una vez, al importar):
+# - Sobre la forma base (tokens [a-z0-9] separados por 1 espacio) las reglas
+#   "\bliteral\b" son un lookup por token. Se precalcula, para cada token,
+#   el resultado de aplicar su primera regla Y todas las posteriores sobre el
+#   reemplazo (misma semántica que el loop secuencial de re.sub).
+# - Entradas fuera de ese dominio (puntos, tildes, mayúsculas) o tablas con
+#   regex no literales usan el loop secuencial (regex precompiladas).
+_RE_FORMA_BASE = re.compile(r"[a-z0-9]+(?: [a-z0-9]+)*")
+_RE_TOKEN_DOMINIO = re.compile(r"[a-z0-9]+")
+_META_REGEX = set(".^$*+?{}[]|()")
+
+
+def _literal_de_patron(patron: str) -> str | None:
+    r"""
+    Devuelve el literal de un patrón "\b<literal>\b" (con escapes tipo "\.")
+    o None si el patrón no es un literal simple sin espacios.
+    """
+    if len(patron) <= 4 or not (patron.startswith(r"\b") and patron.endswith(r"\b")):
+        return None
+    inner = patron[2:-2]
+    out: list[str] = []
+    i = 0
+    while i < len(inner):
+        ch = inner[i]
+        if ch == "\\":
+            # \b, \d, \s, ... no son literales
+            if i + 1 >= len(inner) or inner[i + 1].isalnum():
+                return None
+            out.append(inner[i + 1])
+            i += 2
+            continue
+        if ch in _META_REGEX or ch.isspace():
+            return None
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+class ExpansorAbreviaturas:
+    """
+    Expansor compilado de una tabla [(patron, reemplazo), ...].
+    expandir(s) == loop secuencial de re.sub + colapso de espacios.
+    """
+
+    def __init__(self, tabla: list[tuple[str, str]]):
+        self._reglas = [(re.compile(p), r) for p, r in tabla]
+        self._mapa = self._compilar_mapa(tabla)
+
+    @property
+    def compilado(self) -> bool:
+        """True si hay lookup por token (si no, todo va por el loop secuencial)."""
+        return self._mapa is not None
+
+    def _secuencial(self, s: str, desde: int = 0) -> str:
+        out = s
+        for rx, repl in self._reglas[desde:]:
+            out = rx.sub(repl, out)
+        return out
+
+    def _compilar_mapa(self, tabla: list[tuple[str, str]]) -> dict[str, str] | None:
+        literales = [_literal_de_patron(p) for p, _ in tabla]
+        if any(lit is None for lit in literales):
+            return None
+
+        mapa: dict[str, str] = {}
+        for i, lit in enumerate(literales):
+            # Literales fuera del dominio ("ing.", "púb") nunca matchean un token base.
+            if lit in mapa or not _RE_TOKEN_DOMINIO.fullmatch(lit):
+                continue
+            # Primera regla que toca el token + las posteriores sobre su reemplazo.
+            val = self._secuencial(self._reglas[i][0].sub(self._reglas[i][1], lit), desde=i + 1)
+            mapa[lit] = _RE_WS.sub(" ", val).strip()
+        return mapa
+
+    def expandir(self, s: str) -> str:
+        if not s:
+            return ""
+        if self._mapa is not None and _RE_FORMA_BASE.fullmatch(s):
+            mapa = self._mapa
+            return " ".join(v for v in (mapa.get(t, t) for t in s.split(" ")) if v)
+        return _RE_WS.sub(" ", self._secuencial(s)).strip()
+
+
 def expandir_abreviaturas(s: str) -> str:
     """
     Convierte abreviaturas frecuentes en tokens estables.
     Esto hace que el matching por tokens sea viable incluso con inputs "tipo WhatsApp".
+    Una sola pasada (lookup por token) sobre la forma base; ver ExpansorAbreviaturas.
     """
-    if not s:
-        return ""
-    out = s
-    for patron, repl in ABREVIATURAS:
-        out = re.sub(patron, repl, out)
-    out = re.sub(r"\s+", " ", out).strip()
-    return out
+    return modelo_canon().expansor.expandir(s)
 
 
 # ------------------------------------------------------------
@@ -221,6 +325,39 @@ TOKEN_RULES = [
 ]
 
 
+class IndiceReglasToken:
+    """
+    Índice invertido token -> reglas que lo contienen.
+
+    buscar(toks) devuelve la etiqueta de la PRIMERA regla (orden de la tabla)
+    cuyos tokens requeridos están todos en toks, igual que el loop con issubset.
+    Solo visita las reglas que comparten algún token con el valor:
+    el costo depende de len(toks), no del tamaño de la tabla.
+    """
+
+    def __init__(self, reglas: list[tuple[set[str], str]]):
+        self._etiquetas = [etiqueta for _, etiqueta in reglas]
+        self._tamanos = [len(req) for req, _ in reglas]
+        self._por_token: dict[str, list[int]] = {}
+        for i, (req, _) in enumerate(reglas):
+            for t in req:
+                self._por_token.setdefault(t, []).append(i)
+        # Regla vacía = subset de todo (match incondicional desde su posición).
+        self._vacia = next((i for i, n in enumerate(self._tamanos) if n == 0), None)
+
+    def buscar(self, toks: set[str]) -> str | None:
+        hits: dict[int, int] = {}
+        for t in toks:
+            for i in self._por_token.get(t, ()):
+                hits[i] = hits.get(i, 0) + 1
+
+        mejor = self._vacia
+        for i, n in hits.items():
+            if n == self._tamanos[i] and (mejor is None or i < mejor):
+                mejor = i
+        return self._etiquetas[mejor] if mejor is not None else None
+
+
 # ------------------------------------------------------------
 # (4) Regex de respaldo (por cobertura)
 # ------------------------------------------------------------
@@ -270,25 +407,280 @@ PATRONES_PROGRAMA = [
 # ------------------------------------------------------------
 # (5) Fuzzy (último recurso, umbral alto)
 # ------------------------------------------------------------
-def fuzzy_best_label(base: str, min_ratio: float = 0.90) -> str | None:
+FUZZY_MIN_RATIO = 0.90
+
+
+class IndiceFuzzy:
+    """
+    Fuzzy contra labels canon con formas base precalculadas y poda exacta.
+
+    ratio = 2*M / (len(a) + len(b)), con M = caracteres emparejados. Cotas de M:
+    - longitud: M <= min(len(a), len(b))
+    - conteo de caracteres (n-grama n=1): M <= sum_c min(cnt_a[c], cnt_b[c])
+    Un candidato se descarta si su cota no alcanza min_ratio o no supera al mejor
+    actual. Mismo resultado que recorrer todos los labels (mismo orden, mismo
+    desempate, mismos floats).
+
+    Nota: n-gramas de orden >= 2 no acotan el ratio de SequenceMatcher
+    (un bloque de largo 1 empareja caracteres sin compartir bigramas).
+    """
+
+    def __init__(self, etiquetas: list[str], normalizar=None):
+        normalizar = normalizar or forma_base
+        entradas = []
+        for lab in etiquetas:
+            base = normalizar(lab)
+            sm = SequenceMatcher(None, "", base)  # índice de b (lo caro de SequenceMatcher)
+            entradas.append((lab, len(base), Counter(base), (base, sm.b2j, sm.bjunk, sm.bpopular)))
+        # Solo datos de b (inmutables en uso): el índice vive en el modelo global
+        # compartido, así que el matcher (que guarda a y sus bloques) es por llamada.
+        self._entradas = tuple(entradas)
+
+    @staticmethod
+    def _matcher(a: str, lado_b: tuple) -> SequenceMatcher:
+        """
+        SequenceMatcher(None, a, b) reusando el índice de b ya calculado.
+        b2j / bjunk / bpopular son internos de difflib (lo que arma set_seq2):
+        test_fuzzy_matcher_igual_a_difflib falla si cambian.
+        """
+        sm = SequenceMatcher(None)
+        sm.a = a
+        sm.b, sm.b2j, sm.bjunk, sm.bpopular = lado_b
+        return sm
+
+    def mejor(self, base: str, min_ratio: float = FUZZY_MIN_RATIO) -> str | None:
+        best = None
+        best_r = 0.0
+        la = len(base)
+        cnt_a = None
+
+        for lab, lb, cnt_b, lado_b in self._entradas:
+            total = la + lb
+            if not total:
+                continue
+
+            cota = 2.0 * min(la, lb) / total
+            if cota < min_ratio or cota <= best_r:
+                continue
+
+            if cnt_a is None:
+                cnt_a = Counter(base)
+            comunes = sum(min(n, cnt_b[c]) for c, n in cnt_a.items() if c in cnt_b)
+            cota = 2.0 * comunes / total
+            if cota < min_ratio or cota <= best_r:
+                continue
+
+            r = self._matcher(base, lado_b).ratio()
+            if r > best_r:
+                best_r = r
+                best = lab
+
+        return best if best is not None and best_r >= min_ratio else None
+
+
+def fuzzy_best_label(base: str, min_ratio: float = FUZZY_MIN_RATIO) -> str | None:
     """
     Último recurso: fuzzy contra labels canon ya normalizados.
     Umbral alto para NO inventar matches con ruido.
     """
-    best = None
-    best_r = 0.0
-    for lab in LABELS_CANON:
-        r = SequenceMatcher(None, base, forma_base(lab)).ratio()
-        if r > best_r:
-            best_r = r
-            best = lab
-    return best if best is not None and best_r >= min_ratio else None
+    return modelo_canon().fuzzy.mejor(base, min_ratio)
+
+
+# ------------------------------------------------------------
+# (6) Motor por valor único + caché
+# ------------------------------------------------------------
+# Un archivo de ~80k filas trae solo unos cientos de PROGRAMA distintos:
+# cada valor crudo se resuelve UNA vez y el resultado se difunde a la columna.
+#
+# La caché persistente se invalida sola si cambia cualquier tabla de reglas
+# (o la lógica del motor: subir VERSION_MOTOR al tocar forma_base/canonizar_base).
+VERSION_MOTOR = 1
+
+
+def _firma_reglas(labels, typos, abreviaturas, token_rules, patrones, fuzzy_min_ratio) -> str:
+    return firma_tablas(VERSION_MOTOR, labels, typos, abreviaturas, token_rules, patrones, fuzzy_min_ratio)
+
+
+FIRMA_REGLAS = _firma_reglas(
+    LABELS_CANON,
+    TYPOS,
+    ABREVIATURAS,
+    TOKEN_RULES,
+    PATRONES_PROGRAMA,
+    FUZZY_MIN_RATIO,
+)
+
+CACHE_PROGRAMA_MAX = 50_000
+
+# Caché de proceso (sin disco) para llamadas directas a canonizar_programa().
+_CACHE_MEMORIA = CacheLRU(None, FIRMA_REGLAS, max_entradas=CACHE_PROGRAMA_MAX)
+
+
+def abrir_cache_programa(path: Path | None = None) -> CacheLRU:
+    """
+    Caché persistente de canonización (sobrevive entre corridas).
+    Default: <directorio_cache()>/programa_canon.json
+    Carga también el modelo compilado guardado al lado (abrir_modelo_programa).
+    """
+    path = path if path is not None else directorio_cache() / "programa_canon.json"
+    abrir_modelo_programa(path.with_name(MODELO_ARCHIVO))
+    return CacheLRU(path, FIRMA_REGLAS, max_entradas=CACHE_PROGRAMA_MAX)
+
+
+# ------------------------------------------------------------
+# (7) Modelo compilado
+# ------------------------------------------------------------
+# compilar_modelo() pasa las tablas (1)-(5) a estructuras listas para usar:
+# - typos reducidos a los que pueden aparecer tras unidecode + lower
+# - expansor de abreviaturas (lookup por token), índice de reglas por token
+# - regex de respaldo precompiladas (no dependen de la caché interna de `re`,
+#   que tiene 512 entradas y se comparte con el resto del proceso)
+# - formas base de los labels canon (fuzzy)
+# El modelo es inmutable y se guarda en disco (pickle) bajo FIRMA_REGLAS:
+# el batch lo compila una vez y cada worker lo carga sin rehacerlo.
+MODELO_ARCHIVO = "programa_modelo.pkl"
+
+_VERSION_MODELO = 2
+
+
+@dataclass(frozen=True)
+class ModeloCanon:
+    firma: str
+    etiquetas: frozenset[str]
+    typos: tuple[tuple[str, str], ...]
+    expansor: ExpansorAbreviaturas
+    tokens: IndiceReglasToken
+    patrones: tuple[tuple[re.Pattern, str], ...]
+    fuzzy: IndiceFuzzy
+    fuzzy_min_ratio: float
+
+    def forma_base(self, x) -> str:
+        return _forma_base(x, self.typos)
+
+    def canonizar_base(self, s: str) -> str | None:
+        """Tokens -> regex -> fuzzy sobre una base YA expandida; None = no reconocido."""
+        if not s:
+            return None
+
+        etiqueta = self.tokens.buscar(tokenize(s))
+        if etiqueta:
+            return etiqueta
+
+        for rx, etiqueta in self.patrones:
+            if rx.search(s):
+                return etiqueta
+
+        return self.fuzzy.mejor(s, self.fuzzy_min_ratio)
+
+    def resolver(self, raw: str) -> tuple[str, str | None]:
+        base_exp = self.expansor.expandir(self.forma_base(raw))
+        asignado = self.canonizar_base(base_exp)
+        canon = clean_label(asignado) if asignado else pd.NA
+        return base_exp, (None if pd.isna(canon) else canon)
+
+    def guardar(self, path: Path) -> None:
+        """Escritura atómica (tmp por proceso + replace); si falla, se sigue sin archivo."""
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump((_VERSION_MODELO, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    @staticmethod
+    def cargar(path: Path, firma: str) -> ModeloCanon | None:
+        """Modelo guardado, o None si no existe, está corrupto o es de otras reglas."""
+        try:
+            with open(path, "rb") as f:
+                guardado = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, OSError):
+            return None
+        if not isinstance(guardado, tuple) or len(guardado) != 2:
+            return None
+        version, modelo = guardado
+        if version != _VERSION_MODELO or not isinstance(modelo, ModeloCanon) or modelo.firma != firma:
+            return None
+        return modelo
+
+
+def compilar_modelo(
+    labels: list[str] = LABELS_CANON,
+    typos: list[tuple[str, str]] = TYPOS,
+    abreviaturas: list[tuple[str, str]] = ABREVIATURAS,
+    token_rules: list[tuple[set[str], str]] = TOKEN_RULES,
+    patrones: list[tuple[str, str]] = PATRONES_PROGRAMA,
+    fuzzy_min_ratio: float = FUZZY_MIN_RATIO,
+) -> ModeloCanon:
+    """Tablas declarativas -> ModeloCanon (default: las tablas de este módulo)."""
+    # forma_base corre los typos sobre texto ya pasado por unidecode + lower:
+    # uno con tildes o mayúsculas nunca matchea.
+    typos_vivos = tuple((a, b) for a, b in typos if unidecode(a).lower() == a)
+    return ModeloCanon(
+        firma=_firma_reglas(labels, typos, abreviaturas, token_rules, patrones, fuzzy_min_ratio),
+        etiquetas=frozenset(labels),
+        typos=typos_vivos,
+        expansor=ExpansorAbreviaturas(abreviaturas),
+        tokens=IndiceReglasToken(token_rules),
+        patrones=tuple((re.compile(p), etiqueta) for p, etiqueta in patrones),
+        fuzzy=IndiceFuzzy(labels, normalizar=lambda x: _forma_base(x, typos_vivos)),
+        fuzzy_min_ratio=fuzzy_min_ratio,
+    )
+
+
+_MODELO: ModeloCanon | None = None
+
+
+def modelo_canon() -> ModeloCanon:
+    """Modelo del proceso (se compila en el primer uso)."""
+    global _MODELO
+    if _MODELO is None:
+        _MODELO = compilar_modelo()
+    return _MODELO
+
+
+def abrir_modelo_programa(path: Path | None = None) -> ModeloCanon:
+    """
+    Modelo desde disco si coincide la firma; si no, lo compila y lo guarda.
+    Default: <directorio_cache()>/programa_modelo.pkl
+    """
+    global _MODELO
+    path = path if path is not None else directorio_cache() / MODELO_ARCHIVO
+    if _MODELO is not None and _MODELO.firma == FIRMA_REGLAS and path.exists():
+        return _MODELO
+    modelo = ModeloCanon.cargar(path, FIRMA_REGLAS)
+    if modelo is None:
+        modelo = modelo_canon()
+        modelo.guardar(path)
+    _MODELO = modelo
+    return modelo
+
+
+def canonizar_base(s: str) -> str | None:
+    """
+    Asigna label canon a una base YA expandida (tokens -> regex -> fuzzy).
+    Devuelve None si no reconoce (modo cerrado).
+    """
+    return modelo_canon().canonizar_base(s)
+
+
+def resolver_programa(raw: str) -> tuple[str, str | None]:
+    """
+    Resuelve UN valor crudo (no-NA) -> (PROGRAMA_BASE, PROGRAMA_CANON).
+    El canon ya viene pasado por clean_label; None = no reconocido.
+    """
+    return modelo_canon().resolver(raw)
 
 
 # ------------------------------------------------------------
 # API pública: canonizar_programa()
 # ------------------------------------------------------------
-def canonizar_programa(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+def canonizar_programa(
+    df: pd.DataFrame,
+    cache: CacheLRU | None = None,
+    copiar: bool = True,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Canoniza la columna PROGRAMA.
 
@@ -299,8 +691,13 @@ def canonizar_programa(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     Reporte:
       - PROGRAMA_ORIGINAL, PROGRAMA_BASE, FRECUENCIA para los no reconocidos
         (todo lo que NO quedó dentro de LABELS_CANON).
+
+    cache: CacheLRU (p.ej. abrir_cache_programa()) para reutilizar resultados
+    entre corridas. Default: caché en memoria del proceso.
+    copiar=False agrega PROGRAMA_BASE / PROGRAMA_CANON sobre el mismo df.
     """
-    df = df.copy()
+    if copiar:
+        df = df.copy()
 
     if "PROGRAMA" not in df.columns:
         df["PROGRAMA_BASE"] = pd.NA
@@ -308,58 +705,65 @@ def canonizar_programa(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
         rep = pd.DataFrame(columns=["PROGRAMA_ORIGINAL", "PROGRAMA_BASE", "FRECUENCIA"])
         return df, rep
 
-    prog_original = df["PROGRAMA"].copy()
+    cache = cache if cache is not None else _CACHE_MEMORIA
+    prog_original = df["PROGRAMA"]
 
-    # 1) Base limpia
-    base = prog_original.map(forma_base)
+    # Clave = str(valor) (lo mismo que ve forma_base). Evita que factorize
+    # junte 1 / 1.0 / True en object columns mixtas.
+    if pd.api.types.is_string_dtype(prog_original):
+        claves = prog_original
+    else:
+        claves = prog_original.where(prog_original.isna(), prog_original.astype(str))
 
-    # 2) Expansión de abreviaturas
-    base_exp = base.map(expandir_abreviaturas)
+    # 1) Valores únicos (NA -> código -1)
+    codes, uniques = pd.factorize(claves)
 
-    canon: list[object] = []
-    for s in base_exp:
-        if not s:
-            canon.append(pd.NA)
-            continue
+    bases: list[str] = []
+    canons: list[object] = []
+    for u in uniques:
+        hit = cache.get(u)
+        if hit is None:
+            hit = resolver_programa(u)
+            cache.put(u, list(hit))
+        base_exp, canon = hit
+        bases.append(base_exp)
+        canons.append(pd.NA if canon is None else canon)
+
+    # NA (código -1 -> último slot) -> base "" y canon NA (igual que forma_base(NA))
+    bases.append("")
+    canons.append(pd.NA)
 
-        asignado = None
+    # 2) Broadcast a la columna
+    df["PROGRAMA_BASE"] = pd.Series(np.asarray(bases, dtype=object).take(codes).tolist(), index=df.index)
+    df["PROGRAMA_CANON"] = pd.Series(np.asarray(canons, dtype=object).take(codes).tolist(), index=df.index)
 
-        # A) Tokens primero (robusto al orden)
-        toks = tokenize(s)
-        for req, etiqueta in TOKEN_RULES:
-            if req.issubset(toks):
-                asignado = etiqueta
-                break
+    return df, ordenar_no_reconocidos(contar_no_reconocidos(df))
 
-        # B) Regex (backup por cobertura)
-        if not asignado:
-            for patron, etiqueta in PATRONES_PROGRAMA:
-                if re.search(patron, s):
-                    asignado = etiqueta
-                    break
 
-        # C) Fuzzy (último recurso)
-        if not asignado:
-            fb = fuzzy_best_label(s, min_ratio=0.90)
-            if fb:
-                asignado = fb
+def contar_no_reconocidos(df: pd.DataFrame) -> pd.Series:
+    """
+    Frecuencia (PROGRAMA, PROGRAMA_BASE) de lo que NO quedó en el universo
+    canon, en orden de primera aparición (sin ordenar). Requiere PROGRAMA_CANON.
+    """
+    canon_set = modelo_canon().etiquetas
+    mask_no = df["PROGRAMA_CANON"].isna() | (~df["PROGRAMA_CANON"].isin(canon_set))
+    return df.loc[mask_no, ["PROGRAMA", "PROGRAMA_BASE"]].value_counts(sort=False, dropna=False)
 
-        # MODO CERRADO: si no asigna a canon -> NA (se reporta)
-        canon.append(asignado if asignado else pd.NA)
 
-    df["PROGRAMA_BASE"] = base_exp
-    df["PROGRAMA_CANON"] = pd.Series(canon, index=df.index).map(clean_label)
+def combinar_no_reconocidos(conteos: list[pd.Series]) -> pd.Series:
+    """
+    Suma conteos de contar_no_reconocidos por bloque. El orden de primera
+    aparición se conserva, así que ordenar el total da el mismo reporte que
+    contar el df completo.
+    """
+    return pd.concat(conteos).groupby(level=[0, 1], sort=False, dropna=False).sum()
 
-    # Reporte: lo que NO quedó en el universo canon (incluye NA? no, NA se queda fuera)
-    canon_set = set(LABELS_CANON)
-    mask_no = df["PROGRAMA_CANON"].isna() | (~df["PROGRAMA_CANON"].isin(canon_set))
 
-    rep = (
-        df.loc[mask_no, ["PROGRAMA", "PROGRAMA_BASE"]]
-        .value_counts(dropna=False)
+def ordenar_no_reconocidos(conteo: pd.Series) -> pd.DataFrame:
+    """Reporte PROGRAMA_ORIGINAL / PROGRAMA_BASE / FRECUENCIA (mismo orden que value_counts)."""
+    return (
+        conteo.sort_values(ascending=False, kind="stable")
         .reset_index(name="FRECUENCIA")
         .rename(columns={"PROGRAMA": "PROGRAMA_ORIGINAL"})
         .sort_values("FRECUENCIA", ascending=False)
     )
-
-    return df, rep
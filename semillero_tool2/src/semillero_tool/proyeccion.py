@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .columns import normalizar_columna
+from .config import COLUMNAS_ID, COLUMNAS_ID_DEDUP, COLUMNAS_USADAS, FU_COLS
+
+
+# ============================================================
+# PROYECCIÓN DE COLUMNAS (leer solo las que usan las etapas)
+# ------------------------------------------------------------
+# - Los lectores (Excel pandas / streaming, CSV, multi-hoja) reciben un
+#   usecols: la columna se lee si su nombre normalizado (normalizar_columna)
+#   es uno de los que usa el pipeline:
+#     IDs (config.COLUMNAS_ID y 'ID*', igual que asegurar_ids_como_texto),
+#     F..U, config.COLUMNAS_USADAS (PROGRAMA, FECHA), las críticas del drop
+#     general y las pedidas en conservar (pasan al output sin usarse).
+# - Se decide por nombre normalizado SIN el sufijo __n: las variantes de una
+#   columna ("Programa" / "PROGRAMA ") entran o quedan fuera juntas, así los
+#   nombres del output son los mismos que sin proyección.
+# - El selector recibe el nombre final de cada columna del header
+#   (duplicados exactos ya como .1, .2 ...), el mismo que el usecols
+#   callable de pd.read_excel.
+# - Las columnas no leídas no aparecen en DATA ni en los reportes por
+#   columna (REPORTE_TEXTO, REPORTE_DUPLICADOS); las leídas salen iguales.
+# ============================================================
+
+
+@dataclass(frozen=True)
+class SelectorColumnas:
+    """usecols de los lectores: True si la columna se lee. Picklable (pool de ingesta)."""
+
+    normalizadas: frozenset[str]
+
+    def __call__(self, nombre) -> bool:
+        norm = normalizar_columna(nombre)
+        return norm in self.normalizadas or norm.startswith("ID")
+
+
+def columnas_usadas(criticas: list[str] | None = None, conservar: tuple[str, ...] = ()) -> frozenset[str]:
+    """Nombres normalizados que se leen (ver bloque de arriba)."""
+    cols = set(COLUMNAS_ID) | set(COLUMNAS_ID_DEDUP) | set(FU_COLS) | set(COLUMNAS_USADAS)
+    cols.update(normalizar_columna(c) for c in (criticas or ()))
+    cols.update(normalizar_columna(c) for c in conservar)
+    return frozenset(cols)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pandas as pd
+
+
+def sumar_reportes(
+    parciales: list[pd.DataFrame],
+    clave: str | None,
+    columnas: list[str],
+) -> dict:
+    """
+    Suma columnas de conteo de reportes parciales (uno por bloque).
+    - clave=None: reportes de una sola fila -> {columna: total}
+    - clave="COLUMNA": {valor_clave: {columna: total}} en orden de primera aparición
+    NA (p.ej. conteos de columnas inexistentes) cuentan como 0.
+    """
+    def _sumar(total: dict[str, int], fila: dict) -> None:
+        for c in columnas:
+            v = fila[c]
+            total[c] = total.get(c, 0) + (0 if pd.isna(v) else int(v))
+
+    if clave is None:
+        total: dict[str, int] = dict.fromkeys(columnas, 0)
+        for rep in parciales:
+            for fila in rep.to_dict("records"):
+                _sumar(total, fila)
+        return total
+
+    por_clave: dict[object, dict[str, int]] = {}
+    for rep in parciales:
+        for fila in rep.to_dict("records"):
+            _sumar(por_clave.setdefault(fila[clave], dict.fromkeys(columnas, 0)), fila)
+    return por_clave
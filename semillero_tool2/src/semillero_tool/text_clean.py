@@ -1,51 +1,193 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from .config import COLUMNAS_ID
+from .reports import sumar_reportes
 
 
-def limpiar_texto(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+# Representaciones basura típicas de NA que llegan como texto.
+SENTINELAS_NA = frozenset({"nan", "None", "NaT"})
+
+# Texto intermedio para columnas object: backend python (reutiliza los str
+# existentes, sin re-materializar cada celda). Las columnas que ya son texto
+# se procesan en su propio backend (Arrow si pandas las leyó así).
+_DTYPE_TEXTO = pd.StringDtype("python")
+
+
+def _limpiar_columna_texto(s: pd.Series) -> tuple[pd.Series | None, int]:
+    """
+    Limpia UNA columna texto/object:
+    - una sola conversión a texto (NA preservado)
+    - factorize: strip y sentinelas se resuelven una vez por valor distinto
+    - sentinelas ("nan", "None", "NaT") -> NA  (se evalúan ANTES del strip)
+    - conteo de cambios por strip desde los mismos códigos
+
+    Devuelve (columna_limpia | None si no hay nada que cambiar, n_cambios).
+    """
+    es_texto = isinstance(s.dtype, pd.StringDtype)
+    txt = s if es_texto else s.astype(_DTYPE_TEXTO)
+
+    codes, uniques = pd.factorize(txt)  # NA -> -1
+
+    finales: list[object] = []
+    cambia = np.zeros(len(uniques), dtype=bool)
+    hay_sentinelas = False
+    for i, v in enumerate(uniques.tolist()):
+        if v in SENTINELAS_NA:
+            finales.append(pd.NA)
+            hay_sentinelas = True
+            continue
+        limpio = v.strip()
+        cambia[i] = limpio != v
+        finales.append(limpio)
+
+    conteos = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    n_changed = int(conteos[cambia].sum())
+
+    if es_texto:
+        if n_changed == 0 and not hay_sentinelas:
+            return None, 0
+        # Mismo dtype de entrada (su propio NA: NaN para "str", <NA> para "string")
+        limpia = pd.array(finales, dtype=s.dtype).take(codes, allow_fill=True)
+        return pd.Series(limpia, index=s.index, name=s.name), n_changed
+
+    # object: strings limpias + NA originales intactos (None/NaN/NaT) + sentinelas -> pd.NA
+    out = np.asarray(finales + [None], dtype=object).take(codes)
+    na = codes < 0
+    if na.any():
+        out[na] = s.to_numpy(dtype=object)[na]
+    return pd.Series(out, index=s.index, name=s.name, dtype=object), n_changed
+
+
+def limpiar_texto(df: pd.DataFrame, copiar: bool = True) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Strip seguro para columnas string/object SIN convertir NaN a "nan".
     Devuelve (df, reporte) con conteo de valores modificados por columna.
+    copiar=False reemplaza las columnas sobre el mismo df (sin copia previa).
     """
-    df = df.copy()
-    rows = []
+    if copiar:
+        df = df.copy()
+    cambios: dict[str, int] = {}
 
     for c in df.columns:
         if pd.api.types.is_string_dtype(df[c]) or df[c].dtype == object:
-            s = df[c]
-
-            # Preserva NA
-            s2 = s.where(s.isna(), s.astype(str))
-
-            # Limpia representaciones basura típicas
-            s2 = s2.replace({"nan": pd.NA, "None": pd.NA, "NaT": pd.NA})
-
-            # Strip solo donde no es NA
-            stripped = s2.where(s2.isna(), s2.astype(str).str.strip())
+            limpia, n_changed = _limpiar_columna_texto(df[c])
+            if limpia is not None:
+                df[c] = limpia
 
-            # Conteo de cambios (aprox) en no-NA
-            before = s2.where(s2.isna(), s2.astype(str))
-            after = stripped.where(stripped.isna(), stripped.astype(str))
-            n_changed = int(((before != after) & before.notna() & after.notna()).sum())
+            cambios[c] = n_changed
 
-            df[c] = stripped
+    return df, _reporte_texto(cambios)
 
-            if n_changed:
-                rows.append({"COLUMNA": c, "N_STRIP_CAMBIOS": n_changed})
 
-    rep = (
+def _reporte_texto(cambios: dict[str, int]) -> pd.DataFrame:
+    rows = [{"COLUMNA": c, "N_STRIP_CAMBIOS": n} for c, n in cambios.items() if n]
+    return (
         pd.DataFrame(rows, columns=["COLUMNA", "N_STRIP_CAMBIOS"])
         .sort_values("N_STRIP_CAMBIOS", ascending=False)
         if rows
         else pd.DataFrame(columns=["COLUMNA", "N_STRIP_CAMBIOS"])
     )
 
-    return df, rep
+
+def combinar_reportes_texto(parciales: list[pd.DataFrame], columnas: list[str]) -> pd.DataFrame:
+    """
+    Une reportes de limpiar_texto por bloque. columnas: orden de columnas del
+    df (el reporte parcial ya viene ordenado por conteo y lo pierde).
+    """
+    sumas = sumar_reportes(parciales, "COLUMNA", ["N_STRIP_CAMBIOS"])
+    return _reporte_texto({c: sumas[c]["N_STRIP_CAMBIOS"] for c in columnas if c in sumas})
+
+
+# Repr de float más chico que ya sale en notación científica (str(1e16) ==
+# "1e+16"): de ahí para arriba no hay sufijo ".0" que quitar.
+_FLOAT_SIN_CIENTIFICA = 1e16
 
 
-def asegurar_ids_como_texto(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+def _id_float(s: pd.Series) -> tuple[pd.Series | None, int, int]:
+    """
+    Columna float64: los enteros exactos (< 1e16) se formatean directo vía
+    int64 (mismo resultado que str(v) sin el ".0"); el resto (1.5, 1e+16, inf)
+    pasa por astype(str) como antes. Strip no cambia nada en un float, así que
+    cada cambio es un fix ".0".
+    """
+    v = s.to_numpy()
+    ok = ~np.isnan(v)
+    if not ok.any():
+        return None, 0, 0
+    entero = ok & np.isfinite(v)
+    entero[entero] = (np.trunc(v[entero]) == v[entero]) & (np.abs(v[entero]) < _FLOAT_SIN_CIENTIFICA)
+
+    out = s.to_numpy(dtype=object, copy=True)  # NaN originales quedan
+    textos = v[entero].astype(np.int64).astype(str).astype(object)
+    textos[np.signbit(v[entero]) & (v[entero] == 0)] = "-0"  # str(-0.0) == "-0.0"
+    out[entero] = textos
+    resto = ok & ~entero
+    if resto.any():
+        out[resto] = s[resto].astype(str).to_numpy(dtype=object)
+    n_dot0 = int(entero.sum())
+    return pd.Series(out, index=s.index, name=s.name, dtype=object), n_dot0, n_dot0
+
+
+def _id_texto(s: pd.Series) -> tuple[pd.Series | None, int, int]:
+    """
+    Columna object / texto en una pasada vectorizada sobre el dtype "str": una
+    sola conversión a texto; strip, fix ".0" (slice, sin regex) y los dos
+    conteos salen de las mismas máscaras. Sin factorize: los IDs casi no se
+    repiten.
+    """
+    txt = s.astype(str)  # no-op si ya es "str"
+    ok = txt.notna().to_numpy()
+    if not ok.any():
+        return None, 0, 0
+
+    limpio = txt.str.strip()
+    dot0 = limpio.str.endswith(".0").to_numpy(dtype=bool, na_value=False)
+    if dot0.any():
+        limpio = limpio.mask(dot0, limpio.str.slice(0, -2))
+    cambia = (limpio != txt).to_numpy(dtype=bool, na_value=False) & ok
+    n_changed, n_dot0 = int(cambia.sum()), int(dot0.sum())
+
+    if isinstance(s.dtype, pd.StringDtype):
+        # Mismo dtype de entrada (su propio NA: NaN para "str", <NA> para "string")
+        return (limpio if limpio.dtype == s.dtype else limpio.astype(s.dtype)), n_changed, n_dot0
+
+    # object: strings limpias + NA originales intactos (None/NaN/NaT)
+    out = s.to_numpy(dtype=object, copy=True)
+    out[ok] = limpio.to_numpy(dtype=object)[ok]
+    return pd.Series(out, index=s.index, name=s.name, dtype=object), n_changed, n_dot0
+
+
+def _id_generico(s: pd.Series) -> tuple[pd.Series | None, int, int]:
+    """Otros dtypes (bool, nullable, fechas): conversión genérica vía astype(str)."""
+    s2 = s.where(s.isna(), s.astype(str).str.strip())
+    s3 = s2.where(s2.isna(), s2.astype(str).str.replace(r"\.0$", "", regex=True))
+
+    before = s.where(s.isna(), s.astype(str))
+    after = s3.where(s3.isna(), s3.astype(str))
+    n_changed = int(((before != after) & before.notna() & after.notna()).sum())
+    n_dot0 = int(((s2.notna()) & (s2.astype(str).str.endswith(".0"))).sum())
+    return s3, n_changed, n_dot0
+
+
+def _id_como_texto(s: pd.Series) -> tuple[pd.Series | None, int, int]:
+    """
+    Una columna ID -> (columna | None si queda igual, n_cambios, n_dot0).
+    Camino rápido por dtype; todos dan lo mismo que la conversión genérica.
+    """
+    if isinstance(s.dtype, np.dtype) and s.dtype.kind in "iu":  # numpy int: sin NA, sin ".0", sin espacios
+        if len(s) == 0:
+            return None, 0, 0
+        return pd.Series(s.to_numpy().astype(str), index=s.index, name=s.name, dtype=object), 0, 0
+    if s.dtype == np.float64:
+        return _id_float(s)
+    if s.dtype == object or isinstance(s.dtype, pd.StringDtype):
+        return _id_texto(s)
+    return _id_generico(s)
+
+
+def asegurar_ids_como_texto(df: pd.DataFrame, copiar: bool = True) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Fuerza columnas ID conocidas (o que empiecen por 'ID') a texto.
     Arregla el bug clásico: Excel/Pandas tienden a leer IDs como float y exportarlos como "123.0".
@@ -53,35 +195,21 @@ def asegurar_ids_como_texto(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFram
     Reglas:
     - NO inventa IDs.
     - Solo normaliza representación: strip + remover sufijo ".0" si existe.
+    - N_CAMBIOS_TOTAL: valores cuyo texto cambió; N_DOT0_FIX: cuántos traían ".0"
+      (floats disfrazados), contado después del strip.
 
     Devuelve (df, reporte) con columnas afectadas y conteo de fixes.
+    copiar=False escribe las columnas ID sobre el mismo df.
     """
-    df = df.copy()
+    if copiar:
+        df = df.copy()
     rows = []
 
     for c in df.columns:
         if c in COLUMNAS_ID or c.startswith("ID"):
-            s = df[c]
-
-            # 1) convertir a string preservando NA
-            s2 = s.where(s.isna(), s.astype(str).str.strip())
-
-            # 2) fix quirúrgico: si termina en ".0", lo quitamos.
-            #    Esto cubre el caso típico: 1040039503.0 -> 1040039503
-            s3 = s2.where(s2.isna(), s2.astype(str).str.replace(r"\.0$", "", regex=True))
-
-            # conteo de cambios por strip + fix .0 (solo donde no es NA)
-            before = s.where(s.isna(), s.astype(str))
-            after = s3.where(s3.isna(), s3.astype(str))
-            n_changed = int(((before != after) & before.notna() & after.notna()).sum())
-
-            # conteo específico del fix ".0" (para saber cuántos eran floats disfrazados)
-            # Ojo: lo calculamos sobre s2->s3 (después del strip)
-            n_dot0_fixed = int(
-                ((s2.notna()) & (s2.astype(str).str.endswith(".0"))).sum()
-            )
-
-            df[c] = s3
+            nueva, n_changed, n_dot0_fixed = _id_como_texto(df[c])
+            if nueva is not None:
+                df[c] = nueva
 
             rows.append({
                 "COLUMNA": c,
@@ -90,10 +218,20 @@ def asegurar_ids_como_texto(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFram
                 "N_DOT0_FIX": n_dot0_fixed,
             })
 
-    rep = (
+    return df, _reporte_ids(rows)
+
+
+def _reporte_ids(rows: list[dict]) -> pd.DataFrame:
+    return (
         pd.DataFrame(rows, columns=["COLUMNA", "ACCION", "N_CAMBIOS_TOTAL", "N_DOT0_FIX"])
         if rows
         else pd.DataFrame(columns=["COLUMNA", "ACCION", "N_CAMBIOS_TOTAL", "N_DOT0_FIX"])
     )
 
-    return df, rep
+
+def combinar_reportes_ids(parciales: list[pd.DataFrame]) -> pd.DataFrame:
+    """Une reportes de asegurar_ids_como_texto por bloque (mismas filas, conteos sumados)."""
+    sumas = sumar_reportes(parciales, "COLUMNA", ["N_CAMBIOS_TOTAL", "N_DOT0_FIX"])
+    return _reporte_ids([
+        {"COLUMNA": c, "ACCION": "ID_AS_TEXT_STRIP_DOT0_FIX", **t} for c, t in sumas.items()
+    ])
@@ -0,0 +1,32 @@
+import pytest
+
+from semillero_tool.pipeline import RunConfig
+
+# Corrida "neutra": sin validaciones, drops ni canonización; cada test activa lo suyo.
+_CFG_BASE = dict(
+    sheet=None,
+    strict_schema=False,
+    fu_validate=False,
+    fu_drop_mode="none",
+    min_non_missing_fu=None,
+    canonizar_programa=False,
+    reemplazar_programa=False,
+    drop_missing_mode="none",
+    critical_cols_csv=None,
+)
+
+
+@pytest.fixture(autouse=True)
+def _cache_aislada(tmp_path, monkeypatch):
+    # Cachés en disco (checkpoints de etapas, PROGRAMA) por test, no en ~/.cache
+    monkeypatch.setenv("SEMILLERO_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def cfg():
+    """Fábrica de RunConfig: cfg(entrada, salida, **cambios) sobre _CFG_BASE."""
+
+    def hacer(input_path, output_path, **cambios) -> RunConfig:
+        return RunConfig(input_path=input_path, output_path=output_path, **{**_CFG_BASE, **cambios})
+
+    return hacer
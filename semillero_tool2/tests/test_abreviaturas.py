@@ -0,0 +1,52 @@
+import itertools
+import re
+
+from semillero_tool.config import PROGRAMA_ABREVIATURAS
+from semillero_tool.programa import ABREVIATURAS, ExpansorAbreviaturas, forma_base
+
+
+# Grafías reales de PROGRAMA (intake) + variantes típicas de digitación.
+CORPUS_PROGRAMA = [
+    "inge.sistemas", "Ing.Sistemas", "Ing. Sistema", "Ingenieria en sistemas", "ING SIST",
+    "ingeneria de sistemas", "Ingeniera de sistemas", "Ing.-Sist/", "ingen sistemas",
+    "Ingeniería Electrónica", "ing electronica", "Ing. Electrónico", "Ing. Industrial",
+    "ingenieria_industrial", "ing ambiental", "Ingeniería Ambiental",
+    "Lic. Lenguas Extranjeras", "lic lenguas", "Licenciatura en Lenguas Extranjeras",
+    "lenguas extranjeras", "L. Lenguas", "Lic Lenguas", "Lic. Educación Infantil",
+    "lic edu fisica", "Lic. Ed. Física", "lic. ed. fis", "Licenciatura Ciencias Naturales",
+    "ciencias naturales", "Psicología", "psicologia", "PSICOLOGIA ", "Derecho", "derecho ",
+    "Comunicación Social", "comunicacion social", "Trabajo Social", "Teología Virtual", "teol",
+    "teol. virtual", "Teologia", "Gerontología Virtual", "gerontologia",
+    "Administración de Empresas", "Administración de empresas", "administración",
+    "adm empresas", "Adm. de Empresas", "admon", "admin. empresas", "Administacion de empresas",
+    "Contaduría Pública", "contaduria pub", "Contaduría púb.", "Contaduría", "Comercio Exterior",
+    "Agronomía", "agronomia", "Zootecnia", "Enfermería", "enfemeria", "enferemería",
+    "Nutrición y Dietética", "nutricion y dietetica", "xyz", "", "   ", "Medicina", "ing", "lic",
+]
+
+
+def _secuencial(tabla, s):
+    """Referencia: la implementación original (re.sub por patrón, en orden)."""
+    if not s:
+        return ""
+    out = s
+    for patron, repl in tabla:
+        out = re.sub(patron, repl, out)
+    return re.sub(r"\s+", " ", out).strip()
+
+
+def _entradas():
+    bases = [forma_base(x) for x in CORPUS_PROGRAMA]
+    # Combinaciones de tokens clave (incluye cadenas de reemplazo, p.ej. ing -> ingenieria)
+    vocab = sorted({t for b in bases for t in b.split(" ") if t} | {"de", "en", "del", "l", "pub"})
+    combos = [" ".join(p) for p in itertools.permutations(vocab[:12], 2)]
+    # Crudos (fuera de la forma base): ejercitan el fallback secuencial
+    return bases + combos + CORPUS_PROGRAMA + ["ing.sistemas", "lic.lenguas", "Ing sist"]
+
+
+def test_expansor_compilado_igual_a_loop_secuencial():
+    for tabla in (ABREVIATURAS, PROGRAMA_ABREVIATURAS):
+        exp = ExpansorAbreviaturas(tabla)
+        assert exp.compilado
+        for s in _entradas():
+            assert exp.expandir(s) == _secuencial(tabla, s), s
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+# Lo que no se debe importar antes de saber que hay algo que correr.
+PESADOS = ("pandas", "numpy", "pyarrow", "openpyxl", "unidecode", "difflib")
+
+# Presupuesto (µs, acumulado de los módulos semillero_tool según -X importtime).
+# Hoy son ~5 ms; importar pipeline cuesta ~500 ms.
+PRESUPUESTO_US = 100_000
+
+
+def _importtime(*args: str) -> tuple[dict[str, int], int]:
+    """{módulo: µs acumulados} de una invocación del CLI, y su exit code."""
+    r = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "semillero_tool", *args],
+        capture_output=True, text=True,
+    )
+    modulos = {}
+    for linea in r.stderr.splitlines():
+        if not linea.startswith("import time:"):
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        if acumulado.strip().isdigit():
+            modulos[nombre.strip()] = int(acumulado)
+    return modulos, r.returncode
+
+
+@pytest.mark.parametrize("args", [["--version"], ["--help"], ["-i", "x.xlsx"]])
+def test_arranque_sin_dependencias_pesadas(args):
+    modulos, codigo = _importtime(*args)
+    assert codigo in (0, 2)  # --help / --version: 0; error de argumentos: 2
+
+    cargados = [m for m in PESADOS if m in modulos]
+    assert not cargados, f"{args} importa {cargados}"
+
+    propio = sum(us for m, us in modulos.items() if m.startswith("semillero_tool") and m.count(".") <= 1)
+    assert propio < PRESUPUESTO_US, f"{args}: {propio} µs"
@@ -0,0 +1,43 @@
+import json
+
+import pandas as pd
+
+from semillero_tool.batch import MANIFEST, codigo_salida, resolver_entradas, run_batch
+from semillero_tool.config import FU_COLS
+
+
+def _libro(path, columnas, filas):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(columnas)
+    for fila in filas:
+        ws.append(fila)
+    wb.save(path)
+
+
+def test_batch_aisla_fallas_y_escribe_manifest(tmp_path, cfg):
+    entrada = tmp_path / "entrada"
+    entrada.mkdir()
+    columnas = ["ID", "Programa", "Fecha"] + list(FU_COLS)
+    _libro(entrada / "a.xlsx", columnas, [[1, "Derecho", "2026-01-02"] + [1] * len(FU_COLS)] * 3)
+    _libro(entrada / "b.xlsx", columnas, [[2, "xyz", "2026-01-03"] + [2] * len(FU_COLS)] * 5)
+    _libro(entrada / "c.xlsx", ["ID", "Programa"], [[3, "Derecho"]])  # sin F..U -> SchemaError
+    (entrada / "notas.txt").write_text("no es un libro")
+
+    base = cfg(entrada, tmp_path / "salida", fu_validate=True, canonizar_programa=True)
+    entradas = resolver_entradas(str(entrada))
+    assert [p.name for p in entradas] == ["a.xlsx", "b.xlsx", "c.xlsx"]
+    # glob: mismo filtro de extensiones que el directorio (notas.txt no entra)
+    assert resolver_entradas(str(entrada / "*")) == entradas
+
+    resultados = run_batch(entradas, base.output_path, base, workers=2)
+    assert [(r.estado, r.codigo, r.filas) for r in resultados] == [("ok", 0, 3), ("ok", 0, 5), ("error", 2, None)]
+    assert codigo_salida(resultados) == 2
+
+    manifest = json.loads((base.output_path / MANIFEST).read_text(encoding="utf-8"))
+    assert manifest["resumen"] == {"archivos": 3, "ok": 2, "error": 1, "fatal": 0, "filas": 8}
+    assert [a["estado"] for a in manifest["archivos"]] == ["ok", "ok", "error"]
+    assert len(pd.read_excel(base.output_path / "b_LIMPIO.xlsx", sheet_name="DATA")) == 5
+    assert not (base.output_path / "c_LIMPIO.xlsx").exists()
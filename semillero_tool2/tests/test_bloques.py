@@ -0,0 +1,48 @@
+import datetime as dt
+from dataclasses import replace
+
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.pipeline import run, run_por_bloques
+
+
+def _libro_intake(path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["ID", "Programa", "Fecha"] + list(FU_COLS) + ["Obs", "Mixta"])
+    programas = ["Ing. Sistemas", " psicologia", "xyz", None, "nan", "Derecho"]
+    fechas = [None, "02/01/2026", "13/01/2026", "x", dt.datetime(2026, 1, 3)]
+    for i in range(40):
+        fu = [None if (i + j) % 7 == 0 else ("x" if (i * j) % 11 == 3 else (i + j) % 5) for j in range(len(FU_COLS))]
+        if i % 9 == 0:
+            fu = [None] * len(FU_COLS)
+        # 1 / 1.0 / True en la misma columna object: pandas los unifica al primero
+        mixta = [True, 1, 1.0, "a", None][i % 5] if i > 5 else "b"
+        ws.append([float(1000 + i) if i % 4 else f" {i} ", programas[i % 6], fechas[i % 5] if i > 3 else None]
+                  + fu + [" obs " if i % 3 else None, mixta])
+    wb.save(path)
+
+
+def test_por_bloques_mismo_output_que_en_memoria(tmp_path, cfg):
+    entrada = tmp_path / "intake.xlsx"
+    _libro_intake(entrada)
+
+    config = cfg(
+        entrada, tmp_path / "memoria.xlsx",
+        strict_schema=True, fu_validate=True, fu_drop_mode="threshold", min_non_missing_fu=12,
+        canonizar_programa=True, drop_missing_mode="any", critical_cols_csv="ID,FECHA",
+    )
+    df = run(config)
+    # bloques chicos: reportes y drops cruzan fronteras de bloque
+    res = run_por_bloques(replace(config, output_path=tmp_path / "bloques.xlsx", filas_por_bloque=6))
+
+    assert (res.filas, res.columnas) == (len(df), list(df.columns))
+    esperado = pd.read_excel(config.output_path, sheet_name=None)
+    obtenido = pd.read_excel(tmp_path / "bloques.xlsx", sheet_name=None)
+    assert list(obtenido) == list(esperado)
+    for hoja in esperado:
+        pd.testing.assert_frame_equal(obtenido[hoja], esperado[hoja], obj=hoja)
+    assert len(esperado["REPORTE_FU_DROPEADAS"]) > 0
@@ -0,0 +1,71 @@
+from dataclasses import replace
+
+import pandas as pd
+import pytest
+
+from semillero_tool import pipeline
+from semillero_tool.cache import CacheEtapas, CacheLRU
+from semillero_tool.config import FU_COLS
+from semillero_tool.pipeline import run
+
+
+def _libro(path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["ID", "Programa", "Fecha"] + list(FU_COLS) + ["Obs"])
+    for i in range(25):
+        fu = [None if (i * j) % 4 == 1 else j for j in range(len(FU_COLS))]
+        ws.append([float(500 + i), ["Derecho", " psicologia", "xyz"][i % 3], "2026-02-03", *fu, " a "])
+    wb.save(path)
+
+
+def test_rerun_retoma_desde_la_etapa_que_cambio(tmp_path, monkeypatch, cfg):
+    entrada = tmp_path / "in.xlsx"
+    _libro(entrada)
+    config = cfg(entrada, tmp_path / "a.xlsx", strict_schema=True, fu_validate=True, canonizar_programa=True)
+    run(config)
+
+    # Solo cambia el drop FU: no se relee el libro ni se re-canoniza.
+    otra = replace(config, output_path=tmp_path / "b.xlsx", fu_drop_mode="threshold", min_non_missing_fu=12)
+    llamadas = []
+    monkeypatch.setattr(pipeline, "_leer_input", lambda c: pytest.fail("releyó el input"))
+    monkeypatch.setattr(pipeline, "canonizar_programa", lambda *a, **k: pytest.fail("re-canonizó"))
+    monkeypatch.setattr(
+        pipeline, "_ETAPAS",
+        tuple((n, lambda *a, n=n, f=f: llamadas.append(n) or f(*a), p) for n, f, p in pipeline._ETAPAS),
+    )
+    df = run(otra)
+    assert llamadas == ["fu", "drop_general"]
+    monkeypatch.undo()
+
+    sin_cache = run(replace(otra, output_path=tmp_path / "c.xlsx", usar_cache=False))
+    pd.testing.assert_frame_equal(df, sin_cache)
+    a = pd.read_excel(tmp_path / "b.xlsx", sheet_name=None)
+    b = pd.read_excel(tmp_path / "c.xlsx", sheet_name=None)
+    assert list(a) == list(b)
+    for hoja in a:
+        pd.testing.assert_frame_equal(a[hoja], b[hoja])
+
+
+def test_cache_etapas_poda_por_tamano(tmp_path):
+    cache = CacheEtapas(tmp_path / "etapas", max_bytes=3000)
+    for i in range(10):
+        cache.guardar(f"k{i}", b"x" * 1000)
+    assert sum(p.stat().st_size for p in (tmp_path / "etapas").glob("*.pkl")) <= 3000
+    assert cache.cargar("k9") == b"x" * 1000
+    assert cache.cargar("k0") is None
+
+
+def test_escritura_fallida_no_deja_tmp(tmp_path, monkeypatch):
+    def falla(*_):
+        raise OSError("disco lleno")
+
+    lru = CacheLRU(tmp_path / "programa_canon.json", "firma")
+    lru.put("a", "A")
+    etapas = CacheEtapas(tmp_path / "etapas", max_bytes=3000)
+    monkeypatch.setattr("semillero_tool.cache.os.replace", falla)
+    lru.guardar()
+    etapas.guardar("k", b"x")
+    assert [p.name for p in tmp_path.rglob("*.tmp")] == []
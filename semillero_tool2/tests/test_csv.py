@@ -0,0 +1,65 @@
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.io_csv import LectorCsv, detectar_dialecto
+from semillero_tool.pipeline import run, run_por_bloques
+
+
+def test_dialecto_y_dtypes_sin_inferencia(tmp_path):
+    header = ["ID", "Programa", "Fecha"] + list(FU_COLS)
+    filas = [["00123", "Psicología", "12/03/2026"] + ["1,5"] * len(FU_COLS),
+             ["", "Derecho", ""] + ["7"] * len(FU_COLS)]
+    path = tmp_path / "export.csv"
+    path.write_bytes("\n".join(";".join(f) for f in [header] + filas).encode("cp1252"))
+
+    assert (detectar_dialecto(path).encoding, detectar_dialecto(path).delimitador) == ("cp1252", ";")
+    with LectorCsv(path) as lector:
+        df = lector.leer()
+    assert df["ID"].tolist()[0] == "00123"
+    assert df["Programa"].tolist()[0] == "Psicología"
+    # "1,5" no es número: F..U llegan como texto y cast_fu_numeric las reporta.
+    assert df[FU_COLS[0]].tolist() == ["1,5", "7"]
+
+
+def test_csv_en_memoria_y_por_bloques_iguales(tmp_path, cfg):
+    header = ["ID", "Programa", "Fecha"] + list(FU_COLS)
+    filas = [[f"{i:05d}", "Derecho", "2026-01-02"] + [str(i * 0.1 + 3)] * len(FU_COLS) for i in range(25)]
+    filas[7][3] = "sin dato"
+    path = tmp_path / "intake.tsv"
+    path.write_text("\n".join("\t".join(f) for f in [header] + filas), encoding="utf-8-sig")
+
+    df = run(cfg(path, tmp_path / "mem", strict_schema=True, formato_salida="csv"))
+    run_por_bloques(cfg(path, tmp_path / "bloques", strict_schema=True, formato_salida="csv", filas_por_bloque=4))
+
+    assert df["ID"].iloc[0] == "00000"
+    assert df[FU_COLS[1]].dtype == "float64"
+    assert df[FU_COLS[1]].iloc[3] == 3 + 3 * 0.1  # mismo float que escribió Python
+    for hoja in ("DATA", "REPORTE_FU_CAST"):
+        assert (tmp_path / "mem" / f"{hoja}.csv").read_bytes() == (tmp_path / "bloques" / f"{hoja}.csv").read_bytes()
+    rep = pd.read_csv(tmp_path / "mem" / "REPORTE_FU_CAST.csv").set_index("COLUMNA")
+    assert rep.loc[FU_COLS[0], "COERCIONES_A_NA"] == 1
+
+
+def test_csv_y_excel_mismo_cast_de_fu(tmp_path, cfg):
+    from openpyxl import Workbook
+
+    header = ["ID", "Programa", "Fecha"] + list(FU_COLS)
+    # F..U como texto en los dos formatos (hay celdas no numéricas)
+    filas = [[str(i), "Derecho", "2026-01-02", str(9007199254740993 + i), ["1_000", "١٢", "7"][i % 3]]
+             + [i * 0.1 + 3] * (len(FU_COLS) - 2) for i in range(9)]
+    csv = tmp_path / "intake.csv"
+    csv.write_text("\n".join(",".join(map(str, f)) for f in [header] + filas), encoding="utf-8")
+    wb = Workbook()
+    for f in [header] + filas:
+        wb.active.append(f)
+    wb.save(tmp_path / "intake.xlsx")
+
+    df = run(cfg(csv, tmp_path / "csv", strict_schema=True, formato_salida="csv"))
+    df_xlsx = run(cfg(tmp_path / "intake.xlsx", tmp_path / "xlsx", strict_schema=True, formato_salida="csv"))
+
+    assert df[FU_COLS[0]].iloc[0] == 9007199254740993
+    pd.testing.assert_frame_equal(df[list(FU_COLS)], df_xlsx[list(FU_COLS)])
+    for hoja in ("DATA", "REPORTE_FU_CAST"):
+        assert (tmp_path / "csv" / f"{hoja}.csv").read_bytes() == (tmp_path / "xlsx" / f"{hoja}.csv").read_bytes()
+    rep = pd.read_csv(tmp_path / "csv" / "REPORTE_FU_CAST.csv").set_index("COLUMNA")
+    assert rep.loc[FU_COLS[1], "COERCIONES_A_NA"] == 6
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.dedup import DeduplicadorIds, IndiceIds
+from semillero_tool.pipeline import run
+
+
+def _df(filas):
+    """filas: (ID, FECHA, n de F..U presentes)."""
+    df = pd.DataFrame({"ID": pd.Series([f[0] for f in filas], dtype="str"), "FECHA": [f[1] for f in filas]})
+    for i, c in enumerate(FU_COLS):
+        df[c] = [1.0 if i < f[2] else np.nan for f in filas]
+    return df
+
+
+def test_politicas_en_el_archivo():
+    df = _df([
+        ("00123", "01/02/2026", 3),
+        ("456", "05/02/2026", 16),
+        ("123", "10/02/2026", 2),      # misma persona que "00123"
+        (" 1.23 ", None, 16),          # y que "123" (sin puntos / espacios)
+        (None, None, 0),
+        (None, None, 0),               # IDs vacíos: nunca duplicados
+    ])
+    quedan = {pol: DeduplicadorIds(pol).aplicar(df)[0].index.tolist() for pol in ("ultima_fecha", "mas_fu", "primero")}
+    assert quedan == {"ultima_fecha": [1, 2, 4, 5], "mas_fu": [1, 3, 4, 5], "primero": [0, 1, 4, 5]}
+
+    _, rep = DeduplicadorIds("ultima_fecha").aplicar(df)
+    assert rep["FILA"].tolist() == [0, 3]
+    assert rep["FILA_CONSERVADA"].tolist() == [2, 2]
+    assert set(rep["MOTIVO"]) == {"repetido_en_archivo"}
+
+
+def test_indice_entre_cohortes_idempotente(tmp_path, cfg):
+    header = ["NROIDENTI", "Fecha"] + list(FU_COLS)
+    cohortes = {
+        "2025-2.csv": [["111", "2025-08-01"], ["222", "2025-08-01"]],
+        "2026-1.csv": [["111", "2026-02-01"], ["222", "2025-01-01"], ["333", "2026-02-01"]],
+    }
+    for nombre, filas in cohortes.items():
+        (tmp_path / nombre).write_text(
+            "\n".join(",".join(f) for f in [header] + [f + ["1"] * len(FU_COLS) for f in filas]), encoding="utf-8"
+        )
+
+    def correr(nombre):
+        salida = tmp_path / nombre.replace(".csv", "")
+        df = run(cfg(tmp_path / nombre, salida, formato_salida="csv",
+                     dedup_ids="ultima_fecha", indice_ids=tmp_path / "indice"))
+        return df, pd.read_csv(salida / "REPORTE_IDS_DUPLICADOS.csv", dtype=str)
+
+    correr("2025-2.csv")
+    for _ in range(2):  # reprocesar la cohorte no la compara consigo misma
+        df, rep = correr("2026-1.csv")
+        assert df["NROIDENTI"].tolist() == ["111", "333"]
+        assert rep[["ID", "DECISION", "MOTIVO", "COHORTE_PREVIA"]].values.tolist() == [
+            ["111", "conservada", "reemplaza_cohorte_previa", "2025-2.csv"],
+            ["222", "descartada", "en_cohorte_previa", "2025-2.csv"],
+        ]
+    assert IndiceIds(tmp_path / "indice").cohortes() == ["2025-2.csv", "2026-1.csv"]
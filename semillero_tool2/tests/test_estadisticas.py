@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.estadisticas import central_general, central_por_programa
+from semillero_tool.pipeline import run
+
+
+def _df(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.integers(0, 100, (n, len(FU_COLS))).astype(float), columns=FU_COLS)
+    df = df.mask(rng.random(df.shape) < 0.2)
+    df["PROGRAMA_CANON"] = rng.choice(np.array(["Derecho", "Psicología", "Teología", None], dtype=object), n)
+    return df
+
+
+def test_estadisticas_igual_a_pandas():
+    df = _df()
+    df.loc[df["PROGRAMA_CANON"] == "Teología", "V"] = np.nan  # grupo sin valores en una variable
+
+    x = central_por_programa(df).set_index(["PROGRAMA", "VARIABLE"])
+    g = df.groupby("PROGRAMA_CANON")[FU_COLS]
+    for col, ref in [("N", g.count()), ("MEDIA", g.mean()), ("DESV_EST", g.std()), ("MIN", g.min()),
+                     ("P25", g.quantile(0.25)), ("MEDIANA", g.median()), ("P75", g.quantile(0.75)), ("MAX", g.max())]:
+        esperado = ref.stack(future_stack=True)
+        np.testing.assert_allclose(x[col].to_numpy(float), esperado.to_numpy(float), rtol=1e-12, equal_nan=True)
+    assert x.loc[("Teología", "V"), "N"] == 0
+
+    gen = central_general(df).set_index("VARIABLE")
+    np.testing.assert_allclose(gen["MEDIANA"].to_numpy(float), df[FU_COLS].median().to_numpy())
+    assert gen["N"].tolist() == df[FU_COLS].count().tolist()
+
+
+def test_pipeline_escribe_general_y_x_programa(tmp_path, cfg):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["ID", "Programa", "Fecha"] + list(FU_COLS))
+    for i in range(6):
+        ws.append([i, ["Derecho", "psicologia"][i % 2], "2026-01-02"] + [i * 10] * len(FU_COLS))
+    wb.save(tmp_path / "in.xlsx")
+
+    salida = tmp_path / "out.xlsx"
+    run(cfg(tmp_path / "in.xlsx", salida, canonizar_programa=True, estadisticas=True))
+
+    general = pd.read_excel(salida, sheet_name="GENERAL")
+    por_programa = pd.read_excel(salida, sheet_name="X_PROGRAMA")
+    assert general.loc[0, "MEDIANA"] == 25 and general.loc[0, "N"] == 6
+    assert list(por_programa["PROGRAMA"].unique()) == ["Derecho", "Psicología"]
+    assert por_programa.set_index(["PROGRAMA", "VARIABLE"]).loc[("Derecho", "V"), "MEDIA"] == 20
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from semillero_tool.columns import normalizar_columnas_suffix
+from semillero_tool.config import FU_COLS
+from semillero_tool.dates import normalizar_fechas_iso
+from semillero_tool.drop import aplicar_drop_missing
+from semillero_tool.fu import cast_fu_numeric, drop_fu_missing, separar_fu
+from semillero_tool.pipeline import run
+from semillero_tool.programa import canonizar_programa
+from semillero_tool.text_clean import asegurar_ids_como_texto, limpiar_texto
+
+
+def _sucio() -> pd.DataFrame:
+    df = pd.DataFrame({
+        "ID": [123456789.0, " 00123 ", None, "nan"],
+        "Programa ": [" Ing. Sistemas", "psicologia", None, "xyz"],
+        "FECHA": ["12/03/2026", "2026-01-02", None, "basura"],
+    })
+    for i, c in enumerate(FU_COLS):
+        df[c] = pd.Series([str(i), " 7 ", None, "x"], dtype=object) if i % 2 else [1.0, np.nan, np.nan, 3.0]
+    return df
+
+
+def _normalizado() -> pd.DataFrame:
+    df, _ = normalizar_columnas_suffix(_sucio())
+    df, _ = cast_fu_numeric(df)
+    return df
+
+
+# Cada etapa pública con copiar=: (función sobre df, df de entrada).
+ETAPAS = {
+    "normalizar_columnas_suffix": (normalizar_columnas_suffix, _sucio),
+    "limpiar_texto": (limpiar_texto, _sucio),
+    "asegurar_ids_como_texto": (asegurar_ids_como_texto, _normalizado),
+    "cast_fu_numeric": (cast_fu_numeric, _normalizado),
+    "canonizar_programa": (canonizar_programa, _normalizado),
+    "drop_fu_missing": (lambda df: drop_fu_missing(df, "threshold", 10), _normalizado),
+    "separar_fu": (lambda df: separar_fu(df, "all"), _normalizado),
+    "aplicar_drop_missing": (lambda df: aplicar_drop_missing(df, "any", ["PROGRAMA"]), _normalizado),
+    "normalizar_fechas_iso": (normalizar_fechas_iso, _normalizado),
+}
+
+
+@pytest.mark.parametrize("nombre", list(ETAPAS))
+def test_etapas_no_mutan_la_entrada_por_default(nombre):
+    etapa, entrada = ETAPAS[nombre]
+    df = entrada()
+    antes = df.copy(deep=True)
+    etapa(df)
+    pd.testing.assert_frame_equal(df, antes)
+
+
+def test_run_igual_con_y_sin_copia_de_etapas(tmp_path, cfg):
+    header = ["ID", "Programa", "Fecha", "Observaciones"] + list(FU_COLS)
+    filas = [
+        ["00123", " Ing. Sistemas ", "12/03/2026", " texto "] + ["50"] * len(FU_COLS),
+        ["123456789.0", "psicologia", "2026-01-02", "nan"] + ["x"] + ["7"] * (len(FU_COLS) - 1),
+        ["", "", "", ""] + [""] * len(FU_COLS),
+        ["00123", "xyz", "basura", ""] + ["150"] * 4 + [""] * (len(FU_COLS) - 4),
+    ]
+    path = tmp_path / "intake.csv"
+    path.write_text("\n".join(",".join(f) for f in [header] + filas), encoding="utf-8")
+
+    salidas = {}
+    for copiar in (True, False):
+        salida = tmp_path / f"copiar_{copiar}"
+        run(cfg(
+            path, salida,
+            strict_schema=True, fu_validate=True, fu_drop_mode="threshold", min_non_missing_fu=4,
+            canonizar_programa=True, reemplazar_programa=True,
+            drop_missing_mode="any", critical_cols_csv="PROGRAMA", formato_salida="csv",
+            usar_cache=False, copiar_etapas=copiar, estadisticas=True, dedup_ids="ultima_fecha",
+        ))
+        salidas[copiar] = {p.name: p.read_bytes() for p in sorted(salida.iterdir())}
+    assert salidas[True] == salidas[False]
@@ -0,0 +1,32 @@
+import datetime as dt
+
+import pandas as pd
+
+from semillero_tool.dates import combinar_reportes_fechas, normalizar_fechas_iso
+
+
+def test_fechas_dia_primero_seriales_y_conteo_por_formato():
+    valores = [
+        "02/01/2026", "13/01/2026", " 2026-03-04 ", dt.datetime(2026, 1, 5, 15, 30),
+        46023, "46023", 2026, "now", "x", None, "2026-03-12 10:00:00",
+    ]
+    df = pd.DataFrame({"FECHA": pd.Series(valores, dtype=object)})
+    out, rep = normalizar_fechas_iso(df)
+
+    # día primero; seriales de Excel (número o texto); 2026 suelto fuera de rango -> NA
+    assert out["FECHA"].astype(object).where(out["FECHA"].notna(), None).tolist() == [
+        "2026-01-02", "2026-01-13", "2026-03-04", "2026-01-05", "2026-01-01", "2026-01-01",
+        None, None, None, None, "2026-03-12",
+    ]
+
+    r = rep.iloc[0]
+    assert (r["N_DD/MM/AAAA"], r["N_AAAA-MM-DD"], r["N_SERIAL_EXCEL"], r["N_FECHA_EXCEL"]) == (2, 1, 2, 1)
+    assert r["N_AAAA-MM-DD HH:MM:SS"] == 1
+    reglas = [c for c in rep.columns if c.startswith("N_") and c not in ("N_TOTAL", "N_PARSE_OK", "N_PARSE_NA")]
+    assert rep[reglas].sum(axis=1).iloc[0] == r["N_PARSE_OK"] == 7
+
+    # por bloques: mismos valores, mismo reporte sumado
+    a, rep_a = normalizar_fechas_iso(df.iloc[:5])
+    b, rep_b = normalizar_fechas_iso(df.iloc[5:])
+    assert pd.concat([a, b])["FECHA"].equals(out["FECHA"])
+    pd.testing.assert_frame_equal(combinar_reportes_fechas([rep_a, rep_b]), rep)
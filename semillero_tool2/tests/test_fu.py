@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.fu import MatrizFU, audit_fu_missing, audit_fu_rangos, drop_fu_missing, separar_fu
+
+
+def _fu(filas):
+    return pd.DataFrame(filas, columns=FU_COLS)
+
+
+def test_matriz_fu_drop_auditoria_y_rangos():
+    completa = [50.0] * len(FU_COLS)
+    fuera = [150.0, -1.0] + [50.0] * (len(FU_COLS) - 2)          # V y E fuera de 0..100
+    vacia = [np.nan] * len(FU_COLS)
+    casi = [np.nan] * 4 + [10.0] * (len(FU_COLS) - 4)
+    df = _fu([completa, fuera, vacia, casi])
+
+    matriz = MatrizFU.desde_df(df)
+    na, resumen = audit_fu_missing(df, matriz)
+    assert resumen.loc[0, "N_COMPLETAS_FU"] == 2
+    assert na.set_index("COLUMNA").loc["V", "N_NA"] == 2
+
+    kept, dropped, post = separar_fu(df, "threshold", 12, copiar=False, matriz=matriz)
+    assert list(kept.index) == [0, 1, 3] and list(dropped.index) == [2]
+    assert dropped["_FU_NON_MISSING"].tolist() == [0]
+    assert len(post) == 3 and audit_fu_missing(kept, post)[1].equals(audit_fu_missing(kept)[1])
+
+    # misma salida que sin matriz
+    k2, d2 = drop_fu_missing(df, "threshold", 12)
+    pd.testing.assert_frame_equal(kept, k2)
+    pd.testing.assert_frame_equal(dropped, d2)
+
+    rangos = audit_fu_rangos(kept, post).set_index("COLUMNA")
+    assert rangos.loc["V", "N_FUERA_RANGO"] == 1 and rangos.loc["E", "N_FUERA_RANGO"] == 1
+    assert rangos.loc["V", "N_VALIDOS"] == 2 and rangos.loc["V", "PCT_FUERA_RANGO"] == 0.5
+    assert rangos["N_FUERA_RANGO"].sum() == 2
+
+
+def test_cast_fu_numeric_texto_igual_que_to_numeric():
+    from semillero_tool.fu import cast_fu_numeric
+
+    grande, muy_grande = "9007199254740993", "12345678901234567890"  # > 2**53, > 2**63
+    for dtype in (object, "str", "string"):
+        df = pd.DataFrame({c: ["1", "2", "3"] for c in FU_COLS}, dtype=dtype)
+        df[FU_COLS[0]] = pd.Series([grande, "1", "2"], dtype=dtype)
+        df[FU_COLS[1]] = pd.Series([muy_grande, "1", "2"], dtype=dtype)
+        df[FU_COLS[2]] = pd.Series(["1_000", "١٢", "3.9290000000000003"], dtype=dtype)
+
+        out, rep = cast_fu_numeric(df)
+        # enteros: lo que da to_numeric, sin pasar por float
+        assert out[FU_COLS[0]].tolist() == [int(grande), 1, 2]
+        assert out[FU_COLS[1]].tolist() == [int(muy_grande), 1, 2]
+        # to_numeric rechaza "1_000" y dígitos no ASCII: cuentan como coerciones
+        assert out[FU_COLS[2]].isna().tolist() == [True, True, False]
+        assert out[FU_COLS[2]].iloc[2] == 3.9290000000000003  # redondeo correcto
+        assert rep.set_index("COLUMNA").loc[FU_COLS[2], "COERCIONES_A_NA"] == 2
@@ -0,0 +1,48 @@
+import pytest
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.historial import archivos_consulta, cohortes, consultar
+from semillero_tool.pipeline import run, run_por_bloques
+
+pytest.importorskip("pyarrow")
+
+
+def _intake(path, filas):
+    header = ["ID", "Programa", "Fecha"] + list(FU_COLS)
+    path.write_text("\n".join(",".join(f) for f in [header] + [f + ["1"] * len(FU_COLS) for f in filas]),
+                    encoding="utf-8")
+    return path
+
+
+def test_agregar_es_idempotente_y_consulta_poda(tmp_path, cfg):
+    h = tmp_path / "historial"
+    a = _intake(tmp_path / "2025-2.csv", [["1", "Derecho", "2025-08-01"], ["2", "Psicologia", "2025-09-15"]])
+    b = _intake(tmp_path / "2026-1.csv", [["3", "Derecho", "2026-02-01"], ["4", "Derecho", ""]])
+
+    for _ in range(2):  # mismo input -> reemplaza su cohorte
+        run(cfg(a, tmp_path / "oa", formato_salida="csv", historial=h))
+    run(cfg(b, tmp_path / "ob", formato_salida="csv", historial=h))
+    assert sorted(cohortes(h)[["ORIGEN", "FILAS"]].values.tolist()) == [["2025-2.csv", 2], ["2026-1.csv", 2]]
+    assert len(consultar(h)) == 4
+    # Las partes de la primera versión de 2025-2 ya no están: 2025-2, 2026-1, sin_fecha.
+    assert len(list(h.glob("PERIODO=*/*.parquet"))) == 3
+
+    q = consultar(h, programas=["Derecho"], desde="2025-07-01", hasta="2026-06-30", columnas=["ID", "FECHA"])
+    assert sorted(q["ID"]) == ["1", "3"]
+    assert list(q.columns) == ["ID", "FECHA"]
+    # Solo se abren las partes de Derecho con FECHA en el rango.
+    assert {p.parent.name for p in archivos_consulta(h, ["Derecho"], "2026-01-01")} == {"PERIODO=2026-1"}
+
+
+def test_por_bloques_guarda_lo_mismo_que_en_memoria(tmp_path, cfg):
+    filas = [[str(i), ("Derecho", "Psicologia")[i % 2], f"202{5 + i % 2}-0{1 + i % 9}-10"] for i in range(30)]
+    path = _intake(tmp_path / "intake.csv", filas)
+
+    run(cfg(path, tmp_path / "mem", formato_salida="csv", historial=tmp_path / "h_mem"))
+    run_por_bloques(cfg(path, tmp_path / "blq", formato_salida="csv", historial=tmp_path / "h_blq",
+                        filas_por_bloque=7))
+
+    mem = consultar(tmp_path / "h_mem").sort_values("ID", ignore_index=True)
+    blq = consultar(tmp_path / "h_blq").sort_values("ID", ignore_index=True)
+    assert mem.equals(blq)
+    assert cohortes(tmp_path / "h_mem")["CLAVE"].tolist() == cohortes(tmp_path / "h_blq")["CLAVE"].tolist()
@@ -17,3 +17,24 @@ def test_ids_float_and_string_dot0_become_plain_int_string():
     # opcional: el reporte existe y menciona ID
     assert "COLUMNA" in rep.columns
     assert "ID" in set(rep["COLUMNA"])
+
+
+def test_ids_caminos_por_dtype_mismo_texto_y_conteos():
+    df = pd.DataFrame({
+        "ID": [1040039503.0, float("nan"), 1.5, 1e16, -0.0],     # float64
+        "ID_INT": [1, 22, 333, 4444, 55555],                      # int64
+        "ID_TXT": pd.Series([" 7.0 ", None, "8.00", "a.0.0", "9"], dtype="str"),
+    })
+
+    out, rep = asegurar_ids_como_texto(df)
+
+    assert out["ID"].tolist()[2:] == ["1.5", "1e+16", "-0"]
+    assert out.loc[0, "ID"] == "1040039503" and pd.isna(out.loc[1, "ID"])
+    assert out["ID_INT"].tolist() == ["1", "22", "333", "4444", "55555"]
+    assert out["ID_TXT"].dtype == "str"
+    assert out["ID_TXT"].tolist()[2:] == ["8.00", "a.0", "9"] and out.loc[0, "ID_TXT"] == "7"
+
+    conteos = rep.set_index("COLUMNA")[["N_CAMBIOS_TOTAL", "N_DOT0_FIX"]].to_dict("index")
+    assert conteos["ID"] == {"N_CAMBIOS_TOTAL": 2, "N_DOT0_FIX": 2}
+    assert conteos["ID_INT"] == {"N_CAMBIOS_TOTAL": 0, "N_DOT0_FIX": 0}
+    assert conteos["ID_TXT"] == {"N_CAMBIOS_TOTAL": 2, "N_DOT0_FIX": 2}
@@ -0,0 +1,43 @@
+import pandas as pd
+from openpyxl import Workbook
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.pipeline import run
+
+
+def _hoja(wb, nombre, header, n, programa):
+    ws = wb.create_sheet(nombre)
+    ws.append(header)
+    for i in range(n):
+        fila = {"ID": i, "Programa": programa, "programa": programa, "Fecha": "2026-01-02"}
+        ws.append([fila.get(c, 10) for c in header])
+
+
+def test_hojas_y_libros_se_unen_con_procedencia(tmp_path, cfg):
+    header = ["ID", "Programa", "Fecha"] + list(FU_COLS)
+    wb = Workbook()
+    wb.remove(wb.active)
+    _hoja(wb, "Ing", header, 3, "Ing. Sistemas")
+    _hoja(wb, "Der", ["programa", "ID"] + list(FU_COLS) + ["Fecha"], 2, "Derecho")  # otro orden y casing
+    _hoja(wb, "Mala", header[:-1] + ["OTRA"], 4, "Derecho")                         # otro header
+    wb.save(tmp_path / "a.xlsx")
+    wb = Workbook()
+    wb.remove(wb.active)
+    _hoja(wb, "Ing", header, 1, "Psicología")
+    wb.save(tmp_path / "b.xlsx")
+
+    df = run(cfg(
+        tmp_path / "a.xlsx", tmp_path / "out.xlsx", strict_schema=True, canonizar_programa=True,
+        hojas=("*",), libros_extra=(tmp_path / "b.xlsx",), workers_lectura=2,
+    ))
+
+    assert len(df) == 6
+    assert df.groupby(["SOURCE_FILE", "SHEET"]).size().to_dict() == {
+        ("a.xlsx", "Der"): 2, ("a.xlsx", "Ing"): 3, ("b.xlsx", "Ing"): 1,
+    }
+    assert df.loc[df["SHEET"] == "Der", "PROGRAMA_CANON"].eq("Derecho").all()
+
+    rep = pd.read_excel(tmp_path / "out.xlsx", sheet_name="REPORTE_HOJAS").set_index(["SOURCE_FILE", "SHEET"])
+    assert rep["ESTADO"].tolist() == ["ok", "ok", "header_distinto", "ok"]
+    assert rep.loc[("a.xlsx", "Mala"), "FALTANTES"] == "ANSIEDAD_A_LA_EVALUACION"
+    assert rep.loc[("a.xlsx", "Mala"), "SOBRANTES"] == "OTRA"
@@ -0,0 +1,97 @@
+import datetime as dt
+
+import pandas as pd
+import pytest
+
+from semillero_tool.errors import ExcelReadError
+from semillero_tool import io_excel
+from semillero_tool.io_excel import LectorExcelStreaming, leer_excel
+
+
+def _libro_sucio(path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Hoja1"
+    # header con vacíos, duplicados y un número; filas vacías, irregulares y errores
+    ws.append(["ID", "Programa", None, "Programa", "Fecha", 2024, "F", "G", "Bool", "Err"])
+    ws.append([1.0, " Ing ", "x", "a", dt.datetime(2026, 1, 2), 1.5, "3", None, True, "#N/A"])
+    ws.append([])
+    ws.append([2.0, "NA", None, "", "2026-01-03", 2, "4", "", False, "#DIV/0!"])
+    ws.append([3.5, "nan", None, None, None, None, "x", None, None, "ok", "extra"])
+    for i in range(25):
+        ws.append([float(i), f"p{i % 3}", None, None, None, i / 2, str(i)])
+    ws.append([None] * 5)
+    ws.append([])
+    wb.create_sheet("Otra").append(["A"])
+    wb.save(path)
+
+
+def test_streaming_igual_a_pandas(tmp_path):
+    path = tmp_path / "sucio.xlsx"
+    _libro_sucio(path)
+
+    esperado = leer_excel(path, None)
+    # bloques/grupos chicos para cruzar fronteras de bloque
+    with LectorExcelStreaming(path, None, filas_por_bloque=4, columnas_por_grupo=3) as lector:
+        encabezado = lector.encabezado()
+        df = lector.leer()
+
+    pd.testing.assert_frame_equal(df, esperado)
+    # el header no ve la columna extra que solo aparece en datos
+    assert encabezado == list(esperado.columns)[:10]
+
+
+def test_streaming_hoja_inexistente(tmp_path):
+    path = tmp_path / "sucio.xlsx"
+    _libro_sucio(path)
+
+    with pytest.raises(ExcelReadError):
+        LectorExcelStreaming(path, "NoExiste")
+    with pytest.raises(ExcelReadError):
+        LectorExcelStreaming(tmp_path / "no_existe.xlsx", None)
+
+
+def test_leer_bloques_dtype_global(tmp_path):
+    path = tmp_path / "sucio.xlsx"
+    _libro_sucio(path)
+
+    esperado = leer_excel(path, None)
+    with LectorExcelStreaming(path, None, filas_por_bloque=4, columnas_por_grupo=3) as lector:
+        bloques = list(lector.leer_bloques())
+
+    assert all(len(b) <= 4 for b in bloques)
+    df = pd.concat(bloques)
+    pd.testing.assert_frame_equal(df, esperado)
+    # mismo dtype en cada bloque, aunque el bloque solo tenga NA o números
+    for b in bloques:
+        assert list(b.dtypes) == list(esperado.dtypes)
+
+
+def test_leer_bloques_unifica_iguales_sin_memo_por_valor(tmp_path, monkeypatch):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["ID", "MIXTA"])
+    # ID object con muchos valores distintos; MIXTA: True antes que 1, 0 antes que False, en bloques distintos
+    for i in range(60):
+        ws.append([i if i % 7 else f"x{i}", [True, "a", 1, 0, False][(i // 12) % 5]])
+    path = tmp_path / "mixto.xlsx"
+    wb.save(path)
+
+    memos = []
+    original = io_excel._memo_iguales
+
+    def espiar(infos):
+        memos.append(original(infos))
+        return memos[-1]
+
+    monkeypatch.setattr(io_excel, "_memo_iguales", espiar)
+    with LectorExcelStreaming(path, None, filas_por_bloque=5) as lector:
+        df = pd.concat(list(lector.leer_bloques()))
+    pd.testing.assert_frame_equal(df, leer_excel(path, None))
+    assert [type(v) for v in df["MIXTA"].iloc[::12]] == [bool, str, bool, int, int]
+    # Solo las claves que mezclan tipos (0 / 1 de MIXTA), nunca los IDs distintos.
+    assert sorted(memos, key=len) == [{}, {0: 0, 1: True}]
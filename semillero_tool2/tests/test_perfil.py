@@ -0,0 +1,33 @@
+import json
+
+import pandas as pd
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.perfil import COLUMNAS_PERFORMANCE
+from semillero_tool.pipeline import run
+
+
+def test_perfil_etapas_hoja_y_json(tmp_path, cfg):
+    from openpyxl import Workbook
+
+    entrada = tmp_path / "in.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["ID", "Programa", "Fecha"] + list(FU_COLS))
+    for i in range(10):
+        ws.append([i, "Derecho", "2026-01-02"] + [None if i < 3 else 1] * len(FU_COLS))
+    wb.save(entrada)
+
+    config = cfg(entrada, tmp_path / "out.xlsx", fu_validate=True, fu_drop_mode="all", usar_cache=False,
+                 perfil="etapas")
+    run(config)
+
+    hoja = pd.read_excel(config.output_path, sheet_name="REPORTE_PERFORMANCE")
+    assert list(hoja.columns) == COLUMNAS_PERFORMANCE
+    assert list(hoja["ETAPA"]) == ["lectura", "base", "programa", "fu", "drop_general", "fechas"]
+    fu = hoja.set_index("ETAPA").loc["fu"]
+    assert (fu["FILAS_ENTRADA"], fu["FILAS_SALIDA"]) == (10, 7)
+
+    perfil = json.loads((tmp_path / "out_PERFIL.json").read_text(encoding="utf-8"))
+    assert perfil["etapas"][-1]["etapa"] == "escritura"
+    assert all(e["segundos"] >= 0 for e in perfil["etapas"])
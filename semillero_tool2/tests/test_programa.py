@@ -15,3 +15,127 @@ def test_programa_sistemas_variants_canonize():
     # opcional: si tu decisión metodológica es "cerrado", rep debería estar vacío
     # porque todo quedó canon
     # assert len(rep) == 0
+
+
+def test_programa_cache_persistente_reusa_y_se_invalida_con_reglas(tmp_path):
+    from semillero_tool.cache import CacheLRU
+    from semillero_tool.programa import FIRMA_REGLAS, abrir_cache_programa
+
+    df = pd.DataFrame({"PROGRAMA": ["Ing. Sistema", "xyz", None, "Ing. Sistema"]})
+    path = tmp_path / "programa_canon.json"
+
+    cache = abrir_cache_programa(path)
+    out1, rep1 = canonizar_programa(df, cache=cache)
+    cache.guardar()
+
+    # Nueva "corrida": la caché se carga desde disco y da el mismo output
+    cache2 = abrir_cache_programa(path)
+    assert "Ing. Sistema" in cache2 and "xyz" in cache2
+    out2, rep2 = canonizar_programa(df, cache=cache2)
+    pd.testing.assert_frame_equal(out1, out2)
+    pd.testing.assert_frame_equal(rep1, rep2)
+
+    # Otra firma de reglas -> caché descartada
+    assert len(CacheLRU(path, FIRMA_REGLAS + "x")) == 0
+
+
+def test_indice_token_rules_respeta_prioridad_de_la_tabla():
+    import itertools
+
+    from semillero_tool.programa import TOKEN_RULES, IndiceReglasToken
+
+    idx = IndiceReglasToken(TOKEN_RULES)
+    assert idx.buscar({"lic", "lenguas", "extranjeras"}) == "Lic. Lenguas Extranjeras"
+    assert idx.buscar({"lic", "lenguas"}) == "Lic. Lenguas"
+    assert idx.buscar({"xyz"}) is None
+
+    def lineal(toks):
+        return next((etq for req, etq in TOKEN_RULES if req.issubset(toks)), None)
+
+    vocab = sorted(set().union(*(req for req, _ in TOKEN_RULES)) | {"xyz"})
+    for k in (1, 2, 3):
+        for combo in itertools.combinations(vocab, k):
+            assert idx.buscar(set(combo)) == lineal(set(combo)), combo
+
+
+def test_fuzzy_indice_igual_a_fuerza_bruta():
+    from difflib import SequenceMatcher
+
+    from semillero_tool.programa import LABELS_CANON, fuzzy_best_label, forma_base
+
+    def bruta(base, min_ratio=0.90):
+        best, best_r = None, 0.0
+        for lab in LABELS_CANON:
+            r = SequenceMatcher(None, base, forma_base(lab)).ratio()
+            if r > best_r:
+                best, best_r = lab, r
+        return best if best is not None and best_r >= min_ratio else None
+
+    casos = ["psicologa", "derech", "zootecnai", "agronomi", "enfermera", "contaduri publica",
+             "teologia virtul", "medicina", "", "x", "comunicacion socia", "nutricion dietetica"]
+    for s in casos:
+        for ratio in (0.90, 0.6, 0.0):
+            assert fuzzy_best_label(s, min_ratio=ratio) == bruta(s, ratio), (s, ratio)
+
+
+def test_fuzzy_matcher_igual_a_difflib():
+    # IndiceFuzzy._matcher escribe internos de difflib (b2j, bjunk, bpopular)
+    from difflib import SequenceMatcher
+
+    from semillero_tool.programa import IndiceFuzzy
+
+    for b in ["psicologia", "ingenieria de sistemas", "a" * 300, ""]:
+        ref = SequenceMatcher(None, "", b)
+        assert all(hasattr(ref, x) for x in ("b2j", "bjunk", "bpopular")), "cambió la API interna de difflib"
+        lado_b = (b, ref.b2j, ref.bjunk, ref.bpopular)
+        for a in ["psicologa", "ingenieria sistemas", "a" * 250 + "b", "", "zzz"]:
+            sm = IndiceFuzzy._matcher(a, lado_b)
+            esperado = SequenceMatcher(None, a, b)
+            assert sm.get_matching_blocks() == esperado.get_matching_blocks(), (a, b)
+            assert sm.ratio() == esperado.ratio(), (a, b)
+
+
+def test_modelo_compilado_se_guarda_y_se_invalida_con_reglas(tmp_path):
+    from semillero_tool.config import PROGRAMA_ABREVIATURAS, PROGRAMA_LABELS_CANON
+    from semillero_tool.programa import FIRMA_REGLAS, ModeloCanon, compilar_modelo, resolver_programa
+
+    modelo = compilar_modelo()
+    assert modelo.firma == FIRMA_REGLAS
+    assert ("administación", "administracion") not in modelo.typos  # nunca matchea tras unidecode
+
+    path = tmp_path / "programa_modelo.pkl"
+    modelo.guardar(path)
+    cargado = ModeloCanon.cargar(path, FIRMA_REGLAS)
+    for raw in ["inge.sistemas", "Administación", "enfemeria", "xyz"]:
+        assert cargado.resolver(raw) == resolver_programa(raw)
+
+    # Otras tablas (p.ej. las de config.py) -> otra firma: el archivo no sirve
+    otro = compilar_modelo(labels=PROGRAMA_LABELS_CANON, abreviaturas=PROGRAMA_ABREVIATURAS)
+    assert ModeloCanon.cargar(path, otro.firma) is None
+    assert otro.resolver("adm. empresas")[1] == "Administración de Empresas"
+
+
+def test_fuzzy_del_modelo_compartido_entre_hilos():
+    from concurrent.futures import ThreadPoolExecutor
+    from difflib import SequenceMatcher
+
+    from semillero_tool.programa import fuzzy_best_label, modelo_canon
+
+    casos = ["psicologa", "derech", "zootecnai", "agronomi", "enfermera", "contaduri publica"] * 50
+    esperado = [fuzzy_best_label(s, min_ratio=0.6) for s in casos]
+    with ThreadPoolExecutor(4) as pool:
+        assert list(pool.map(lambda s: fuzzy_best_label(s, min_ratio=0.6), casos)) == esperado
+    # el modelo global solo guarda datos de b, nunca un matcher con estado
+    assert not any(isinstance(x, SequenceMatcher) for e in modelo_canon().fuzzy._entradas for x in e)
+
+
+def test_modelo_corrupto_se_ignora(tmp_path):
+    import pickle
+
+    from semillero_tool.programa import FIRMA_REGLAS, ModeloCanon
+
+    path = tmp_path / "programa_modelo.pkl"
+    for contenido in [b"", b"no es pickle", pickle.dumps(3), pickle.dumps((1, 2, 3))]:
+        path.write_bytes(contenido)
+        assert ModeloCanon.cargar(path, FIRMA_REGLAS) is None
+    assert ModeloCanon.cargar(tmp_path / "no_existe.pkl", FIRMA_REGLAS) is None
@@ -0,0 +1,61 @@
+import openpyxl
+import pandas as pd
+import pytest
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.errors import ConfigError
+from semillero_tool.pipeline import run, run_por_bloques
+
+
+# Drop general por columnas críticas: la proyección tiene que leerlas aunque nadie más las use.
+_DROP = dict(drop_missing_mode="any", critical_cols_csv="Programa,Sede", formato_salida="csv", usar_cache=False)
+
+
+def _escribir(tmp_path):
+    header = ["ID", "Observaciones", "Programa", "PROGRAMA ", "Sede", "Fecha", "Edad"] + list(FU_COLS)
+    filas = [
+        ["001", "texto largo", "Derecho", "x", "Norte", "2026-02-01", "19"],
+        ["002", "", "Psicologia", "", "", "2026-02-02", "20"],           # Sede vacía: drop general
+    ]
+    filas = [f + ["5"] * len(FU_COLS) for f in filas]
+    filas.append(["", "solo texto en columnas no usadas"] + [""] * (len(header) - 2))
+    wb = openpyxl.Workbook()
+    for f in [header] + filas:
+        wb.active.append([v if v != "" else None for v in f])
+    wb.save(tmp_path / "intake.xlsx")
+    (tmp_path / "intake.csv").write_text("\n".join(",".join(f) for f in [header] + filas), encoding="utf-8")
+
+
+@pytest.mark.parametrize("entrada,extra", [
+    ("intake.xlsx", {}),
+    ("intake.xlsx", {"lector_excel": "streaming"}),
+    ("intake.csv", {}),
+])
+def test_proyeccion_lee_solo_las_columnas_usadas(tmp_path, cfg, entrada, extra):
+    _escribir(tmp_path)
+    completo = run(cfg(tmp_path / entrada, tmp_path / "todo", **extra, **_DROP))
+    proyectado = run(cfg(tmp_path / entrada, tmp_path / "proy", solo_columnas_usadas=True, **extra, **_DROP))
+
+    # Variantes de PROGRAMA juntas (mismo sufijo __1), críticas incluidas, sin Observaciones / Edad.
+    assert list(proyectado.columns) == ["ID", "PROGRAMA", "PROGRAMA__1", "SEDE", "FECHA", *FU_COLS]
+    pd.testing.assert_frame_equal(proyectado, completo[list(proyectado.columns)])
+    # La fila con datos solo en columnas no leídas sigue siendo una fila (el drop general la saca).
+    dropeadas = [pd.read_csv(tmp_path / d / "REPORTE_DROP_GENERAL.csv") for d in ("todo", "proy")]
+    assert len(proyectado) == 1 and len(dropeadas[0]) == len(dropeadas[1]) == 2
+
+    conservado = run(cfg(tmp_path / entrada, tmp_path / "cons", solo_columnas_usadas=True,
+                         conservar_columnas=("edad",), **extra, **_DROP))
+    assert conservado["EDAD"].tolist() == completo["EDAD"].tolist()
+
+
+def test_proyeccion_por_bloques_y_config(tmp_path, cfg):
+    _escribir(tmp_path)
+    run_por_bloques(cfg(tmp_path / "intake.xlsx", tmp_path / "blq", solo_columnas_usadas=True, filas_por_bloque=1,
+                        **_DROP))
+    blq = pd.read_csv(tmp_path / "blq" / "DATA.csv", dtype=str)
+    mem = run(cfg(tmp_path / "intake.xlsx", tmp_path / "mem", solo_columnas_usadas=True, **_DROP))
+    assert list(blq.columns) == list(mem.columns)
+    assert blq["ID"].tolist() == mem["ID"].tolist()
+
+    with pytest.raises(ConfigError):
+        run(cfg(tmp_path / "intake.xlsx", tmp_path / "x", conservar_columnas=("EDAD",), **_DROP))
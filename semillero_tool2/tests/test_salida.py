@@ -0,0 +1,61 @@
+from dataclasses import replace
+
+import pandas as pd
+import pytest
+
+from semillero_tool.config import FU_COLS
+from semillero_tool.errors import ConfigError
+from semillero_tool.pipeline import run, run_por_bloques
+
+
+def _libro(path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["ID", "Programa", "Fecha"] + list(FU_COLS) + ["Mixta"])
+    for i in range(30):
+        fu = [None if (i + j) % 6 == 0 else (i + j) % 5 for j in range(len(FU_COLS))]
+        ws.append([float(1000 + i), "Derecho" if i % 2 else " xyz", f"2026-01-{i % 28 + 1:02d}"]
+                  + fu + [[1, "a", True][i % 3]])
+    wb.save(path)
+
+
+def _config(cfg, tmp_path, formato):
+    entrada = tmp_path / "in.xlsx"
+    _libro(entrada)
+    return cfg(entrada, tmp_path / formato, fu_validate=True, fu_drop_mode="threshold", min_non_missing_fu=14,
+               formato_salida=formato)
+
+
+@pytest.mark.parametrize("formato", ["parquet", "feather"])
+def test_bundle_columnar_preserva_dtypes(tmp_path, cfg, formato):
+    pytest.importorskip("pyarrow")
+    config = _config(cfg, tmp_path, formato)
+    df = run(config)
+
+    archivos = {p.stem for p in config.output_path.iterdir()}
+    assert {"DATA", "REPORTE_FU_CAST", "REPORTE_FU_DROPEADAS", "REPORTE_FECHAS"} <= archivos
+
+    leer = pd.read_parquet if formato == "parquet" else pd.read_feather
+    data = leer(config.output_path / f"DATA.{formato}")
+    assert len(data) == len(df)
+    assert pd.api.types.is_string_dtype(data["ID"]) and data["ID"].str.fullmatch(r"\d+").all()
+    assert all(data[c].dtype == "float64" for c in FU_COLS)
+    # columna object mezclada -> texto
+    assert pd.api.types.is_string_dtype(data["MIXTA"]) and "a" in set(data["MIXTA"])
+
+
+def test_csv_por_bloques_igual_a_en_memoria(tmp_path, cfg):
+    config = _config(cfg, tmp_path, "csv")
+    run(config)
+    run_por_bloques(replace(config, output_path=tmp_path / "csv_bloques", filas_por_bloque=7))
+
+    for path in config.output_path.iterdir():
+        assert (tmp_path / "csv_bloques" / path.name).read_text() == path.read_text(), path.name
+
+
+def test_por_bloques_rechaza_parquet(tmp_path, cfg):
+    config = _config(cfg, tmp_path, "parquet")
+    with pytest.raises(ConfigError):
+        run_por_bloques(replace(config, filas_por_bloque=10))
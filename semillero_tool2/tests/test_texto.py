@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from semillero_tool.text_clean import limpiar_texto
+
+
+def test_limpiar_texto_strip_sentinelas_y_na():
+    df = pd.DataFrame({
+        "OBJ": [" a ", None, "nan", " nan ", 5, "b"],
+        "TXT": pd.Series([" x", None, "None", "y ", "", "z"], dtype="str"),
+        "NUM": [1.5, np.nan, 2.0, 3.0, 4.0, 5.0],
+    })
+
+    out, rep = limpiar_texto(df)
+
+    assert out["OBJ"].tolist()[0] == "a"
+    assert out["OBJ"][1] is None                 # NA original intacto
+    assert out["OBJ"][2] is pd.NA                # sentinela -> NA
+    assert out["OBJ"][3] == "nan"                # sentinela se evalúa antes del strip
+    assert out["OBJ"][4] == "5"
+    assert out["TXT"].isna().tolist() == [False, True, True, False, False, False]
+    assert out["TXT"].dtype == df["TXT"].dtype
+    assert out["NUM"].equals(df["NUM"])
+
+    assert dict(zip(rep["COLUMNA"], rep["N_STRIP_CAMBIOS"])) == {"OBJ": 2, "TXT": 2}